@@ -0,0 +1,103 @@
+"""기존 테이블 스키마 보강 (idempotent).
+
+Base.metadata.create_all은 없는 테이블만 만들고 기존 테이블은 바꾸지 않는다.
+이후 모델에 추가된 컬럼/인덱스는 여기서 존재 여부를 확인한 뒤 추가한다.
+서버 시작 시 create_all 다음에 실행되며, 배포 전에 직접 실행할 수도 있다.
+
+    cd backend && python -m app.db.migrations
+"""
+
+import asyncio
+import logging
+from typing import List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+from app.db.base import Base
+from app.models.appointment_model import CALENDAR_SYNC_PARTICIPANT
+
+LOGGER = logging.getLogger(__name__)
+
+# (테이블, 컬럼, ADD COLUMN 정의)
+COLUMN_UPGRADES: List[Tuple[str, str, str]] = [
+    # 약속 버전 (ETag 기준)
+    ("appointments", "version", "INTEGER NOT NULL DEFAULT 1"),
+    # 확정 시 캘린더 반영 방식 / organizer 모드 이벤트 ID
+    (
+        "appointments",
+        "calendar_sync_mode",
+        f"VARCHAR(20) NOT NULL DEFAULT '{CALENDAR_SYNC_PARTICIPANT}'",
+    ),
+    ("appointments", "google_event_id", "VARCHAR(255) NULL"),
+]
+
+INDEX_UPGRADES: List[Tuple[str, str]] = [
+    ("appointments", "ix_appointments_google_event_id"),
+]
+
+# 컬럼 추가 전에 만들어진 약속은 모두 참여자별 이벤트 사본(participations.
+# google_event_id)으로 동기화됐으므로 participant 모드로 맞춘다.
+BACKFILLS: List[str] = [
+    "UPDATE appointments SET calendar_sync_mode = :mode "
+    "WHERE calendar_sync_mode IS NULL OR calendar_sync_mode = ''",
+]
+
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return column in {item["name"] for item in inspect(conn).get_columns(table)}
+
+
+def _has_index(conn: Connection, table: str, name: str) -> bool:
+    return name in {item["name"] for item in inspect(conn).get_indexes(table)}
+
+
+def upgrade_schema(conn: Connection) -> List[str]:
+    """빠진 컬럼/인덱스를 추가하고 적용한 항목 이름을 반환한다."""
+    applied = []
+    for table, column, definition in COLUMN_UPGRADES:
+        if _has_column(conn, table, column):
+            continue
+        try:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+        except DBAPIError:
+            # 다른 워커가 동시에 추가한 경우
+            if not _has_column(conn, table, column):
+                raise
+            continue
+        applied.append(f"{table}.{column}")
+
+    for table, name in INDEX_UPGRADES:
+        if _has_index(conn, table, name):
+            continue
+        index = next(
+            item for item in Base.metadata.tables[table].indexes if item.name == name
+        )
+        try:
+            index.create(conn)
+        except DBAPIError:
+            if not _has_index(conn, table, name):
+                raise
+            continue
+        applied.append(name)
+
+    for statement in BACKFILLS:
+        conn.execute(text(statement), {"mode": CALENDAR_SYNC_PARTICIPANT})
+
+    if applied:
+        LOGGER.info("Applied schema upgrades: %s", ", ".join(applied))
+    return applied
+
+
+async def _main() -> None:
+    from app.db.session import engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
@@ -1,10 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.variable import SQLALCHEMY_DATABASE_URL_USER
+from app.variable import DB_MAX_OVERFLOW, DB_POOL_SIZE, SQLALCHEMY_DATABASE_URL_USER
+
+
+def _engine_options(url: str) -> dict:
+    options = {"pool_recycle": 3600, "pool_pre_ping": True}
+    # sqlite(테스트용)는 풀 크기 옵션을 지원하지 않는다
+    if not (url or "").startswith("sqlite"):
+        options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+    return options
 
 
 engine = create_async_engine(
-    SQLALCHEMY_DATABASE_URL_USER, pool_recycle=3600, pool_pre_ping=True
+    SQLALCHEMY_DATABASE_URL_USER, **_engine_options(SQLALCHEMY_DATABASE_URL_USER)
 )
 
 AsyncSessionLocal = sessionmaker(
@@ -4,10 +4,28 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.db.base import Base
+from app.db.migrations import upgrade_schema
 from app.db.session import engine
-from app.routes import calendar_route, user_route, appointment_route
+from app.routes import (
+    admin_route,
+    appointment_route,
+    calendar_route,
+    health_route,
+    user_route,
+)
+from app.services.appointment_event_hub import AppointmentEventHub
+from app.services.calendar_watch_service import CalendarWatchService
 from app.services.google_calendar_service import GoogleCalendarService
-from app.variable import FRONTEND_URL
+from app.services.resync_scheduler import ResyncScheduler
+from app.utils.cpu_offload import CpuOffload
+from app.utils.google_quota import GoogleQuotaScheduler
+from app.utils.loop_monitor import LoopMonitor
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.query_stats import QueryStatsMiddleware, install_query_instrumentation
+from app.utils.rate_limit import TokenBucketLimiter
+from app.utils.tracing import Tracer, TracingMiddleware
+from app.utils.responses import FastJSONResponse
+from app.variable import ADMIN_TOKEN, FRONTEND_URL, PROFILING_SAMPLE_RATE
 
 
 def _resolve_allowed_origins(frontend_url: str) -> list[str]:
@@ -22,7 +40,7 @@ def _resolve_allowed_origins(frontend_url: str) -> list[str]:
     return [frontend_url]
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,18 +50,49 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type"],
 )
 
+# 요청별 쿼리 수·DB 시간 집계 및 느린 쿼리 로그
+install_query_instrumentation()
+app.add_middleware(QueryStatsMiddleware)
+
+# 프로파일링이 꺼져 있으면 미들웨어 자체를 등록하지 않는다
+if ADMIN_TOKEN or PROFILING_SAMPLE_RATE > 0:
+    app.add_middleware(ProfilingMiddleware)
+
+# 가장 바깥에서 요청 루트 스팬 생성 (TRACING_EXPORTER=none이면 바로 통과)
+app.add_middleware(TracingMiddleware)
+
 
 @app.on_event("startup")
 async def startup():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all은 기존 테이블에 컬럼을 추가하지 않는다
+        await conn.run_sync(upgrade_schema)
+    await Tracer.start()
+    await LoopMonitor.start()
+    await AppointmentEventHub.start()
+    await TokenBucketLimiter.start()
+    await CalendarWatchService.start()
+    await ResyncScheduler.start()
 
 
 @app.on_event("shutdown")
 async def shutdown():
+    await ResyncScheduler.stop()
+    await CalendarWatchService.stop()
+    await AppointmentEventHub.stop()
+    await GoogleQuotaScheduler.stop()
+    await TokenBucketLimiter.stop()
+    await CpuOffload.stop()
     await GoogleCalendarService.close_client()
+    await LoopMonitor.stop()
+    await Tracer.stop()
+    # 워커 종료 시 커넥션 풀 정리
+    await engine.dispose()
 
 
+app.include_router(health_route.router, tags=["health"])
 app.include_router(user_route.router, tags=["user"])
 app.include_router(calendar_route.router, tags=["calendar"])
 app.include_router(appointment_route.router, tags=["appointment"])
+app.include_router(admin_route.router, tags=["admin"])
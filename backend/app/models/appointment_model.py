@@ -9,10 +9,17 @@ from sqlalchemy import (
     ForeignKey,
     UniqueConstraint,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.db.base import Base
 from datetime import datetime
 
+# 확정 시 Google 캘린더 반영 방식
+# participant: 참여자마다 각자 캘린더에 이벤트 생성
+# organizer: 생성자 캘린더에 이벤트 하나를 만들고 참여자를 attendees로 초대
+CALENDAR_SYNC_PARTICIPANT = "participant"
+CALENDAR_SYNC_ORGANIZER = "organizer"
+CALENDAR_SYNC_MODES = (CALENDAR_SYNC_PARTICIPANT, CALENDAR_SYNC_ORGANIZER)
+
 
 class Appointments(Base):
     __tablename__ = "appointments"
@@ -28,6 +35,16 @@ class Appointments(Base):
     confirmed_end_time = Column(String(5), nullable=True)
     confirmed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.now)
+    # 참여/동기화/확정 시 증가하는 버전 (ETag 등 캐시 무효화 기준)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    calendar_sync_mode = Column(
+        String(20),
+        nullable=False,
+        default=CALENDAR_SYNC_PARTICIPANT,
+        server_default=CALENDAR_SYNC_PARTICIPANT,
+    )
+    # organizer 모드에서 생성자 캘린더에 만든 이벤트 ID
+    google_event_id = Column(String(255), nullable=True, index=True)
 
     appointment_dates = relationship(
         "AppointmentDates", back_populates="appointment", cascade="all, delete-orphan"
@@ -61,10 +78,12 @@ class Participations(Base):
     status = Column(
         Enum("ATTENDING", "NOT_ATTENDING", "MAYBE"), nullable=False, default="ATTENDING"
     )
-    available_slots = Column(TEXT)
+    # 큰 TEXT 컬럼은 기본으로 로드하지 않고 필요한 쿼리에서 undefer()로 지정한다.
+    # 지정하지 않고 읽으면 (비동기 세션의 숨은 지연 로드 대신) 바로 예외가 난다.
+    available_slots = deferred(Column(TEXT), raiseload=True)
     google_event_id = Column(String(255), nullable=True)
     calendar_sync_status = Column(String(20), nullable=True)
-    calendar_sync_error = Column(TEXT, nullable=True)
+    calendar_sync_error = deferred(Column(TEXT, nullable=True), raiseload=True)
     calendar_synced_at = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime
+from app.db.base import Base
+from datetime import datetime
+
+
+class CalendarWatchChannels(Base):
+    __tablename__ = "calendar_watch_channels"
+
+    # Google events.watch 채널 (사용자당 하나, 만료 전에 새 채널로 교체)
+    channel_id = Column(String(64), primary_key=True)
+    user_id = Column(String(255), nullable=False, index=True)
+    resource_id = Column(String(255), nullable=False)
+    token = Column(String(64), nullable=False)
+    expiration = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
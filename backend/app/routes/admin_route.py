@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.services.availability_cache import AvailabilityCache
+from app.services.google_calendar_service import GoogleCalendarService
+from app.utils.auth import require_admin
+from app.utils.cpu_offload import CpuOffload
+from app.utils.loop_monitor import LoopMonitor
+from app.utils.google_quota import GoogleQuotaScheduler
+from app.utils.profiling import list_profiles
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles")
+async def get_recent_profiles(limit: int = Query(default=20, ge=1, le=100)):
+    # 최근 저장된 요청 프로파일 (최신순)
+    return {"profiles": list_profiles(limit)}
+
+
+@router.get("/google")
+async def get_google_client_stats():
+    # 이 워커의 Google 할당량 대기열, 서킷 브레이커, 커넥션 풀 상태
+    return {
+        "quota": GoogleQuotaScheduler.stats(),
+        "breakers": GoogleCalendarService.breaker_states(),
+        "pool": GoogleCalendarService.pool_stats(),
+    }
+
+
+@router.get("/availability-cache")
+async def get_availability_cache_stats():
+    # 이 워커의 파싱된 가용 시간 캐시 크기·적중률·제거 수
+    return AvailabilityCache.stats()
+
+
+@router.get("/cpu-offload")
+async def get_cpu_offload_stats():
+    # 이 워커의 가용 시간 계산 실행기 사용 횟수·대기 시간
+    return CpuOffload.stats()
+
+
+@router.get("/event-loop")
+async def get_event_loop_stats():
+    # 이 워커의 이벤트 루프 지연 히스토그램, 멈춤 시 스택, 블로킹 I/O 호출 수
+    return LoopMonitor.stats()
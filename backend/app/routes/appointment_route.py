@@ -1,11 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select
 
 from app.db.session import get_db
 from app.models.appointment_model import Participations
+from app.services.appointment_event_hub import (
+    AppointmentEventHub,
+    TooManySubscribersError,
+    format_sse,
+)
 from app.services.appointment_service import AppointmentService
+from app.services.calendar_watch_service import CalendarWatchService
+from app.services.schedule_analyzer import ScheduleAnalyzer
 from app.schema.appointment_schema import (
     AppointmentCreateRequest,
     AppointmentResponse,
@@ -17,9 +37,21 @@ from app.schema.appointment_schema import (
     SyncMySchedulesResponse,
     ConfirmAppointmentRequest,
     ConfirmAppointmentResponse,
+    CalendarSyncModeRequest,
     CalendarSyncStatusResponse,
 )
-from app.utils.jwt import get_current_user
+from app.utils.etag import (
+    PRIVATE_CACHE_CONTROL,
+    PUBLIC_CACHE_CONTROL,
+    build_etag,
+    cache_headers,
+    etag_matches,
+    not_modified_response,
+)
+from app.utils.auth import AuthContext, get_auth_context
+from app.utils.rate_limit import RateLimit
+from app.utils.responses import adapter_json_response, model_json_response
+from app.variable import EVENTS_HEARTBEAT_SECONDS
 
 security = HTTPBearer()
 
@@ -37,6 +69,9 @@ REAUTH_ERROR_CODES = {
 SYNC_SUCCESS_STATUSES = {"success"}
 SYNC_SKIPPED_STATUSES = {"skipped"}
 
+# 목록 응답은 ORM 객체에서 바로 검증/직렬화
+_APPOINTMENT_LIST_ADAPTER = TypeAdapter(list[AppointmentListResponse])
+
 
 def _summarize_calendar_sync(participations):
     summary = {"total": 0, "success": 0, "failed": 0, "skipped": 0, "pending": 0}
@@ -71,13 +106,16 @@ def _build_calendar_sync_response(appointment, participations, is_creator):
         }
         for participation in participations
     ]
-    return CalendarSyncStatusResponse(
-        appointment_id=appointment.id,
-        invite_link=appointment.invite_link,
-        is_creator=is_creator,
-        summary=summary,
-        participants=participants_payload,
-        reauth_url=CALENDAR_REAUTH_URL,
+    return model_json_response(
+        CalendarSyncStatusResponse(
+            appointment_id=appointment.id,
+            invite_link=appointment.invite_link,
+            is_creator=is_creator,
+            calendar_sync_mode=appointment.calendar_sync_mode or "participant",
+            summary=summary,
+            participants=participants_payload,
+            reauth_url=CALENDAR_REAUTH_URL,
+        )
     )
 
 
@@ -85,12 +123,15 @@ def _build_calendar_sync_response(appointment, participations, is_creator):
 async def create_appointment(
     request: AppointmentCreateRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     # 약속 생성
     try:
         appointment = await AppointmentService.create_appointment(
-            request=request, creator_id=current_user["sub"], db=db
+            request=request,
+            creator_id=auth.user_id,
+            db=db,
+            user=await auth.get_user(),
         )
 
         appointment_dates = await AppointmentService.get_appointment_dates(
@@ -113,22 +154,20 @@ async def create_appointment(
 
 @router.get("/", response_model=list[AppointmentListResponse])
 async def get_my_appointments(
-    db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db), auth: AuthContext = Depends(get_auth_context)
 ):
     # 내 약속 목록 조회
     try:
         appointments = await AppointmentService.get_my_appointments(
-            user_id=current_user["sub"], db=db
+            user_id=auth.user_id, db=db
         )
 
-        return [
-            AppointmentListResponse(
-                id=appointment.id,
-                name=appointment.name,
-                invite_link=appointment.invite_link,
-            )
-            for appointment in appointments
-        ]
+        return adapter_json_response(
+            _APPOINTMENT_LIST_ADAPTER,
+            _APPOINTMENT_LIST_ADAPTER.validate_python(
+                appointments, from_attributes=True
+            ),
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"약속 목록 조회 실패: {str(e)}")
@@ -136,7 +175,10 @@ async def get_my_appointments(
 
 @router.get("/{invite_code}", response_model=AppointmentResponse)
 async def get_appointment_by_invite_code(
-    invite_code: str, db: AsyncSession = Depends(get_db)
+    invite_code: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
 ):
     # 초대 코드로 약속 조회
     appointment = await AppointmentService.get_appointment_by_invite_code(
@@ -146,6 +188,11 @@ async def get_appointment_by_invite_code(
     if not appointment:
         raise HTTPException(status_code=404, detail="존재하지 않는 약속입니다")
 
+    etag = build_etag("appointment", appointment.id, appointment.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, PUBLIC_CACHE_CONTROL)
+    response.headers.update(cache_headers(etag, PUBLIC_CACHE_CONTROL))
+
     appointment_dates = await AppointmentService.get_appointment_dates(
         appointment.id, db
     )
@@ -162,11 +209,28 @@ async def get_appointment_by_invite_code(
 
 
 @router.get("/{invite_code}/detail", response_model=AppointmentDetailResponse)
-async def get_appointment_detail(invite_code: str, db: AsyncSession = Depends(get_db)):
+async def get_appointment_detail(
+    invite_code: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+):
     # 약쇽 세부 조회
+    appointment = await AppointmentService.get_appointment_by_invite_code(
+        invite_code, db
+    )
+    if not appointment:
+        raise HTTPException(status_code=404, detail="존재하지 않는 약속입니다")
+
+    # 변경이 없으면 가용성 집계 전에 304 반환
+    etag = build_etag("detail", appointment.id, appointment.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, PUBLIC_CACHE_CONTROL)
+    response.headers.update(cache_headers(etag, PUBLIC_CACHE_CONTROL))
+
     try:
         detail = await AppointmentService.get_appointment_detail_with_availability(
-            invite_code, db
+            invite_code, db, appointment=appointment
         )
         return detail
     except ValueError as e:
@@ -175,23 +239,94 @@ async def get_appointment_detail(invite_code: str, db: AsyncSession = Depends(ge
         raise HTTPException(status_code=500, detail=f"약속 조회 실패: {str(e)}")
 
 
+async def _appointment_event_stream(request: Request, invite_code: str, version: int):
+    # 구독은 본문을 실제로 보내기 시작할 때 한다. 응답 전에 연결이 끊기면
+    # 제너레이터가 실행되지 않아 finally도 돌지 않으므로 자리를 잡지 않는다
+    try:
+        subscription = AppointmentEventHub.subscribe(invite_code)
+    except TooManySubscribersError:
+        yield format_sse({"type": "too_many_subscribers"})
+        return
+
+    # 연결 직후 현재 버전을 알리고, 이벤트가 없으면 주기적으로 heartbeat 전송
+    try:
+        yield "retry: 3000\n\n"
+        yield format_sse({"type": "ready", "version": version})
+        while True:
+            if await request.is_disconnected():
+                break
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=EVENTS_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            yield format_sse(event)
+            if event.get("type") == "deleted":
+                break
+    finally:
+        AppointmentEventHub.unsubscribe(subscription)
+
+
+@router.get("/{invite_code}/events")
+async def stream_appointment_events(
+    invite_code: str, request: Request, db: AsyncSession = Depends(get_db)
+):
+    # 참여/재동기화/확정 변경분을 Server-Sent Events로 전달
+    appointment = await AppointmentService.get_appointment_by_invite_code(
+        invite_code, db
+    )
+    if not appointment:
+        raise HTTPException(status_code=404, detail="존재하지 않는 약속입니다")
+
+    if not AppointmentEventHub.has_capacity(invite_code):
+        raise HTTPException(
+            status_code=503,
+            detail="too_many_subscribers",
+            headers={"Retry-After": str(int(EVENTS_HEARTBEAT_SECONDS))},
+        )
+
+    # 스트림이 열려 있는 동안 DB 커넥션을 붙잡지 않도록 미리 반환
+    await db.close()
+
+    return StreamingResponse(
+        _appointment_event_stream(request, invite_code, appointment.version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/join", response_model=ParticipationResponse)
 async def join_appointment(
     request: JoinAppointmentRequest,
+    background_tasks: BackgroundTasks,
+    include_slots: bool = False,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     # 초대 코드로 약속 참여
     try:
         participation = await AppointmentService.join_appointment(
-            invite_code=request.invite_code, user_id=current_user["sub"], db=db
+            invite_code=request.invite_code,
+            user_id=auth.user_id,
+            db=db,
+            user=await auth.get_user(),
         )
 
+        # 캘린더 변경 푸시 알림 채널은 응답 후 등록
+        if CalendarWatchService.is_enabled():
+            background_tasks.add_task(
+                CalendarWatchService.ensure_watch_for_user, auth.user_id
+            )
+
         return ParticipationResponse(
             id=participation.id,
             user_id=participation.user_id,
             appointment_id=participation.appointment_id,
             status=participation.status,
+            # 클라이언트가 요청한 경우에만 가용 시간 전개
+            available_slots=(participation.available_slots if include_slots else None),
         )
 
     except ValueError as e:
@@ -204,12 +339,12 @@ async def join_appointment(
 async def delete_appointment(
     invite_code: str,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     # 약속 삭제
     try:
         await AppointmentService.delete_appointment(
-            invite_code=invite_code, user_id=current_user["sub"], db=db
+            invite_code=invite_code, user_id=auth.user_id, db=db
         )
         return {"message": "약속이 삭제되었습니다"}
     except ValueError as e:
@@ -224,8 +359,12 @@ async def get_optimal_times(
     min_duration_minutes: int = 60,
     time_range_start: str = None,
     time_range_end: str = None,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    cursor: str | None = None,
+    include_participant_ids: bool = True,
+    if_none_match: str | None = Header(default=None),
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     # 약속 조회
     appointment = await AppointmentService.get_appointment_by_invite_code(
@@ -235,20 +374,49 @@ async def get_optimal_times(
         raise HTTPException(status_code=404, detail="약속을 찾을 수 없습니다")
 
     participation = await AppointmentService._get_participation(
-        current_user["sub"], appointment.id, db
+        auth.user_id, appointment.id, db
     )
     if not participation:
         raise HTTPException(status_code=403, detail="참여자만 조회할 수 있습니다")
 
-    # 최적 시간 계산
+    if cursor is not None:
+        try:
+            ScheduleAnalyzer.decode_slot_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="invalid_cursor")
+
+    # 변경이 없으면 최적 시간 계산 전에 304 반환
+    etag = build_etag(
+        "optimal-times",
+        appointment.id,
+        appointment.version,
+        min_duration_minutes,
+        time_range_start,
+        time_range_end,
+        limit,
+        cursor,
+        include_participant_ids,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, PRIVATE_CACHE_CONTROL)
+
+    # 최적 시간 계산 (다음 페이지 존재 여부 확인을 위해 limit + 1개 선택)
     optimal_times = await AppointmentService.calculate_optimal_times(
         appointment.id,
         min_duration_minutes,
         db,
         time_range_start=time_range_start,
         time_range_end=time_range_end,
+        version=appointment.version,
+        limit=limit + 1 if limit else None,
+        cursor=cursor,
     )
 
+    next_cursor = None
+    if limit and len(optimal_times) > limit:
+        optimal_times = optimal_times[:limit]
+        next_cursor = ScheduleAnalyzer.encode_slot_cursor(optimal_times[-1])
+
     # 전체 참여자 수
     total_result = await db.execute(
         select(func.count(Participations.id)).where(
@@ -273,29 +441,44 @@ async def get_optimal_times(
     else:
         calculation_status = "complete"
 
-    return OptimalTimesResponse(
-        appointment_id=appointment.id,
-        appointment_name=appointment.name,
-        total_participants=total_participants,
-        optimal_times=optimal_times,
-        calculation_status=calculation_status,
+    return model_json_response(
+        OptimalTimesResponse(
+            appointment_id=appointment.id,
+            appointment_name=appointment.name,
+            total_participants=total_participants,
+            optimal_times=optimal_times,
+            calculation_status=calculation_status,
+            next_cursor=next_cursor,
+        ),
+        headers=cache_headers(etag, PRIVATE_CACHE_CONTROL),
+        # 요약 모드에서는 참여자 ID 목록을 응답에서 제외
+        exclude=(
+            None
+            if include_participant_ids
+            else {"optimal_times": {"__all__": {"participant_ids"}}}
+        ),
     )
 
 
-@router.post("/sync-my-schedules", response_model=SyncMySchedulesResponse)
+@router.post(
+    "/sync-my-schedules",
+    response_model=SyncMySchedulesResponse,
+    dependencies=[Depends(RateLimit("sync-my-schedules", cost=5))],
+)
 async def sync_my_schedules(
-    db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db), auth: AuthContext = Depends(get_auth_context)
 ):
     # 내가 참여한 모든 약속의 일정 동기화
     try:
         result = await AppointmentService.sync_my_schedules(
-            user_id=current_user["sub"], db=db
+            user_id=auth.user_id, db=db, user=await auth.get_user()
         )
 
         return SyncMySchedulesResponse(
             total_appointments=result["total_appointments"],
             updated_count=result["updated_count"],
             failed_count=result["failed_count"],
+            stale_count=result.get("stale_count", 0),
         )
 
     except ValueError as e:
@@ -308,7 +491,7 @@ async def sync_my_schedules(
 async def get_calendar_sync_status(
     invite_code: str,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     appointment = await AppointmentService.get_appointment_by_invite_code(
         invite_code, db
@@ -317,32 +500,38 @@ async def get_calendar_sync_status(
         raise HTTPException(status_code=404, detail="appointment_not_found")
 
     participation = await AppointmentService._get_participation(
-        current_user["sub"], appointment.id, db
+        auth.user_id, appointment.id, db, Participations.calendar_sync_error
     )
     if not participation:
         raise HTTPException(status_code=403, detail="not_participant")
 
-    is_creator = appointment.creator_id == current_user["sub"]
+    is_creator = appointment.creator_id == auth.user_id
 
     if is_creator:
-        result = await db.execute(
-            select(Participations).where(
-                Participations.appointment_id == appointment.id
-            )
+        participations = await AppointmentService._get_participations(
+            appointment.id, db, Participations.calendar_sync_error
         )
-        participations = result.scalars().all()
     else:
         participations = [participation]
 
     return _build_calendar_sync_response(appointment, participations, is_creator)
 
 
-@router.post("/{invite_code}/calendar-sync", response_model=CalendarSyncStatusResponse)
+def _calendar_sync_cost(request: Request) -> int:
+    # 전체 재시도는 참여자 수만큼 Google 호출이 발생하므로 비용을 크게 잡는다
+    return 5 if request.query_params.get("scope", "me").lower() == "all" else 2
+
+
+@router.post(
+    "/{invite_code}/calendar-sync",
+    response_model=CalendarSyncStatusResponse,
+    dependencies=[Depends(RateLimit("calendar-sync", cost=_calendar_sync_cost))],
+)
 async def retry_calendar_sync(
     invite_code: str,
     scope: str = "me",
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     appointment = await AppointmentService.get_appointment_by_invite_code(
         invite_code, db
@@ -353,7 +542,7 @@ async def retry_calendar_sync(
         raise HTTPException(status_code=400, detail="appointment_not_confirmed")
 
     participation = await AppointmentService._get_participation(
-        current_user["sub"], appointment.id, db
+        auth.user_id, appointment.id, db, Participations.calendar_sync_error
     )
     if not participation:
         raise HTTPException(status_code=403, detail="not_participant")
@@ -362,34 +551,66 @@ async def retry_calendar_sync(
     if scope_value not in {"me", "all"}:
         raise HTTPException(status_code=400, detail="invalid_scope")
 
-    is_creator = appointment.creator_id == current_user["sub"]
+    is_creator = appointment.creator_id == auth.user_id
     if scope_value == "all" and not is_creator:
         raise HTTPException(status_code=403, detail="creator_only")
 
     if scope_value == "all":
-        result = await db.execute(
-            select(Participations).where(
-                Participations.appointment_id == appointment.id
-            )
+        participations = await AppointmentService._get_participations(
+            appointment.id, db, Participations.calendar_sync_error
         )
-        participations = result.scalars().all()
     else:
         participations = [participation]
 
     try:
-        await AppointmentService.retry_calendar_sync(appointment, participations, db)
+        await AppointmentService.retry_calendar_sync(
+            appointment, participations, db, user_id=auth.user_id
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
     return _build_calendar_sync_response(appointment, participations, is_creator)
 
 
+@router.put(
+    "/{invite_code}/calendar-sync/mode",
+    response_model=CalendarSyncStatusResponse,
+    dependencies=[Depends(RateLimit("calendar-sync", cost=5))],
+)
+async def change_calendar_sync_mode(
+    invite_code: str,
+    request: CalendarSyncModeRequest,
+    db: AsyncSession = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    # 캘린더 반영 방식 변경 (확정된 약속이면 기존 이벤트도 새 방식으로 이전)
+    appointment = await AppointmentService.get_appointment_by_invite_code(
+        invite_code, db
+    )
+    if not appointment:
+        raise HTTPException(status_code=404, detail="appointment_not_found")
+
+    try:
+        appointment = await AppointmentService.change_calendar_sync_mode(
+            appointment, request.mode, db, user_id=auth.user_id
+        )
+    except PermissionError:
+        raise HTTPException(status_code=403, detail="creator_only")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    participations = await AppointmentService._get_participations(
+        appointment.id, db, Participations.calendar_sync_error
+    )
+    return _build_calendar_sync_response(appointment, participations, is_creator=True)
+
+
 @router.post("/{invite_code}/confirm", response_model=ConfirmAppointmentResponse)
 async def confirm_appointment(
     invite_code: str,
     request: ConfirmAppointmentRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    auth: AuthContext = Depends(get_auth_context),
 ):
     # 약속 확정
     try:
@@ -398,7 +619,7 @@ async def confirm_appointment(
             confirmed_date=request.confirmed_date,
             confirmed_start_time=request.confirmed_start_time,
             confirmed_end_time=request.confirmed_end_time,
-            user_id=current_user["sub"],
+            user_id=auth.user_id,
             db=db,
         )
 
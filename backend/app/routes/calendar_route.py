@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from fastapi.responses import JSONResponse
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -15,35 +14,58 @@ from app.schema.calendar_schema import (
     EventCreateResponse,
     EventUpdateRequest,
 )
+from app.services.appointment_service import AppointmentService
+from app.services.calendar_watch_service import CalendarWatchService
 from app.services.google_calendar_service import GoogleCalendarService
 from app.services.user_service import UserService
-from app.utils.jwt import verify_token
-
-security = HTTPBearer(auto_error=False)
+from app.utils.auth import AuthContext, get_auth_context
+from app.utils.google_quota import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    GoogleQuotaScheduler,
+)
+from app.utils.rate_limit import RateLimit
 
 router = APIRouter(prefix="/calendar")
 
 REAUTH_URL = "/user/google/login?force=1"
 
 
-@router.get("/events")
+def _participant_quota(participant_user, user_id: str):
+    # 요청자 본인 사본은 대화형, 다른 참여자 사본은 백그라운드 할당량으로 처리
+    return GoogleQuotaScheduler.context(
+        user_id=participant_user.user_id,
+        priority=(
+            PRIORITY_INTERACTIVE
+            if str(participant_user.user_id) == str(user_id)
+            else PRIORITY_BACKGROUND
+        ),
+    )
+
+
+async def _find_participant_copy_appointment(event_id: str, db: AsyncSession):
+    # participant 모드: 참여자 캘린더의 이벤트 사본으로 약속 조회
+    participation_result = await db.execute(
+        select(Participations).where(Participations.google_event_id == event_id)
+    )
+    participation = participation_result.scalar_one_or_none()
+    if not participation:
+        return None
+    appointment_result = await db.execute(
+        select(Appointments).where(Appointments.id == participation.appointment_id)
+    )
+    return appointment_result.scalar_one_or_none()
+
+
+@router.get("/events", dependencies=[Depends(RateLimit("calendar-events"))])
 async def list_events(
     time_min: str | None = None,
     time_max: str | None = None,
     max_results: int = 50,
     page_token: str | None = None,
-    db: AsyncSession = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    if credentials is None or not credentials.credentials:
-        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
-
-    payload = verify_token(credentials.credentials)
-    user_id = payload.get("sub") if payload else None
-    if not user_id:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
-
-    user = await UserService.get_user_by_google_id(user_id, db)
+    user = await auth.get_user()
     if not user or not getattr(user, "google_refresh_token", None):
         return JSONResponse(
             status_code=400,
@@ -75,6 +97,7 @@ async def list_events(
             time_max=time_max,
             max_results=max_results,
             page_token=page_token,
+            cache_key=auth.user_id,
         )
     except HTTPException as exc:
         if exc.status_code == 401:
@@ -109,18 +132,9 @@ async def list_events(
 @router.post("/events", response_model=EventCreateResponse)
 async def add_events(
     event_request: EventCreateRequest,
-    db: AsyncSession = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    if credentials is None or not credentials.credentials:
-        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
-
-    payload = verify_token(credentials.credentials)
-    user_id = payload.get("sub") if payload else None
-    if not user_id:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
-
-    user = await UserService.get_user_by_google_id(user_id, db)
+    user = await auth.get_user()
     if not user or not getattr(user, "google_refresh_token", None):
         return JSONResponse(
             status_code=400,
@@ -151,6 +165,7 @@ async def add_events(
         created_event = await GoogleCalendarService.create_event(
             access_token,
             event_data,
+            cache_key=auth.user_id,
         )
     except HTTPException as exc:
         if exc.status_code == 401:
@@ -187,17 +202,10 @@ async def update_event(
     event_id: str,
     event_request: EventUpdateRequest,
     db: AsyncSession = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    if credentials is None or not credentials.credentials:
-        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
-
-    payload = verify_token(credentials.credentials)
-    user_id = payload.get("sub") if payload else None
-    if not user_id:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
-
-    user = await UserService.get_user_by_google_id(user_id, db)
+    user_id = auth.user_id
+    user = await auth.get_user()
     if not user or not getattr(user, "google_refresh_token", None):
         return JSONResponse(
             status_code=400,
@@ -207,16 +215,19 @@ async def update_event(
             },
         )
 
-    participation_result = await db.execute(
-        select(Participations).where(Participations.google_event_id == event_id)
+    # organizer 모드 약속은 생성자 캘린더 이벤트 하나만 수정하면 Google이 참석자에게 전파
+    organizer_appointment = await AppointmentService.get_appointment_by_google_event_id(
+        event_id, db
     )
-    participation = participation_result.scalar_one_or_none()
-    appointment = None
-    if participation:
-        appointment_result = await db.execute(
-            select(Appointments).where(Appointments.id == participation.appointment_id)
+    if organizer_appointment and organizer_appointment.creator_id != user_id:
+        return JSONResponse(
+            status_code=403,
+            content={"code": "creator_only"},
         )
-        appointment = appointment_result.scalar_one_or_none()
+
+    appointment = None
+    if organizer_appointment is None:
+        appointment = await _find_participant_copy_appointment(event_id, db)
 
     if appointment and appointment.status == "CONFIRMED":
         if appointment.creator_id != user_id:
@@ -236,10 +247,12 @@ async def update_event(
         )
         participants = participants_result.scalars().all()
 
+        # 참여자 사용자 정보는 한 번의 쿼리로 조회
+        participant_users = await UserService.get_users_by_google_ids(
+            [str(participant.user_id) for participant in participants], db
+        )
         for participant in participants:
-            participant_user = await UserService.get_user_by_google_id(
-                str(participant.user_id), db
-            )
+            participant_user = participant_users.get(str(participant.user_id))
             if not participant_user or not participant_user.google_refresh_token:
                 participant.calendar_sync_status = "failed_update"
                 participant.calendar_sync_error = "missing_refresh_token"
@@ -247,14 +260,16 @@ async def update_event(
                 continue
 
             try:
-                access_token = await GoogleCalendarService.refresh_access_token(
-                    participant_user.google_refresh_token
-                )
-                updated = await GoogleCalendarService.update_event(
-                    access_token,
-                    participant.google_event_id,
-                    event_data,
-                )
+                with _participant_quota(participant_user, user_id):
+                    access_token = await GoogleCalendarService.refresh_access_token(
+                        participant_user.google_refresh_token
+                    )
+                    updated = await GoogleCalendarService.update_event(
+                        access_token,
+                        participant.google_event_id,
+                        event_data,
+                        cache_key=participant_user.user_id,
+                    )
                 participant.calendar_sync_status = "success"
                 participant.calendar_sync_error = None
                 participant.calendar_synced_at = datetime.now()
@@ -300,6 +315,8 @@ async def update_event(
             access_token,
             event_id,
             event_data,
+            send_updates="all" if organizer_appointment else None,
+            cache_key=auth.user_id,
         )
     except HTTPException as exc:
         if exc.status_code == 401:
@@ -335,6 +352,11 @@ async def update_event(
             )
         raise
 
+    if organizer_appointment is not None:
+        await AppointmentService.mark_organizer_event_result(
+            organizer_appointment, "success", db
+        )
+
     return updated_event
 
 
@@ -342,17 +364,10 @@ async def update_event(
 async def delete_event(
     event_id: str,
     db: AsyncSession = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    if credentials is None or not credentials.credentials:
-        raise HTTPException(status_code=401, detail="인증 토큰이 필요합니다.")
-
-    payload = verify_token(credentials.credentials)
-    user_id = payload.get("sub") if payload else None
-    if not user_id:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
-
-    user = await UserService.get_user_by_google_id(user_id, db)
+    user_id = auth.user_id
+    user = await auth.get_user()
     if not user or not getattr(user, "google_refresh_token", None):
         return JSONResponse(
             status_code=400,
@@ -362,16 +377,18 @@ async def delete_event(
             },
         )
 
-    participation_result = await db.execute(
-        select(Participations).where(Participations.google_event_id == event_id)
+    organizer_appointment = await AppointmentService.get_appointment_by_google_event_id(
+        event_id, db
     )
-    participation = participation_result.scalar_one_or_none()
-    appointment = None
-    if participation:
-        appointment_result = await db.execute(
-            select(Appointments).where(Appointments.id == participation.appointment_id)
+    if organizer_appointment and organizer_appointment.creator_id != user_id:
+        return JSONResponse(
+            status_code=403,
+            content={"code": "creator_only"},
         )
-        appointment = appointment_result.scalar_one_or_none()
+
+    appointment = None
+    if organizer_appointment is None:
+        appointment = await _find_participant_copy_appointment(event_id, db)
 
     if appointment and appointment.status == "CONFIRMED":
         if appointment.creator_id != user_id:
@@ -388,10 +405,12 @@ async def delete_event(
         )
         participants = participants_result.scalars().all()
 
+        # 참여자 사용자 정보는 한 번의 쿼리로 조회
+        participant_users = await UserService.get_users_by_google_ids(
+            [str(participant.user_id) for participant in participants], db
+        )
         for participant in participants:
-            participant_user = await UserService.get_user_by_google_id(
-                str(participant.user_id), db
-            )
+            participant_user = participant_users.get(str(participant.user_id))
             if not participant_user or not participant_user.google_refresh_token:
                 participant.calendar_sync_status = "failed_delete"
                 participant.calendar_sync_error = "missing_refresh_token"
@@ -399,13 +418,15 @@ async def delete_event(
                 continue
 
             try:
-                access_token = await GoogleCalendarService.refresh_access_token(
-                    participant_user.google_refresh_token
-                )
-                await GoogleCalendarService.delete_event(
-                    access_token,
-                    participant.google_event_id,
-                )
+                with _participant_quota(participant_user, user_id):
+                    access_token = await GoogleCalendarService.refresh_access_token(
+                        participant_user.google_refresh_token
+                    )
+                    await GoogleCalendarService.delete_event(
+                        access_token,
+                        participant.google_event_id,
+                        cache_key=participant_user.user_id,
+                    )
                 participant.google_event_id = None
                 participant.calendar_sync_status = "deleted"
                 participant.calendar_sync_error = None
@@ -442,6 +463,8 @@ async def delete_event(
         deleted_event = await GoogleCalendarService.delete_event(
             access_token,
             event_id,
+            send_updates="all" if organizer_appointment else None,
+            cache_key=auth.user_id,
         )
     except HTTPException as exc:
         if exc.status_code == 401:
@@ -477,4 +500,25 @@ async def delete_event(
             )
         raise
 
+    if organizer_appointment is not None:
+        await AppointmentService.mark_organizer_event_result(
+            organizer_appointment, "deleted", db
+        )
+
     return deleted_event
+
+
+@router.post("/webhook", status_code=204)
+async def receive_calendar_notification(
+    x_goog_channel_id: str | None = Header(default=None),
+    x_goog_channel_token: str | None = Header(default=None),
+    x_goog_resource_state: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+):
+    # Google events.watch 푸시 알림 수신: 해당 사용자 가용 시간 재계산만 예약하고 즉시 응답
+    accepted = await CalendarWatchService.handle_notification(
+        x_goog_channel_id, x_goog_channel_token, x_goog_resource_state, db
+    )
+    if not accepted:
+        raise HTTPException(status_code=404, detail="unknown_channel")
+    return Response(status_code=204)
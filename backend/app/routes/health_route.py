@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Response
+
+from app.services.health_service import HealthService
+
+router = APIRouter()
+
+
+@router.get("/healthz")
+async def healthz():
+    # liveness: 이벤트 루프가 요청을 처리하고 있는지만 확인
+    return HealthService.liveness()
+
+
+@router.get("/readyz")
+async def readyz(response: Response):
+    # readiness: 의존성별 상태·지연 시간 (짧게 캐시)
+    result = await HealthService.readiness()
+    if result["status"] == "unavailable":
+        response.status_code = 503
+    response.headers["Cache-Control"] = "no-store"
+    return result
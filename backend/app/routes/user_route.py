@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -27,12 +28,17 @@ async def google_login(force: int | None = None):
 async def google_callback(code: str, db: AsyncSession = Depends(get_db)):
     try:
         # Google OAuth 토큰 교환
-        tokens = GoogleOAuthService.exchange_code_for_tokens(code)
+        # requests 기반 동기 호출은 스레드 풀에서 (이벤트 루프를 막지 않도록)
+        tokens = await run_in_threadpool(
+            GoogleOAuthService.exchange_code_for_tokens, code
+        )
         access_token = tokens["access_token"]
         refresh_token = tokens["refresh_token"]
 
         # 사용자 정보 조회
-        user_info = GoogleOAuthService.get_user_info(access_token)
+        user_info = await run_in_threadpool(
+            GoogleOAuthService.get_user_info, access_token
+        )
         google_id = user_info["google_id"]
         email = user_info["email"]
         name = user_info["name"]
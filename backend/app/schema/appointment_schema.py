@@ -1,13 +1,16 @@
 from pydantic import BaseModel, validator
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import date, datetime
-import json
+
+from app.utils.availability_format import decode_available_slots
 
 
 class AppointmentCreateRequest(BaseModel):
     name: str
     candidate_dates: List[date]
     max_participants: int
+    # 미지정 시 CALENDAR_SYNC_MODE_DEFAULT
+    calendar_sync_mode: Optional[Literal["participant", "organizer"]] = None
 
 
 class AppointmentResponse(BaseModel):
@@ -50,6 +53,8 @@ class AvailableSlotsData(BaseModel):
     timezone: str
     slots: List[AvailableDateSlot]
     calculated_at: datetime
+    # Google 장애로 재계산하지 못해 마지막 값을 유지 중인 경우
+    stale: bool = False
 
 
 class ParticipationResponse(BaseModel):
@@ -61,8 +66,9 @@ class ParticipationResponse(BaseModel):
 
     @validator("available_slots", pre=True)
     def parse_available_slots(cls, v):
-        if v and isinstance(v, str):
-            return json.loads(v)
+        # 저장 포맷(JSON / 비트마스크)과 무관하게 요청 시에만 전개
+        if v and isinstance(v, (str, bytes)):
+            return decode_available_slots(v)
         return v
 
     class Config:
@@ -76,7 +82,7 @@ class OptimalTimeSlot(BaseModel):
     duration_minutes: int
     participant_count: int
     total_participants: int
-    participant_ids: List[int]
+    participant_ids: Optional[List[int]] = None
     availability_percentage: float
 
 
@@ -86,6 +92,7 @@ class OptimalTimesResponse(BaseModel):
     total_participants: int
     optimal_times: List[OptimalTimeSlot]
     calculation_status: str
+    next_cursor: Optional[str] = None
 
 
 class DateAvailability(BaseModel):
@@ -120,6 +127,7 @@ class SyncMySchedulesResponse(BaseModel):
     total_appointments: int
     updated_count: int
     failed_count: int
+    stale_count: int = 0
 
 
 class ConfirmAppointmentRequest(BaseModel):
@@ -170,6 +178,11 @@ class CalendarSyncStatusResponse(BaseModel):
     appointment_id: int
     invite_link: str
     is_creator: bool
+    calendar_sync_mode: str = "participant"
     summary: CalendarSyncSummary
     participants: List[CalendarSyncParticipantStatus]
     reauth_url: str
+
+
+class CalendarSyncModeRequest(BaseModel):
+    mode: Literal["participant", "organizer"]
@@ -0,0 +1,61 @@
+"""운영 서버 진입점.
+
+    cd backend && python -m app.server
+
+워커 수, 이벤트 루프(uvloop), HTTP 파서(httptools), 종료 대기 시간은
+app.variable의 SERVER_* 값으로 조정한다. 각 워커는 별도 프로세스에서 앱을
+import 하므로 DB 엔진과 Google HTTP 클라이언트도 워커마다 따로 만들어지고,
+startup/shutdown 이벤트에서 정리된다.
+"""
+
+import logging
+
+import uvicorn
+
+from app import variable
+
+LOGGER = logging.getLogger(__name__)
+
+APP_PATH = "app.main:app"
+
+
+def build_config() -> dict:
+    workers = max(variable.SERVER_WORKERS, 1)
+    if variable.SERVER_RELOAD:
+        # 리로드 모드는 단일 프로세스에서만 동작
+        workers = 1
+
+    return {
+        "app": APP_PATH,
+        "host": variable.SERVER_HOST,
+        "port": variable.SERVER_PORT,
+        "workers": workers,
+        "reload": variable.SERVER_RELOAD,
+        # "auto"는 uvloop/httptools가 설치돼 있으면 사용하고 없으면 asyncio/h11
+        "loop": variable.SERVER_LOOP,
+        "http": variable.SERVER_HTTP,
+        "timeout_graceful_shutdown": variable.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "timeout_keep_alive": variable.SERVER_KEEPALIVE_SECONDS,
+        "proxy_headers": True,
+        "forwarded_allow_ips": variable.SERVER_FORWARDED_ALLOW_IPS,
+        "log_level": variable.SERVER_LOG_LEVEL,
+    }
+
+
+def main() -> None:
+    config = build_config()
+    if (
+        config["workers"] > 1
+        and variable.RESYNC_SCHEDULER_ENABLED
+        and not variable.RATE_LIMIT_REDIS_URL
+    ):
+        # 리더 선출용 Redis가 없으면 워커 안의 스케줄러는 시작되지 않는다
+        LOGGER.warning(
+            "RESYNC_SCHEDULER_ENABLED needs RATE_LIMIT_REDIS_URL with multiple "
+            "workers; run `python -m app.services.resync_scheduler` separately"
+        )
+    uvicorn.run(**config)
+
+
+if __name__ == "__main__":
+    main()
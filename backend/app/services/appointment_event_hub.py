@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+from app.variable import (
+    EVENTS_MAX_CONNECTIONS_PER_APPOINTMENT,
+    EVENTS_QUEUE_SIZE,
+    EVENTS_REDIS_URL,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TooManySubscribersError(Exception):
+    pass
+
+
+class AppointmentSubscription:
+    # 구독자별 bounded 큐: 소비가 밀리면 쌓인 이벤트를 버리고 resync 한 건만 남긴다
+    def __init__(self, invite_code: str, max_queue_size: int = EVENTS_QUEUE_SIZE):
+        self.invite_code = invite_code
+        self._queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self.dropped_events = 0
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped_events += self._queue.qsize()
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait({"type": "resync"})
+
+    async def get(self) -> Dict[str, Any]:
+        return await self._queue.get()
+
+
+class _RedisEventBackend:
+    # 여러 워커 간 이벤트 공유용 Redis pub/sub
+    CHANNEL_PREFIX = "yakssok:appointment-events:"
+
+    # 재연결 대기 시간: 실패할 때마다 두 배, 최대 RECONNECT_MAX_SECONDS
+    RECONNECT_INITIAL_SECONDS = 0.5
+    RECONNECT_MAX_SECONDS = 30.0
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis_asyncio
+
+        self._redis = redis_asyncio.from_url(url)
+        self._listener: Optional[asyncio.Task] = None
+        self.connected = False
+        self._subscribed_once = False
+        self.reconnects = 0
+        self.last_error: Optional[str] = None
+        self.disconnected_since: Optional[float] = time.monotonic()
+
+    async def publish(self, invite_code: str, event: Dict[str, Any]) -> None:
+        await self._redis.publish(
+            f"{self.CHANNEL_PREFIX}{invite_code}", json.dumps(event, default=str)
+        )
+
+    def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        # 연결이 끊겨도 종료하지 않고 백오프하며 다시 구독한다
+        delay = self.RECONNECT_INITIAL_SECONDS
+        while True:
+            try:
+                await self._listen_once()
+                error = "subscription closed"
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            if self.connected:
+                # 구독까지 성공했던 연결이 끊긴 것이므로 대기 시간을 처음부터
+                delay = self.RECONNECT_INITIAL_SECONDS
+                self.disconnected_since = time.monotonic()
+            self.connected = False
+            self.last_error = error
+            LOGGER.warning(
+                "Redis event listener disconnected (%s); retrying in %.1fs",
+                error,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_SECONDS)
+
+    async def _listen_once(self) -> None:
+        pubsub = self._redis.pubsub()
+        try:
+            await pubsub.psubscribe(f"{self.CHANNEL_PREFIX}*")
+            if self._subscribed_once:
+                # 끊긴 동안 놓친 이벤트가 있을 수 있으니 구독자에게 다시 읽게 한다
+                self.reconnects += 1
+                AppointmentEventHub.dispatch_all_local({"type": "resync"})
+            self._subscribed_once = True
+            self.connected = True
+            self.disconnected_since = None
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                invite_code = channel[len(self.CHANNEL_PREFIX) :]
+                try:
+                    event = json.loads(message["data"])
+                except ValueError:
+                    continue
+                AppointmentEventHub.dispatch_local(invite_code, event)
+        finally:
+            await pubsub.aclose()
+
+    def state(self) -> Dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "reconnects": self.reconnects,
+            "last_error": self.last_error,
+            "disconnected_seconds": (
+                round(time.monotonic() - self.disconnected_since, 3)
+                if self.disconnected_since is not None
+                else None
+            ),
+        }
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+        await self._redis.aclose()
+
+
+class AppointmentEventHub:
+    """약속별 실시간 이벤트 pub/sub.
+
+    기본은 프로세스 내 전달이며, EVENTS_REDIS_URL이 설정되면 Redis를 거쳐
+    모든 워커의 구독자에게 전달한다.
+    """
+
+    _subscribers: Dict[str, Set[AppointmentSubscription]] = {}
+    _backend: Optional[_RedisEventBackend] = None
+    max_connections_per_appointment = EVENTS_MAX_CONNECTIONS_PER_APPOINTMENT
+
+    @classmethod
+    async def start(cls) -> None:
+        if EVENTS_REDIS_URL and cls._backend is None:
+            cls._backend = _RedisEventBackend(EVENTS_REDIS_URL)
+            cls._backend.start()
+
+    @classmethod
+    async def stop(cls) -> None:
+        backend = cls._backend
+        cls._backend = None
+        if backend is not None:
+            await backend.close()
+
+    @classmethod
+    def subscribe(cls, invite_code: str) -> AppointmentSubscription:
+        if not cls.has_capacity(invite_code):
+            raise TooManySubscribersError(invite_code)
+
+        subscription = AppointmentSubscription(invite_code)
+        cls._subscribers.setdefault(invite_code, set()).add(subscription)
+        return subscription
+
+    @classmethod
+    def unsubscribe(cls, subscription: AppointmentSubscription) -> None:
+        subscribers = cls._subscribers.get(subscription.invite_code)
+        if not subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            cls._subscribers.pop(subscription.invite_code, None)
+
+    @classmethod
+    def has_capacity(cls, invite_code: str) -> bool:
+        return cls.subscriber_count(invite_code) < cls.max_connections_per_appointment
+
+    @classmethod
+    def subscriber_count(cls, invite_code: str) -> int:
+        return len(cls._subscribers.get(invite_code, ()))
+
+    @classmethod
+    async def publish(cls, invite_code: str, event: Dict[str, Any]) -> None:
+        # 이벤트 전달 실패가 요청 처리를 깨뜨리지 않도록 예외는 기록만 한다
+        try:
+            if cls._backend is not None:
+                await cls._backend.publish(invite_code, event)
+            else:
+                cls.dispatch_local(invite_code, event)
+        except Exception:
+            LOGGER.exception("Failed to publish appointment event (%s)", invite_code)
+
+    @classmethod
+    def dispatch_all_local(cls, event: Dict[str, Any]) -> None:
+        for invite_code in list(cls._subscribers):
+            cls.dispatch_local(invite_code, event)
+
+    @classmethod
+    def listener_state(cls) -> Optional[Dict[str, Any]]:
+        # Redis를 쓰지 않으면 None (프로세스 내 전달은 끊길 일이 없다)
+        if cls._backend is None:
+            return None
+        return cls._backend.state()
+
+    @classmethod
+    def dispatch_local(cls, invite_code: str, event: Dict[str, Any]) -> None:
+        for subscription in list(cls._subscribers.get(invite_code, ())):
+            subscription.offer(event)
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    # text/event-stream 프레임: event 이름 + 버전을 id로 사용
+    lines = [f"event: {event.get('type', 'message')}"]
+    if event.get("version") is not None:
+        lines.append(f"id: {event['version']}")
+    lines.append(f"data: {json.dumps(event, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
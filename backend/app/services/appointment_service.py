@@ -1,21 +1,58 @@
+import logging
 import secrets
 import string
-import json
+from collections import Counter
 from datetime import datetime
-from typing import List
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import undefer
+from sqlalchemy.orm.attributes import flag_modified
 from fastapi import HTTPException
 
-from app.models.appointment_model import Appointments, AppointmentDates, Participations
+from app.db.session import AsyncSessionLocal
+from app.models.appointment_model import (
+    CALENDAR_SYNC_MODES,
+    CALENDAR_SYNC_ORGANIZER,
+    CALENDAR_SYNC_PARTICIPANT,
+    Appointments,
+    AppointmentDates,
+    Participations,
+)
+from app.models.user_model import User
 from app.schema.appointment_schema import AppointmentCreateRequest
+from app.services.appointment_event_hub import AppointmentEventHub
+from app.services.availability_cache import AvailabilityCache
 from app.services.google_calendar_service import GoogleCalendarService
-from app.services.schedule_analyzer import ScheduleAnalyzer
+from app.services.schedule_analyzer import MaximalBlockIndex, ScheduleAnalyzer
 from app.services.user_service import UserService
-from app.variable import FRONTEND_URL
+from app.utils.cpu_offload import CpuOffload
+from app.utils.google_quota import PRIORITY_BACKGROUND, GoogleQuotaScheduler
+from app.utils.rate_limit import acquire_google_fanout
+from app.utils.single_flight import SingleFlight
+from app.utils.tracing import set_attributes, traced
+from app.variable import (
+    CALENDAR_SYNC_MODE_DEFAULT,
+    FRONTEND_URL,
+    OPTIMAL_TIMES_CACHE_TTL_SECONDS,
+    OPTIMAL_TIMES_INDEX_CACHE_SIZE,
+    OPTIMAL_TIMES_INDEX_TTL_SECONDS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 class AppointmentService:
+    # 동일 조건의 최적 시간 계산 요청 병합 (키에 약속 버전 포함)
+    optimal_times_flight = SingleFlight(ttl_seconds=OPTIMAL_TIMES_CACHE_TTL_SECONDS)
+    optimal_index_flight = SingleFlight(
+        ttl_seconds=OPTIMAL_TIMES_INDEX_TTL_SECONDS,
+        max_entries=OPTIMAL_TIMES_INDEX_CACHE_SIZE,
+    )
+
     @staticmethod
     def generate_invite_code(length: int = 8) -> str:
         # 랜덤 초대 코드 생성
@@ -24,7 +61,10 @@ class AppointmentService:
 
     @staticmethod
     async def create_appointment(
-        request: AppointmentCreateRequest, creator_id: str, db: AsyncSession
+        request: AppointmentCreateRequest,
+        creator_id: str,
+        db: AsyncSession,
+        user: Optional[User] = None,
     ) -> Appointments:
         # 약속 생성 및 후보 날짜 등록
 
@@ -46,6 +86,9 @@ class AppointmentService:
             max_participants=request.max_participants,
             status="VOTING",
             invite_link=invite_code,
+            calendar_sync_mode=AppointmentService._resolve_calendar_sync_mode(
+                request.calendar_sync_mode
+            ),
         )
 
         db.add(appointment)
@@ -68,15 +111,17 @@ class AppointmentService:
 
         # 생성자의 가용 시간 계산
         try:
-            user = await UserService.get_user_by_google_id(str(creator_id), db)
+            # 인증 단계에서 이미 조회한 사용자가 있으면 재사용
+            if user is None:
+                user = await UserService.get_user_by_google_id(str(creator_id), db)
             if user and user.google_refresh_token:
                 available_slots = await ScheduleAnalyzer.calculate_available_slots(
                     user=user, candidate_dates=candidate_dates
                 )
 
                 if available_slots:
-                    creator_participation.available_slots = json.dumps(
-                        available_slots, ensure_ascii=False
+                    creator_participation.available_slots = (
+                        ScheduleAnalyzer.dump_available_slots(available_slots)
                     )
         except Exception:
             pass
@@ -86,6 +131,11 @@ class AppointmentService:
 
         return appointment
 
+    @staticmethod
+    def _resolve_calendar_sync_mode(mode: Optional[str]) -> str:
+        mode = mode or CALENDAR_SYNC_MODE_DEFAULT
+        return mode if mode in CALENDAR_SYNC_MODES else CALENDAR_SYNC_PARTICIPANT
+
     @staticmethod
     async def _is_invite_code_exists(invite_code: str, db: AsyncSession) -> bool:
         # 초대 코드 중복 확인
@@ -104,6 +154,16 @@ class AppointmentService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_appointment_by_google_event_id(
+        event_id: str, db: AsyncSession
+    ) -> Optional[Appointments]:
+        # organizer 모드 이벤트 ID로 약속 조회
+        result = await db.execute(
+            select(Appointments).where(Appointments.google_event_id == event_id)
+        )
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_appointment_dates(
         appointment_id: int, db: AsyncSession
@@ -117,8 +177,44 @@ class AppointmentService:
         return result.scalars().all()
 
     @staticmethod
+    def _store_available_slots(
+        participation: Participations, available_slots: dict
+    ) -> bool:
+        """재계산한 가용 시간을 반영하고 내용이 바뀌었는지 반환한다.
+
+        내용이 같으면 본문을 다시 쓰지 않고 갱신 시각만 남긴다 (버전 증가 없음).
+        stale 결과는 Google 갱신에 실패한 것이므로 updated_at을 그대로 둬
+        재동기화 대상에 남긴다. available_slots는 로드된 상태여야 한다.
+        """
+        stale = ScheduleAnalyzer.is_stale(available_slots)
+        if ScheduleAnalyzer.availability_unchanged(
+            participation.available_slots, available_slots
+        ):
+            if not stale:
+                participation.updated_at = datetime.now()
+            return False
+
+        participation.available_slots = ScheduleAnalyzer.dump_available_slots(
+            available_slots
+        )
+        if stale:
+            # 명시적으로 SET에 포함해 onupdate로 갱신되지 않게 한다
+            flag_modified(participation, "updated_at")
+        return True
+
+    @staticmethod
+    async def _bump_version(appointment_id: int, db: AsyncSession) -> None:
+        # 약속 버전 증가 (DB에서 원자적으로 증가시켜 동시 변경도 서로 다른 버전)
+        await db.execute(
+            update(Appointments)
+            .where(Appointments.id == appointment_id)
+            .values(version=Appointments.version + 1)
+        )
+
+    @staticmethod
+    @traced("appointment.join")
     async def join_appointment(
-        invite_code: str, user_id: str, db: AsyncSession
+        invite_code: str, user_id: str, db: AsyncSession, user: Optional[User] = None
     ) -> Participations:
         # 초대 코드로 약속 참여
 
@@ -156,7 +252,8 @@ class AppointmentService:
 
         # 가용 시간 계산
         try:
-            user = await UserService.get_user_by_google_id(str(user_id), db)
+            if user is None:
+                user = await UserService.get_user_by_google_id(str(user_id), db)
             if user and user.google_refresh_token:
                 candidate_dates = await AppointmentService.get_appointment_dates(
                     appointment.id, db
@@ -168,24 +265,41 @@ class AppointmentService:
                 )
 
                 if available_slots:
-                    participation.available_slots = json.dumps(
-                        available_slots, ensure_ascii=False
+                    participation.available_slots = (
+                        ScheduleAnalyzer.dump_available_slots(available_slots)
                     )
         except Exception:
             pass
 
+        await AppointmentService._bump_version(appointment.id, db)
         await db.commit()
-        await db.refresh(participation)
+        # 가용 시간은 지연 로드 컬럼이라 응답용으로 명시해서 다시 읽는다
+        await db.refresh(participation, ["available_slots"])
+
+        await AppointmentEventHub.publish(
+            appointment.invite_link,
+            AppointmentService._build_availability_event(
+                "participant_joined", appointment
+            ),
+        )
 
         return participation
 
+    @staticmethod
+    def _build_availability_event(event_type: str, appointment: Appointments) -> dict:
+        # 이벤트 스트림은 인증 없이 열 수 있으므로 참여자별 정보(ID, 가용 날짜)는
+        # 싣지 않는다. 구독자는 버전을 보고 /detail을 다시 읽는다 (ETag로 저렴)
+        return {"type": event_type, "version": appointment.version}
+
     @staticmethod
     async def _get_participation(
-        user_id: str, appointment_id: int, db: AsyncSession
+        user_id: str, appointment_id: int, db: AsyncSession, *undeferred
     ) -> Participations:
-        # 특정 사용자의 참여 정보 조회
+        # 특정 사용자의 참여 정보 조회 (큰 컬럼은 undeferred로 지정한 것만 로드)
         result = await db.execute(
-            select(Participations).where(
+            select(Participations)
+            .options(*(undefer(column) for column in undeferred))
+            .where(
                 Participations.user_id == user_id,
                 Participations.appointment_id == appointment_id,
             )
@@ -233,11 +347,15 @@ class AppointmentService:
         }
 
     @staticmethod
+    @traced("appointment.sync_participant_calendar")
     async def _sync_participation_calendar(
         participation: Participations,
         event_payload: dict,
         db: AsyncSession,
+        actor_id: str = None,
+        users: Optional[Dict[str, User]] = None,
     ) -> None:
+        set_attributes(**{"participation.id": participation.id})
         if participation.status == "NOT_ATTENDING":
             participation.calendar_sync_status = "skipped"
             participation.calendar_sync_error = None
@@ -250,20 +368,33 @@ class AppointmentService:
             participation.calendar_synced_at = datetime.now()
             return
 
-        user = await UserService.get_user_by_google_id(str(participation.user_id), db)
+        if users is not None:
+            user = users.get(str(participation.user_id))
+        else:
+            user = await UserService.get_user_by_google_id(
+                str(participation.user_id), db
+            )
         if not user or not user.google_refresh_token:
             participation.calendar_sync_status = "failed"
             participation.calendar_sync_error = "missing_refresh_token"
             participation.calendar_synced_at = datetime.now()
             return
 
+        # 요청한 사용자 한 명이 프로젝트 전체 Google 할당량을 소진하지 않도록 제한
+        if actor_id is not None and not await acquire_google_fanout(actor_id):
+            participation.calendar_sync_status = "failed"
+            participation.calendar_sync_error = "rate_limited"
+            participation.calendar_synced_at = datetime.now()
+            return
+
         try:
-            access_token = await GoogleCalendarService.refresh_access_token(
-                user.google_refresh_token
-            )
-            created = await GoogleCalendarService.create_event(
-                access_token, event_payload
-            )
+            with GoogleQuotaScheduler.context(user_id=user.user_id):
+                access_token = await GoogleCalendarService.refresh_access_token(
+                    user.google_refresh_token
+                )
+                created = await GoogleCalendarService.create_event(
+                    access_token, event_payload, cache_key=user.user_id
+                )
             participation.google_event_id = created.get("id")
             participation.calendar_sync_status = "success"
             participation.calendar_sync_error = None
@@ -278,16 +409,305 @@ class AppointmentService:
             participation.calendar_synced_at = datetime.now()
 
     @staticmethod
+    def _set_calendar_sync(
+        participation: Participations, status: str, error: Optional[str] = None
+    ) -> None:
+        participation.calendar_sync_status = status
+        participation.calendar_sync_error = error
+        participation.calendar_synced_at = datetime.now()
+
+    @staticmethod
+    async def _get_participations(
+        appointment_id: int, db: AsyncSession, *undeferred
+    ) -> List[Participations]:
+        result = await db.execute(
+            select(Participations)
+            .options(*(undefer(column) for column in undeferred))
+            .where(Participations.appointment_id == appointment_id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    @traced("appointment.sync_organizer_calendar")
+    async def _sync_organizer_calendar(
+        appointment: Appointments,
+        event_payload: dict,
+        db: AsyncSession,
+        actor_id: str = None,
+    ) -> None:
+        """생성자 캘린더의 이벤트 하나에 참여자 전원을 attendees로 반영한다.
+
+        이벤트가 이미 있으면 attendees만 갱신하므로 참여자 수와 관계없이
+        Google 호출은 토큰 갱신 포함 2회다. 참여자 일부만 재시도하더라도
+        attendees가 빠지지 않도록 항상 전체 참여자를 기준으로 계산한다.
+        """
+        participations = await AppointmentService._get_participations(
+            appointment.id, db
+        )
+        users = await UserService.get_users_by_google_ids(
+            [appointment.creator_id]
+            + [participation.user_id for participation in participations],
+            db,
+        )
+        set_attributes(
+            **{
+                "appointment.id": appointment.id,
+                "appointment.participants": len(participations),
+            }
+        )
+        # participant 모드에서 넘어온 사본을 먼저 지운다 (재시도 시에도 다시 시도)
+        await AppointmentService._delete_participant_event_copies(
+            participations, users, keep_user_id=appointment.creator_id
+        )
+
+        targets = []
+        attendees = []
+        for participation in participations:
+            is_creator = str(participation.user_id) == str(appointment.creator_id)
+            if participation.google_event_id and not is_creator:
+                # 사본이 남은 참여자를 초대하면 같은 일정이 두 번 생긴다
+                continue
+            if participation.status == "NOT_ATTENDING":
+                AppointmentService._set_calendar_sync(participation, "skipped")
+                continue
+            user = users.get(str(participation.user_id))
+            if is_creator:
+                targets.append(participation)
+            elif user is None or not user.email:
+                AppointmentService._set_calendar_sync(
+                    participation, "failed", "missing_email"
+                )
+            else:
+                targets.append(participation)
+                attendees.append(
+                    {
+                        "email": user.email,
+                        # MAYBE 참여자는 선택 참석자로 초대
+                        "optional": participation.status == "MAYBE",
+                    }
+                )
+
+        def _mark_targets(status: str, error: Optional[str] = None) -> None:
+            for target in targets:
+                AppointmentService._set_calendar_sync(target, status, error)
+
+        organizer = users.get(str(appointment.creator_id))
+        if not organizer or not organizer.google_refresh_token:
+            _mark_targets("failed", "organizer_missing_refresh_token")
+            return
+
+        if actor_id is not None and not await acquire_google_fanout(actor_id):
+            _mark_targets("failed", "rate_limited")
+            return
+
+        try:
+            access_token = await GoogleCalendarService.refresh_access_token(
+                organizer.google_refresh_token
+            )
+            if appointment.google_event_id:
+                await GoogleCalendarService.update_event(
+                    access_token,
+                    appointment.google_event_id,
+                    {"attendees": attendees},
+                    send_updates="all",
+                    cache_key=organizer.user_id,
+                )
+            else:
+                created = await GoogleCalendarService.create_event(
+                    access_token,
+                    {**event_payload, "attendees": attendees},
+                    send_updates="all",
+                    cache_key=organizer.user_id,
+                )
+                appointment.google_event_id = created.get("id")
+            _mark_targets("success")
+        except HTTPException as exc:
+            _mark_targets("failed", str(exc.detail))
+        except Exception:
+            _mark_targets("failed", "unknown_error")
+
+    @staticmethod
+    async def _delete_participant_event_copies(
+        participations: List[Participations],
+        users: Dict[str, User],
+        keep_user_id: Optional[str] = None,
+    ) -> None:
+        # participant 모드에서 각자 캘린더에 만든 이벤트 사본 삭제 (실패해도 계속).
+        # 지우지 못한 사본은 ID를 남기고 failed로 표시해 재시도 때 다시 지운다
+        for participation in participations:
+            if not participation.google_event_id or str(participation.user_id) == str(
+                keep_user_id
+            ):
+                continue
+            user = users.get(str(participation.user_id))
+            if not user or not user.google_refresh_token:
+                AppointmentService._set_calendar_sync(
+                    participation, "failed", "event_copy_missing_refresh_token"
+                )
+                continue
+            try:
+                access_token = await GoogleCalendarService.refresh_access_token(
+                    user.google_refresh_token
+                )
+                await GoogleCalendarService.delete_event(
+                    access_token, participation.google_event_id
+                )
+            except HTTPException as exc:
+                if exc.status_code != 404:
+                    LOGGER.warning(
+                        "Failed to delete event copy for participation %s: %s",
+                        participation.id,
+                        exc.detail,
+                    )
+                    AppointmentService._set_calendar_sync(
+                        participation, "failed", "event_copy_delete_failed"
+                    )
+                    continue
+            except Exception:
+                LOGGER.exception(
+                    "Failed to delete event copy for participation %s",
+                    participation.id,
+                )
+                AppointmentService._set_calendar_sync(
+                    participation, "failed", "event_copy_delete_failed"
+                )
+                continue
+            participation.google_event_id = None
+
+    @staticmethod
+    @traced("appointment.change_calendar_sync_mode")
+    async def change_calendar_sync_mode(
+        appointment: Appointments, mode: str, db: AsyncSession, user_id: str
+    ) -> Appointments:
+        """약속의 캘린더 반영 방식을 바꾸고, 확정된 약속이면 기존 이벤트를 옮긴다.
+
+        participant -> organizer: 생성자 본인 사본을 organizer 이벤트로 승격하고
+        나머지 사본은 삭제한 뒤 attendees를 채운다.
+        organizer -> participant: organizer 이벤트를 취소하고 참여자별로 다시 만든다.
+        """
+        if mode not in CALENDAR_SYNC_MODES:
+            raise ValueError("지원하지 않는 캘린더 반영 방식입니다")
+        if appointment.creator_id != user_id:
+            raise PermissionError("creator_only")
+        if appointment.calendar_sync_mode == mode:
+            return appointment
+
+        if appointment.status == "CONFIRMED":
+            participations = await AppointmentService._get_participations(
+                appointment.id, db
+            )
+            event_payload = AppointmentService._build_calendar_event_payload(
+                appointment
+            )
+            if mode == CALENDAR_SYNC_ORGANIZER:
+                creator_participation = next(
+                    (
+                        participation
+                        for participation in participations
+                        if str(participation.user_id) == str(appointment.creator_id)
+                    ),
+                    None,
+                )
+                if creator_participation and creator_participation.google_event_id:
+                    appointment.google_event_id = creator_participation.google_event_id
+                    creator_participation.google_event_id = None
+                # 나머지 참여자 사본은 organizer 동기화에서 지운다
+                appointment.calendar_sync_mode = mode
+                await AppointmentService._sync_organizer_calendar(
+                    appointment, event_payload, db, actor_id=user_id
+                )
+            else:
+                await AppointmentService._delete_organizer_event(appointment, db)
+                appointment.calendar_sync_mode = mode
+                users = await AppointmentService._load_participant_users(
+                    participations, db
+                )
+                for participation in participations:
+                    await AppointmentService._sync_participation_calendar(
+                        participation, event_payload, db, actor_id=user_id, users=users
+                    )
+        else:
+            appointment.calendar_sync_mode = mode
+
+        await AppointmentService._bump_version(appointment.id, db)
+        await db.commit()
+        await db.refresh(appointment)
+        return appointment
+
+    @staticmethod
+    async def _delete_organizer_event(
+        appointment: Appointments, db: AsyncSession
+    ) -> None:
+        if not appointment.google_event_id:
+            return
+        organizer = await UserService.get_user_by_google_id(
+            str(appointment.creator_id), db
+        )
+        if organizer and organizer.google_refresh_token:
+            try:
+                access_token = await GoogleCalendarService.refresh_access_token(
+                    organizer.google_refresh_token
+                )
+                await GoogleCalendarService.delete_event(
+                    access_token, appointment.google_event_id, send_updates="all"
+                )
+            except HTTPException as exc:
+                if exc.status_code != 404:
+                    raise
+        appointment.google_event_id = None
+
+    @staticmethod
+    async def mark_organizer_event_result(
+        appointment: Appointments, status: str, db: AsyncSession
+    ) -> None:
+        # organizer 이벤트 수정/삭제 결과를 참여자 상태에 반영
+        if status == "deleted":
+            appointment.google_event_id = None
+        for participation in await AppointmentService._get_participations(
+            appointment.id, db
+        ):
+            if participation.status != "NOT_ATTENDING":
+                AppointmentService._set_calendar_sync(participation, status)
+        await AppointmentService._bump_version(appointment.id, db)
+        await db.commit()
+
+    @staticmethod
+    async def _load_participant_users(
+        participations: List[Participations], db: AsyncSession
+    ) -> Dict[str, User]:
+        # 이벤트를 새로 만들어야 하는 참여자의 사용자 정보만 한 번에 조회
+        user_ids = [
+            str(participation.user_id)
+            for participation in participations
+            if participation.status != "NOT_ATTENDING"
+            and not participation.google_event_id
+        ]
+        return await UserService.get_users_by_google_ids(user_ids, db)
+
+    @staticmethod
+    @traced("appointment.retry_calendar_sync")
     async def retry_calendar_sync(
         appointment: Appointments,
         participations: List[Participations],
         db: AsyncSession,
+        user_id: str = None,
     ) -> None:
         event_payload = AppointmentService._build_calendar_event_payload(appointment)
-        for participation in participations:
-            await AppointmentService._sync_participation_calendar(
-                participation, event_payload, db
-            )
+        # 팬아웃 Google 호출은 대화형 요청보다 뒤로
+        with GoogleQuotaScheduler.context(priority=PRIORITY_BACKGROUND):
+            if appointment.calendar_sync_mode == CALENDAR_SYNC_ORGANIZER:
+                await AppointmentService._sync_organizer_calendar(
+                    appointment, event_payload, db, actor_id=user_id
+                )
+            else:
+                users = await AppointmentService._load_participant_users(
+                    participations, db
+                )
+                for participation in participations:
+                    await AppointmentService._sync_participation_calendar(
+                        participation, event_payload, db, actor_id=user_id, users=users
+                    )
+        await AppointmentService._bump_version(appointment.id, db)
         await db.commit()
 
     @staticmethod
@@ -305,20 +725,23 @@ class AppointmentService:
         if appointment.creator_id != user_id:
             raise ValueError("약속 생성자만 삭제할 수 있습니다")
 
-        # 약속 삭제
+        # 약속 삭제 (행이 사라지므로 이후 조회는 404가 되어 버전 증가가 필요 없다)
         await db.delete(appointment)
         await db.commit()
 
+        await AppointmentEventHub.publish(invite_code, {"type": "deleted"})
+
         return True
 
     @staticmethod
     async def get_appointment_detail_with_availability(
-        invite_code: str, db: AsyncSession
+        invite_code: str, db: AsyncSession, appointment: Appointments = None
     ) -> dict:
-        # 약속 조회
-        appointment = await AppointmentService.get_appointment_by_invite_code(
-            invite_code, db
-        )
+        # 약속 조회 (라우트에서 이미 조회한 경우 재사용)
+        if appointment is None:
+            appointment = await AppointmentService.get_appointment_by_invite_code(
+                invite_code, db
+            )
         if not appointment:
             raise ValueError("존재하지 않는 약속입니다")
 
@@ -328,11 +751,11 @@ class AppointmentService:
         )
         candidate_dates_list = sorted([ad.candidate_date for ad in candidate_dates])
 
-        # 모든 참여자 조회
+        # 모든 참여자 조회 (가용 시간 컬럼 포함)
         result = await db.execute(
-            select(Participations).where(
-                Participations.appointment_id == appointment.id
-            )
+            select(Participations)
+            .options(undefer(Participations.available_slots))
+            .where(Participations.appointment_id == appointment.id)
         )
         all_participations = result.scalars().all()
         total_participants = len(all_participations)
@@ -340,29 +763,20 @@ class AppointmentService:
         # 가용시간 데이터가 있는 참여자 수
         participants_with_data = sum(1 for p in all_participations if p.available_slots)
 
+        # 날짜별 가용 참여자 수를 한 번에 집계 (파싱 결과는 참여 정보 버전별로 캐시)
+        available_counts: Counter = Counter()
+        for participation in all_participations:
+            if not participation.available_slots:
+                continue
+            try:
+                available_counts.update(AvailabilityCache.get(participation).dates)
+            except Exception:
+                pass
+
         # 각 날짜별 가용성 계산
         date_availabilities = []
         for candidate_date in candidate_dates_list:
-            available_count = 0
-
-            # 각 참여자의 available_slots를 확인
-            for participation in all_participations:
-                if not participation.available_slots:
-                    continue
-
-                try:
-                    slots_data = json.loads(participation.available_slots)
-                    slots = slots_data.get("slots", [])
-
-                    # 해당 날짜에 가용 시간이 있는지 확인
-                    for slot in slots:
-                        if slot["date"] == candidate_date.isoformat():
-                            # available_times가 비어있지 않으면 가용
-                            if slot.get("available_times"):
-                                available_count += 1
-                            break
-                except Exception:
-                    pass
+            available_count = available_counts[candidate_date.isoformat()]
 
             # availability 상태 결정
             if available_count == 0:
@@ -400,35 +814,152 @@ class AppointmentService:
         db: AsyncSession,
         time_range_start: str = None,
         time_range_end: str = None,
+        version: int = None,
+        limit: int = None,
+        cursor: str = None,
     ) -> List[dict]:
-        result = await db.execute(
-            select(Participations)
-            .where(Participations.appointment_id == appointment_id)
-            .where(Participations.available_slots.isnot(None))
+        # 버전을 알면 동시 요청을 하나의 계산으로 병합
+        if version is None:
+            return await AppointmentService._calculate_optimal_times(
+                appointment_id,
+                min_duration_minutes,
+                db,
+                time_range_start,
+                time_range_end,
+                limit,
+                cursor,
+            )
+
+        key = (
+            appointment_id,
+            version,
+            min_duration_minutes,
+            time_range_start,
+            time_range_end,
+            limit,
+            cursor,
         )
-        participations = result.scalars().all()
+        # 병합된 계산은 요청이 끝나거나 취소돼도 계속되므로 요청 세션 대신 전용 세션 사용
+        return await AppointmentService.optimal_times_flight.do(
+            key,
+            lambda: AppointmentService._in_own_session(
+                lambda session: AppointmentService._calculate_optimal_times(
+                    appointment_id,
+                    min_duration_minutes,
+                    session,
+                    time_range_start,
+                    time_range_end,
+                    limit,
+                    cursor,
+                    version,
+                )
+            ),
+        )
+
+    @staticmethod
+    async def _in_own_session(
+        func: Callable[[AsyncSession], Awaitable[T]],
+    ) -> T:
+        async with AsyncSessionLocal() as session:
+            return await func(session)
+
+    @staticmethod
+    @traced("appointment.optimal_times")
+    async def _calculate_optimal_times(
+        appointment_id: int,
+        min_duration_minutes: int,
+        db: AsyncSession,
+        time_range_start: str = None,
+        time_range_end: str = None,
+        limit: int = None,
+        cursor: str = None,
+        version: int = None,
+    ) -> List[dict]:
+        set_attributes(
+            **{"appointment.id": appointment_id, "appointment.version": version}
+        )
+        # 버전별 최대 블록 인덱스는 한 번만 만들고 조건 변경은 인덱스 조회로 처리
+        if version is None:
+            index = await AppointmentService._build_block_index(appointment_id, db)
+        else:
+            index = await AppointmentService.optimal_index_flight.do(
+                (appointment_id, version),
+                lambda: AppointmentService._in_own_session(
+                    lambda session: AppointmentService._build_block_index(
+                        appointment_id, session
+                    )
+                ),
+            )
 
-        if not participations:
+        try:
+            optimal_times = index.query(
+                min_duration_minutes,
+                time_range_start,
+                time_range_end,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError:
+            # 잘못된 시간대 필터는 기존과 같이 빈 결과
             return []
 
-        # JSON 파싱
+        if optimal_times is not None:
+            return optimal_times
+
+        # 그리드에 맞지 않는 데이터는 원본 슬롯을 잘라 다시 계산
         all_slots = []
-        for p in participations:
+        for user_data in index.user_slots:
             try:
-                slots_data = json.loads(p.available_slots)
                 filtered_slots = AppointmentService._filter_slots_by_time_range(
-                    slots_data["slots"], time_range_start, time_range_end
+                    user_data["slots"], time_range_start, time_range_end
+                )
+                all_slots.append(
+                    {"user_id": user_data["user_id"], "slots": filtered_slots}
                 )
-                all_slots.append({"user_id": p.user_id, "slots": filtered_slots})
             except Exception:
                 pass
 
-        # 교집합 계산
-        optimal_times = ScheduleAnalyzer.find_common_slots(
-            all_slots, min_duration_minutes
+        return await CpuOffload.run(
+            ScheduleAnalyzer.find_common_slots,
+            all_slots,
+            min_duration_minutes,
+            limit,
+            cursor,
+            size=sum(
+                len(slot["available_times"])
+                for user_data in all_slots
+                for slot in user_data["slots"]
+            ),
         )
 
-        return optimal_times
+    @staticmethod
+    async def _build_block_index(
+        appointment_id: int, db: AsyncSession
+    ) -> MaximalBlockIndex:
+        result = await db.execute(
+            select(Participations)
+            .options(undefer(Participations.available_slots))
+            .where(Participations.appointment_id == appointment_id)
+            .where(Participations.available_slots.isnot(None))
+        )
+        participations = result.scalars().all()
+
+        # 분 단위 구간 (바뀌지 않은 참여자는 캐시에서 바로 사용)
+        user_intervals = []
+        for p in participations:
+            try:
+                user_intervals.append((p.user_id, AvailabilityCache.get(p).slots))
+            except Exception:
+                pass
+
+        # 큰 약속은 그리드 계산을 실행기에서 (이벤트 루프를 막지 않도록)
+        return await CpuOffload.run(
+            ScheduleAnalyzer.build_block_index_from_intervals,
+            user_intervals,
+            size=sum(
+                len(intervals) for _, slots in user_intervals for _, intervals in slots
+            ),
+        )
 
     @staticmethod
     def _filter_slots_by_time_range(
@@ -481,6 +1012,7 @@ class AppointmentService:
         return filtered_slots
 
     @staticmethod
+    @traced("appointment.confirm")
     async def confirm_appointment(
         invite_code: str,
         confirmed_date: str,
@@ -510,26 +1042,52 @@ class AppointmentService:
         appointment.confirmed_start_time = confirmed_start_time
         appointment.confirmed_end_time = confirmed_end_time
         appointment.confirmed_at = datetime.now()
+        await AppointmentService._bump_version(appointment.id, db)
 
         await db.commit()
         await db.refresh(appointment)
 
         event_payload = AppointmentService._build_calendar_event_payload(appointment)
 
-        participation_result = await db.execute(
-            select(Participations).where(
-                Participations.appointment_id == appointment.id
-            )
-        )
-        participations = participation_result.scalars().all()
+        # 팬아웃 Google 호출은 대화형 요청보다 뒤로
+        with GoogleQuotaScheduler.context(priority=PRIORITY_BACKGROUND):
+            if appointment.calendar_sync_mode == CALENDAR_SYNC_ORGANIZER:
+                # 생성자 캘린더 이벤트 하나 + attendees (Google이 초대 메일 발송)
+                await AppointmentService._sync_organizer_calendar(
+                    appointment, event_payload, db, actor_id=user_id
+                )
+            else:
+                participations = await AppointmentService._get_participations(
+                    appointment.id, db
+                )
+                set_attributes(
+                    **{
+                        "appointment.id": appointment.id,
+                        "appointment.participants": len(participations),
+                    }
+                )
+                users = await AppointmentService._load_participant_users(
+                    participations, db
+                )
 
-        for participation in participations:
-            await AppointmentService._sync_participation_calendar(
-                participation, event_payload, db
-            )
+                for participation in participations:
+                    await AppointmentService._sync_participation_calendar(
+                        participation, event_payload, db, actor_id=user_id, users=users
+                    )
 
         await db.commit()
 
+        await AppointmentEventHub.publish(
+            appointment.invite_link,
+            {
+                "type": "confirmed",
+                "version": appointment.version,
+                "confirmed_date": appointment.confirmed_date,
+                "confirmed_start_time": appointment.confirmed_start_time,
+                "confirmed_end_time": appointment.confirmed_end_time,
+            },
+        )
+
         return appointment
 
     @staticmethod
@@ -546,10 +1104,14 @@ class AppointmentService:
         return appointments
 
     @staticmethod
-    async def sync_my_schedules(user_id: str, db: AsyncSession) -> dict:
+    @traced("appointment.sync_my_schedules")
+    async def sync_my_schedules(
+        user_id: str, db: AsyncSession, user: Optional[User] = None
+    ) -> dict:
         # 내가 참여한 모든 약속의 일정 동기화
 
-        user = await UserService.get_user_by_google_id(str(user_id), db)
+        if user is None:
+            user = await UserService.get_user_by_google_id(str(user_id), db)
         if not user or not user.google_refresh_token:
             raise ValueError("구글 캘린더 연동이 필요합니다")
 
@@ -564,12 +1126,14 @@ class AppointmentService:
 
         updated_count = 0
         failed_count = 0
+        stale_count = 0
+        events = []
 
         # 각 약속에 대해 일정 재계산
         for appointment in appointments:
             try:
                 participation = await AppointmentService._get_participation(
-                    user_id, appointment.id, db
+                    user_id, appointment.id, db, Participations.available_slots
                 )
 
                 if not participation:
@@ -581,15 +1145,31 @@ class AppointmentService:
                 )
                 candidate_dates = [ad.candidate_date for ad in candidate_dates_obj]
 
-                available_slots = await ScheduleAnalyzer.calculate_available_slots(
-                    user=user, candidate_dates=candidate_dates
-                )
+                # Google 장애 시 마지막 가용 시간을 stale로 표시해 유지
+                with GoogleQuotaScheduler.context(priority=PRIORITY_BACKGROUND):
+                    available_slots = await ScheduleAnalyzer.calculate_available_slots(
+                        user=user,
+                        candidate_dates=candidate_dates,
+                        previous=participation.available_slots,
+                    )
 
                 if available_slots:
-                    participation.available_slots = json.dumps(
-                        available_slots, ensure_ascii=False
-                    )
-                    updated_count += 1
+                    if AppointmentService._store_available_slots(
+                        participation, available_slots
+                    ):
+                        await AppointmentService._bump_version(appointment.id, db)
+                        events.append(
+                            (
+                                appointment.invite_link,
+                                AppointmentService._build_availability_event(
+                                    "availability_updated", appointment
+                                ),
+                            )
+                        )
+                    if ScheduleAnalyzer.is_stale(available_slots):
+                        stale_count += 1
+                    else:
+                        updated_count += 1
                 else:
                     failed_count += 1
 
@@ -598,8 +1178,12 @@ class AppointmentService:
 
         await db.commit()
 
+        for invite_link, event in events:
+            await AppointmentEventHub.publish(invite_link, event)
+
         return {
             "total_appointments": len(appointments),
             "updated_count": updated_count,
             "failed_count": failed_count,
+            "stale_count": stale_count,
         }
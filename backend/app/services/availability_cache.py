@@ -0,0 +1,127 @@
+"""참여자별 파싱된 가용 시간 LRU.
+
+available_slots JSON(또는 비트마스크)을 분 단위 구간으로 한 번만 풀어 두고,
+같은 참여 정보를 다시 읽는 최적 시간 계산·약속 상세 조회는 파싱을 건너뛴다.
+
+항목은 participation.id별로 (updated_at, 길이, CRC32) 버전으로 확인한다. 가용
+시간을 다시 저장하면 내용이나 updated_at이 바뀌므로 이전 항목은 다음 조회 때
+교체된다. 참여 정보마다
+최신 버전 하나만 보관하고, 항목 수와 전체 구간 수 기준으로 오래 쓰지 않은 항목부터
+제거한다.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from app.services.schedule_analyzer import IntervalSlots, ScheduleAnalyzer
+from app.variable import AVAILABILITY_CACHE_MAX_INTERVALS, AVAILABILITY_CACHE_SIZE
+
+
+class ParsedAvailability(NamedTuple):
+    slots: IntervalSlots
+    # 구간이 하나라도 있는 날짜
+    dates: FrozenSet[str]
+    interval_count: int
+
+    @classmethod
+    def parse(cls, raw: Any) -> "ParsedAvailability":
+        slots = ScheduleAnalyzer.decode_available_intervals(raw) or ()
+        return cls(
+            slots,
+            frozenset(date_str for date_str, intervals in slots if intervals),
+            sum(len(intervals) for _, intervals in slots),
+        )
+
+
+class AvailabilityCache:
+    _entries: "OrderedDict[Any, Tuple[Tuple[Any, int, int], ParsedAvailability]]" = (
+        OrderedDict()
+    )
+    _interval_total = 0
+    hits = 0
+    misses = 0
+    invalidations = 0
+    evictions = 0
+
+    @classmethod
+    def get(cls, participation: Any) -> Optional[ParsedAvailability]:
+        """participation.available_slots의 파싱 결과. 값이 없으면 None.
+
+        파싱에 실패하면 예외를 그대로 던지며 캐시하지 않는다.
+        """
+        raw = participation.available_slots
+        if not raw:
+            return None
+
+        key = getattr(participation, "id", None)
+        updated_at = getattr(participation, "updated_at", None)
+        if AVAILABILITY_CACHE_SIZE <= 0 or key is None or updated_at is None:
+            return ParsedAvailability.parse(raw)
+
+        # MySQL DATETIME은 초 단위라 같은 초 안에 길이가 같은 내용으로 다시 저장해도
+        # ("09:00" -> "10:00") 구분되도록 내용 해시를 함께 비교
+        version = (updated_at, len(raw), cls._content_hash(raw))
+        cached = cls._entries.get(key)
+        if cached is not None:
+            if cached[0] == version:
+                cls.hits += 1
+                cls._entries.move_to_end(key)
+                return cached[1]
+            cls.invalidations += 1
+            cls._discard(key)
+
+        cls.misses += 1
+        parsed = ParsedAvailability.parse(raw)
+        if parsed.interval_count <= AVAILABILITY_CACHE_MAX_INTERVALS:
+            cls._entries[key] = (version, parsed)
+            cls._interval_total += parsed.interval_count
+            cls._evict()
+        return parsed
+
+    @staticmethod
+    def _content_hash(raw: Any) -> int:
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        elif not isinstance(raw, bytes):
+            raw = repr(raw).encode("utf-8")
+        return zlib.crc32(raw)
+
+    @classmethod
+    def _discard(cls, key: Any) -> None:
+        entry = cls._entries.pop(key, None)
+        if entry is not None:
+            cls._interval_total -= entry[1].interval_count
+
+    @classmethod
+    def _evict(cls) -> None:
+        while cls._entries and (
+            len(cls._entries) > AVAILABILITY_CACHE_SIZE
+            or cls._interval_total > AVAILABILITY_CACHE_MAX_INTERVALS
+        ):
+            _, (_, parsed) = cls._entries.popitem(last=False)
+            cls._interval_total -= parsed.interval_count
+            cls.evictions += 1
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries.clear()
+        cls._interval_total = 0
+        cls.hits = cls.misses = cls.invalidations = cls.evictions = 0
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        lookups = cls.hits + cls.misses
+        return {
+            "entries": len(cls._entries),
+            "intervals": cls._interval_total,
+            "max_entries": AVAILABILITY_CACHE_SIZE,
+            "max_intervals": AVAILABILITY_CACHE_MAX_INTERVALS,
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": round(cls.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": cls.invalidations,
+            "evictions": cls.evictions,
+        }
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import logging
+import secrets
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.db.session import AsyncSessionLocal
+from app.models.appointment_model import Appointments, Participations
+from app.models.calendar_watch_model import CalendarWatchChannels
+from app.models.user_model import User
+from app.services.appointment_service import AppointmentService
+from app.services.google_calendar_service import GoogleCalendarService
+from app.services.user_service import UserService
+from app.utils.google_quota import PRIORITY_BACKGROUND, GoogleQuotaScheduler
+from app.variable import (
+    CALENDAR_WATCH_ADDRESS,
+    CALENDAR_WATCH_DEBOUNCE_SECONDS,
+    CALENDAR_WATCH_RENEW_BEFORE_SECONDS,
+    CALENDAR_WATCH_RENEW_INTERVAL_SECONDS,
+    CALENDAR_WATCH_TTL_SECONDS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AvailabilityRecomputeQueue:
+    """푸시 알림을 받은 사용자의 가용 시간 재계산 큐.
+
+    같은 사용자의 알림이 debounce 시간 안에 여러 번 와도 한 번만 재계산한다.
+    """
+
+    debounce_seconds = CALENDAR_WATCH_DEBOUNCE_SECONDS
+    _queue: Optional[asyncio.Queue[Tuple[float, str]]] = None
+    _pending: Set[str] = set()
+    _worker: Optional[asyncio.Task] = None
+    processed = 0
+
+    @classmethod
+    def _ensure_queue(cls) -> asyncio.Queue[Tuple[float, str]]:
+        if cls._queue is None:
+            cls._queue = asyncio.Queue()
+        return cls._queue
+
+    @classmethod
+    def enqueue(cls, user_id: str) -> bool:
+        if user_id in cls._pending:
+            return False
+        cls._pending.add(user_id)
+        cls._ensure_queue().put_nowait(
+            (time.monotonic() + cls.debounce_seconds, user_id)
+        )
+        return True
+
+    @classmethod
+    def pending_count(cls) -> int:
+        return len(cls._pending)
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._worker is None:
+            cls._worker = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        worker = cls._worker
+        cls._worker = None
+        cls._queue = None
+        cls._pending.clear()
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    @classmethod
+    async def _run(cls) -> None:
+        queue = cls._ensure_queue()
+        while True:
+            due_at, user_id = await queue.get()
+            delay = due_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # 처리 중 들어온 알림은 다시 큐에 쌓이도록 먼저 pending에서 제거
+            cls._pending.discard(user_id)
+            await cls.process(user_id)
+
+    @classmethod
+    async def process(cls, user_id: str) -> None:
+        # 해당 사용자가 참여 중인 VOTING 약속의 가용 시간만 재계산
+        async with AsyncSessionLocal() as db:
+            try:
+                await AppointmentService.sync_my_schedules(user_id=user_id, db=db)
+                cls.processed += 1
+            except ValueError:
+                LOGGER.info("Skip availability recompute (user=%s): no token", user_id)
+            except Exception:
+                LOGGER.exception("Availability recompute failed (user=%s)", user_id)
+
+
+class CalendarWatchService:
+    """Google events.watch 채널 관리.
+
+    VOTING 약속 참여자마다 primary 캘린더 채널을 하나씩 유지하고, 만료
+    CALENDAR_WATCH_RENEW_BEFORE_SECONDS 전에 새 채널로 교체한다.
+    """
+
+    _renewer: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(CALENDAR_WATCH_ADDRESS)
+
+    @classmethod
+    async def start(cls) -> None:
+        if not cls.is_enabled() or cls._renewer is not None:
+            return
+        await AvailabilityRecomputeQueue.start()
+        cls._renewer = asyncio.create_task(cls._renew_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        renewer = cls._renewer
+        cls._renewer = None
+        if renewer is not None:
+            renewer.cancel()
+            try:
+                await renewer
+            except asyncio.CancelledError:
+                pass
+        await AvailabilityRecomputeQueue.stop()
+
+    @classmethod
+    async def _renew_loop(cls) -> None:
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await cls.renew_watches(db)
+            except Exception:
+                LOGGER.exception("Calendar watch renewal failed")
+            await asyncio.sleep(CALENDAR_WATCH_RENEW_INTERVAL_SECONDS)
+
+    @staticmethod
+    def _valid_channel(
+        channels: List[CalendarWatchChannels], now: datetime
+    ) -> Optional[CalendarWatchChannels]:
+        renew_at = now + timedelta(seconds=CALENDAR_WATCH_RENEW_BEFORE_SECONDS)
+        return next(
+            (channel for channel in channels if channel.expiration > renew_at), None
+        )
+
+    @staticmethod
+    async def _user_channels(
+        user_id: str, db: AsyncSession, lock: bool = False
+    ) -> List[CalendarWatchChannels]:
+        statement = select(CalendarWatchChannels).where(
+            CalendarWatchChannels.user_id == user_id
+        )
+        if lock:
+            # 잠금 읽기는 최신 커밋을 보므로 다른 워커가 방금 만든 채널도 보인다
+            statement = statement.with_for_update().execution_options(
+                populate_existing=True
+            )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def ensure_watch(user: User, db: AsyncSession) -> CalendarWatchChannels:
+        """유효한 채널이 있으면 재사용, 만료가 가까우면 새 채널 등록 후 이전 채널 해지.
+
+        Google 호출(토큰 갱신, events.watch) 동안에는 DB 잠금을 잡지 않는다.
+        호출이 끝나면 사용자 행을 잠그고 채널을 다시 읽어, 그 사이 다른 워커가
+        유효한 채널을 만들었으면 방금 만든 채널을 해지하고 그 채널을 쓴다.
+        """
+        now = datetime.now()
+        channels = await CalendarWatchService._user_channels(user.user_id, db)
+        existing = CalendarWatchService._valid_channel(channels, now)
+        # 읽기 트랜잭션을 끝내고 Google 호출
+        await db.commit()
+        if existing is not None:
+            return existing
+
+        access_token = await GoogleCalendarService.refresh_access_token(
+            user.google_refresh_token
+        )
+        channel_id = uuid.uuid4().hex
+        channel_token = secrets.token_hex(32)
+        created = await GoogleCalendarService.watch_events(
+            access_token,
+            channel_id=channel_id,
+            address=CALENDAR_WATCH_ADDRESS,
+            token=channel_token,
+            ttl_seconds=CALENDAR_WATCH_TTL_SECONDS,
+        )
+
+        expiration = now + timedelta(seconds=CALENDAR_WATCH_TTL_SECONDS)
+        if created.get("expiration"):
+            expiration = datetime.fromtimestamp(int(created["expiration"]) / 1000)
+
+        channel = CalendarWatchChannels(
+            channel_id=channel_id,
+            user_id=user.user_id,
+            resource_id=created.get("resourceId") or "",
+            token=channel_token,
+            expiration=expiration,
+        )
+
+        # 교체는 짧은 잠금 안에서만: 사용자 행으로 워커 간 직렬화
+        try:
+            await db.execute(
+                select(User.user_id)
+                .where(User.user_id == user.user_id)
+                .with_for_update()
+            )
+            channels = await CalendarWatchService._user_channels(
+                user.user_id, db, lock=True
+            )
+            winner = CalendarWatchService._valid_channel(channels, now)
+            if winner is not None:
+                await db.commit()
+            else:
+                db.add(channel)
+                for old_channel in channels:
+                    await db.delete(old_channel)
+                await db.commit()
+        except Exception:
+            # 기록하지 못한 채널은 아무도 해지하지 않으므로 바로 해지
+            await db.rollback()
+            await CalendarWatchService._stop_quietly(access_token, channel)
+            raise
+
+        if winner is not None:
+            # 다른 워커가 먼저 교체했다
+            await CalendarWatchService._stop_quietly(access_token, channel)
+            return winner
+
+        # 새 채널이 저장된 뒤에만 대체된 채널 해지 (알림 공백 방지)
+        for old_channel in channels:
+            await CalendarWatchService._stop_quietly(access_token, old_channel)
+        return channel
+
+    @staticmethod
+    async def ensure_watch_for_user(user_id: str) -> None:
+        # 약속 참여 직후 백그라운드에서 호출 (요청 세션과 분리)
+        async with AsyncSessionLocal() as db:
+            user = await UserService.get_user_by_google_id(str(user_id), db)
+            if not user or not user.google_refresh_token:
+                return
+            try:
+                with GoogleQuotaScheduler.context(
+                    user_id=user.user_id, priority=PRIORITY_BACKGROUND
+                ):
+                    await CalendarWatchService.ensure_watch(user, db)
+            except Exception:
+                LOGGER.exception("Failed to register calendar watch (user=%s)", user_id)
+
+    @staticmethod
+    async def renew_watches(db: AsyncSession) -> dict:
+        # VOTING 약속 참여자는 채널 보장, 더 이상 필요 없는 채널은 해지
+        result = await db.execute(
+            select(Participations.user_id)
+            .join(Appointments, Appointments.id == Participations.appointment_id)
+            .where(Appointments.status == "VOTING")
+            .distinct()
+        )
+        user_ids = {str(user_id) for user_id in result.scalars().all()}
+
+        ensured = 0
+        failed = 0
+        users = await UserService.get_users_by_google_ids(user_ids, db)
+        for user_id in sorted(user_ids):
+            user = users.get(user_id)
+            if not user or not user.google_refresh_token:
+                continue
+            try:
+                with GoogleQuotaScheduler.context(
+                    user_id=user.user_id, priority=PRIORITY_BACKGROUND
+                ):
+                    await CalendarWatchService.ensure_watch(user, db)
+                ensured += 1
+            except Exception:
+                failed += 1
+                await db.rollback()
+                LOGGER.warning("Calendar watch renewal failed (user=%s)", user_id)
+
+        # 다른 워커가 해지 중인 채널은 건너뛴다
+        stale_result = await db.execute(
+            select(CalendarWatchChannels)
+            .where(CalendarWatchChannels.user_id.notin_(user_ids))
+            .with_for_update(skip_locked=True)
+        )
+        stale_channels = stale_result.scalars().all()
+        stale_users = await UserService.get_users_by_google_ids(
+            {str(channel.user_id) for channel in stale_channels}, db
+        )
+        for channel in stale_channels:
+            user = stale_users.get(str(channel.user_id))
+            if user and user.google_refresh_token:
+                try:
+                    access_token = await GoogleCalendarService.refresh_access_token(
+                        user.google_refresh_token
+                    )
+                    await CalendarWatchService._stop_quietly(access_token, channel)
+                except Exception:
+                    pass
+            await db.delete(channel)
+        await db.commit()
+
+        return {
+            "ensured": ensured,
+            "failed": failed,
+            "stopped": len(stale_channels),
+        }
+
+    @staticmethod
+    async def handle_notification(
+        channel_id: Optional[str],
+        token: Optional[str],
+        resource_state: Optional[str],
+        db: AsyncSession,
+    ) -> bool:
+        # 채널/토큰이 맞으면 해당 사용자 재계산 예약 (등록 직후의 sync 알림은 무시)
+        if not channel_id:
+            return False
+
+        channel = await db.get(CalendarWatchChannels, channel_id)
+        if channel is None or not hmac.compare_digest(
+            channel.token.encode("utf-8"), (token or "").encode("utf-8")
+        ):
+            return False
+
+        if resource_state != "sync":
+            AvailabilityRecomputeQueue.enqueue(str(channel.user_id))
+        return True
+
+    @staticmethod
+    async def _stop_quietly(access_token: str, channel: CalendarWatchChannels) -> None:
+        # 해지 실패는 무시 (채널은 만료 시각이 지나면 자동으로 사라진다)
+        try:
+            await GoogleCalendarService.stop_channel(
+                access_token, channel.channel_id, channel.resource_id
+            )
+        except Exception:
+            LOGGER.warning("Failed to stop calendar channel %s", channel.channel_id)
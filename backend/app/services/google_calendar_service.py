@@ -1,23 +1,104 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import importlib.util
 import logging
-from typing import Any, Dict, Optional, Set
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
 
 import httpx
 from fastapi import HTTPException
 
-from app.variable import GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.google_quota import GoogleQuotaScheduler
+from app.utils.profiling import current_timings, record_google_call
+from app.utils.tracing import current_span, end_span, start_span
+from app.variable import (
+    GOOGLE_BREAKER_ENABLED,
+    GOOGLE_BREAKER_FAILURE_RATE,
+    GOOGLE_BREAKER_HALF_OPEN_CALLS,
+    GOOGLE_BREAKER_MIN_CALLS,
+    GOOGLE_BREAKER_OPEN_SECONDS,
+    GOOGLE_BREAKER_SLOW_CALL_SECONDS,
+    GOOGLE_BREAKER_WINDOW,
+    GOOGLE_CLIENT_ID,
+    GOOGLE_CLIENT_SECRET,
+    GOOGLE_ETAG_CACHE_MAX_ITEMS,
+    GOOGLE_ETAG_CACHE_SIZE,
+    GOOGLE_ETAG_FRESH_SECONDS,
+    GOOGLE_HTTP2,
+    GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS,
+    GOOGLE_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    GOOGLE_HTTP_MAX_CONNECTIONS,
+    GOOGLE_HTTP_MAX_KEEPALIVE,
+    GOOGLE_HTTP_POOL_TIMEOUT_SECONDS,
+    GOOGLE_HTTP_READ_TIMEOUT_SECONDS,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 
+class _GoogleTransport(httpx.AsyncBaseTransport):
+    """모든 Google 호출이 거치는 전송 계층.
+
+    1. 엔드포인트 묶음별 서킷 브레이커가 열려 있으면 요청을 보내지 않고
+       CircuitOpenError(503)를 낸다. 전송 오류, 5xx, 기준보다 느린 응답을
+       실패로 센다. 429는 사용자별 한도 초과일 수 있어 세지 않는다 (한 사용자의
+       한도 초과가 모든 사용자의 호출을 막지 않도록).
+    2. GoogleQuotaScheduler에서 현재 컨텍스트(사용자·우선순위)의 할당량을 받는다.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not GOOGLE_BREAKER_ENABLED:
+            await GoogleQuotaScheduler.acquire()
+            return await self.inner.handle_async_request(request)
+
+        breaker = GoogleCalendarService.breaker(
+            GoogleCalendarService.endpoint_family(request.method, request.url)
+        )
+        # 열린 브레이커는 할당량을 쓰기 전에 바로 실패
+        probe = breaker.before_call()
+        try:
+            await GoogleQuotaScheduler.acquire()
+        except BaseException:
+            breaker.release(probe)
+            raise
+
+        started = time.monotonic()
+        try:
+            response = await self.inner.handle_async_request(request)
+        except httpx.TransportError:
+            breaker.record(time.monotonic() - started, failed=True, probe=probe)
+            raise
+        except BaseException:
+            breaker.release(probe)
+            raise
+
+        failed = response.status_code >= 500
+        breaker.record(time.monotonic() - started, failed=failed, probe=probe)
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
 class GoogleCalendarService:
     TOKEN_URL = "https://oauth2.googleapis.com/token"
     EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
-    _TIMEOUT = 10
+    CHANNELS_STOP_URL = "https://www.googleapis.com/calendar/v3/channels/stop"
+    _TIMEOUT = GOOGLE_HTTP_READ_TIMEOUT_SECONDS
     _client: httpx.AsyncClient | None = None
     _client_lock: asyncio.Lock | None = None
+    # (종류, 사용자, 식별자) -> (etag, 응답, 저장 시각, 이벤트 수)
+    _etag_cache: "OrderedDict[Hashable, Tuple[str, Any, float, int]]" = OrderedDict()
+    _etag_cache_items = 0
+    # 엔드포인트 묶음(token / events.read / events.write / watch)별 브레이커
+    _breakers: Dict[str, CircuitBreaker] = {}
 
     @classmethod
     def _ensure_lock(cls) -> asyncio.Lock:
@@ -32,9 +113,141 @@ class GoogleCalendarService:
         if cls._client is None:
             async with cls._ensure_lock():
                 if cls._client is None:
-                    cls._client = httpx.AsyncClient(timeout=cls._TIMEOUT)
+                    cls._client = httpx.AsyncClient(**cls._client_options())
         return cls._client
 
+    @classmethod
+    def _transport_options(cls) -> Dict[str, Any]:
+        return {
+            "limits": httpx.Limits(
+                max_connections=GOOGLE_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=GOOGLE_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=GOOGLE_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            "http2": cls._http2_available(),
+        }
+
+    @classmethod
+    def _client_options(cls) -> Dict[str, Any]:
+        return {
+            "timeout": httpx.Timeout(
+                cls._TIMEOUT,
+                connect=GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS,
+                pool=GOOGLE_HTTP_POOL_TIMEOUT_SECONDS,
+            ),
+            "transport": _GoogleTransport(
+                httpx.AsyncHTTPTransport(**cls._transport_options())
+            ),
+            "event_hooks": {
+                "request": [cls._mark_request_started],
+                "response": [cls._record_response_time],
+            },
+        }
+
+    @staticmethod
+    async def _mark_request_started(request: httpx.Request) -> None:
+        # 프로파일링 중인 요청에서만 Google 호출 시간을 집계
+        if current_timings() is not None:
+            request.extensions["profiling_started"] = time.perf_counter()
+        if current_span() is not None:
+            request.extensions["trace_span"] = start_span(
+                "google.http",
+                **{
+                    "http.method": request.method,
+                    "http.host": request.url.host,
+                    "http.path": request.url.path,
+                },
+            )
+
+    @staticmethod
+    async def _record_response_time(response: httpx.Response) -> None:
+        started = response.request.extensions.get("profiling_started")
+        if started is not None:
+            record_google_call(time.perf_counter() - started)
+        google_span = response.request.extensions.get("trace_span")
+        if google_span is not None:
+            google_span.set_attribute("http.status_code", response.status_code)
+            if response.status_code >= 400:
+                google_span.status = "ERROR"
+            end_span(google_span)
+
+    @staticmethod
+    def endpoint_family(method: str, url: httpx.URL) -> str:
+        path = url.path
+        if url.host == "oauth2.googleapis.com":
+            return "token"
+        if path.endswith("/events/watch") or "/channels/" in path:
+            return "watch"
+        if method.upper() == "GET":
+            return "events.read"
+        return "events.write"
+
+    @classmethod
+    def breaker(cls, family: str) -> CircuitBreaker:
+        breaker = cls._breakers.get(family)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                f"google.{family}",
+                window=GOOGLE_BREAKER_WINDOW,
+                min_calls=GOOGLE_BREAKER_MIN_CALLS,
+                failure_rate=GOOGLE_BREAKER_FAILURE_RATE,
+                slow_call_seconds=GOOGLE_BREAKER_SLOW_CALL_SECONDS,
+                open_seconds=GOOGLE_BREAKER_OPEN_SECONDS,
+                half_open_calls=GOOGLE_BREAKER_HALF_OPEN_CALLS,
+                error_detail="google_unavailable",
+            )
+            cls._breakers[family] = breaker
+        return breaker
+
+    @classmethod
+    def breaker_states(cls) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트 묶음별 브레이커 상태 (한 번도 호출하지 않은 묶음은 제외)."""
+        return {
+            family: breaker.snapshot()
+            for family, breaker in sorted(cls._breakers.items())
+        }
+
+    @staticmethod
+    def _http2_available() -> bool:
+        # http2=True는 h2 패키지가 없으면 클라이언트 생성 시 실패한다
+        return GOOGLE_HTTP2 and importlib.util.find_spec("h2") is not None
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, Any]:
+        """Google 클라이언트 커넥션 풀 상태 (active/idle 커넥션, 대기 요청 수)."""
+        client = cls._client
+        stats: Dict[str, Any] = {
+            "open": client is not None,
+            "http2": cls._http2_available(),
+            "max_connections": GOOGLE_HTTP_MAX_CONNECTIONS,
+            "max_keepalive": GOOGLE_HTTP_MAX_KEEPALIVE,
+            "active": 0,
+            "idle": 0,
+            "http2_connections": 0,
+            "requests_in_flight": 0,
+            "requests_waiting": 0,
+        }
+        # httpcore 내부 구현에 의존하므로 속성이 없으면 0으로 둔다
+        transport = getattr(client, "_transport", None)
+        transport = getattr(transport, "inner", transport)
+        pool = getattr(transport, "_pool", None)
+        if pool is None:
+            return stats
+
+        for connection in list(getattr(pool, "connections", [])):
+            if connection.is_idle():
+                stats["idle"] += 1
+            else:
+                stats["active"] += 1
+            if "HTTP/2" in repr(connection):
+                stats["http2_connections"] += 1
+        for request in list(getattr(pool, "_requests", [])):
+            if request.is_queued():
+                stats["requests_waiting"] += 1
+            else:
+                stats["requests_in_flight"] += 1
+        return stats
+
     @classmethod
     async def close_client(cls) -> None:
         client: httpx.AsyncClient | None = None
@@ -99,15 +312,21 @@ class GoogleCalendarService:
         max_results: int = 50,
         page_token: Optional[str] = None,
         time_zone: str = "Asia/Seoul",
+        cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
+        """기본 캘린더 이벤트 목록 조회.
+
+        cache_key(사용자 ID)가 주어지면 같은 조건의 마지막 응답과 ETag를 보관하고
+        If-None-Match로 재검증해 변경이 없으면(304) 보관한 응답을 돌려준다.
+        """
         params: Dict[str, str] = {
             "singleEvents": "true",
             "orderBy": "startTime",
             "timeZone": time_zone,
             "maxResults": str(max_results),
             "fields": (
-                "items("
-                "id,status,summary,description,location,start,end,htmlLink,"
+                "etag,items("
+                "id,etag,status,summary,description,location,start,end,htmlLink,"
                 "organizer,creator,attendees,updated"
                 "),nextPageToken"
             ),
@@ -120,6 +339,14 @@ class GoogleCalendarService:
             params["pageToken"] = page_token
 
         headers = {"Authorization": f"Bearer {access_token}"}
+        list_key = (
+            ("list", cache_key, tuple(sorted(params.items())))
+            if cache_key is not None
+            else None
+        )
+        cached = cls._etag_lookup(list_key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
 
         client = await cls._get_client()
 
@@ -131,12 +358,20 @@ class GoogleCalendarService:
                 status_code=500, detail="구글 캘린더 이벤트 조회에 실패했습니다."
             ) from exc
 
+        if response.status_code == 304 and cached is not None:
+            cls._etag_touch(list_key, cached)
+            return copy.deepcopy(cached[1])
+
         data: Dict[str, Any] = cls._safe_json(response)
         if response.is_success:
-            return {
+            result = {
                 "events": data.get("items", []),
                 "nextPageToken": data.get("nextPageToken"),
             }
+            cls._etag_store(
+                list_key, data.get("etag"), result, max(len(result["events"]), 1)
+            )
+            return result
 
         error_info = cls._extract_calendar_error(data)
         error_tokens = cls._extract_calendar_error_tokens(data)
@@ -228,11 +463,78 @@ class GoogleCalendarService:
         }
         return any(token in insufficient_scope_errors for token in tokens)
 
+    @staticmethod
+    def _send_updates_params(send_updates: Optional[str]) -> Optional[Dict[str, str]]:
+        # attendees가 있는 이벤트 변경 시 Google이 초대/변경 메일을 보내도록 지정 (all | none)
+        return {"sendUpdates": send_updates} if send_updates else None
+
+    @classmethod
+    def _etag_lookup(
+        cls, key: Optional[Hashable]
+    ) -> Optional[Tuple[str, Any, float, int]]:
+        if key is None:
+            return None
+        entry = cls._etag_cache.get(key)
+        if entry is not None:
+            cls._etag_cache.move_to_end(key)
+        return entry
+
+    @classmethod
+    def _etag_store(
+        cls,
+        key: Optional[Hashable],
+        etag: Optional[str],
+        value: Any,
+        items: int = 1,
+    ):
+        if key is None or not etag:
+            return
+        cls._etag_discard(key)
+        # 호출자가 돌려받은 값을 고쳐도 캐시가 바뀌지 않도록 복사본을 보관
+        cls._etag_cache[key] = (etag, copy.deepcopy(value), time.monotonic(), items)
+        cls._etag_cache_items += items
+        while cls._etag_cache and (
+            len(cls._etag_cache) > GOOGLE_ETAG_CACHE_SIZE
+            or cls._etag_cache_items > GOOGLE_ETAG_CACHE_MAX_ITEMS
+        ):
+            _, evicted = cls._etag_cache.popitem(last=False)
+            cls._etag_cache_items -= evicted[3]
+
+    @classmethod
+    def _etag_discard(cls, key: Optional[Hashable]) -> None:
+        entry = cls._etag_cache.pop(key, None)
+        if entry is not None:
+            cls._etag_cache_items -= entry[3]
+
+    @classmethod
+    def _etag_touch(cls, key: Hashable, entry: Tuple[str, Any, float, int]) -> None:
+        # 304로 재검증된 항목은 다시 최신으로 취급
+        cls._etag_cache[key] = (entry[0], entry[1], time.monotonic(), entry[3])
+
+    @classmethod
+    def invalidate_etag_cache(cls, cache_key: Optional[str] = None) -> None:
+        if cache_key is None:
+            cls._etag_cache.clear()
+            cls._etag_cache_items = 0
+            return
+        for key in [key for key in cls._etag_cache if key[1] == cache_key]:
+            cls._etag_discard(key)
+
+    @staticmethod
+    def _event_cache_key(
+        cache_key: Optional[str], event_id: Optional[str]
+    ) -> Optional[Hashable]:
+        if cache_key is None or not event_id:
+            return None
+        return ("event", cache_key, event_id)
+
     @classmethod
     async def create_event(
         cls,
         access_token: str,
         event_data: Dict[str, Any],
+        send_updates: Optional[str] = None,
+        cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         headers = {
             "Authorization": f"Bearer {access_token}",
@@ -245,6 +547,7 @@ class GoogleCalendarService:
             response = await client.post(
                 cls.EVENTS_URL,
                 headers=headers,
+                params=cls._send_updates_params(send_updates),
                 json=event_data,
             )
         except httpx.RequestError as exc:
@@ -255,6 +558,9 @@ class GoogleCalendarService:
 
         data: Dict[str, Any] = cls._safe_json(response)
         if response.is_success:
+            cls._etag_store(
+                cls._event_cache_key(cache_key, data.get("id")), data.get("etag"), data
+            )
             return {
                 "id": data.get("id"),
                 "summary": data.get("summary"),
@@ -285,18 +591,154 @@ class GoogleCalendarService:
             status_code=500, detail="구글 캘린더 이벤트 생성에 실패했습니다."
         )
 
+    @classmethod
+    async def _fetch_event(
+        cls,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Dict[str, str],
+        event_key: Optional[Hashable],
+    ) -> Dict[str, Any]:
+        """이벤트 전체 표현 조회.
+
+        최근(GOOGLE_ETAG_FRESH_SECONDS) 받은 표현이 있으면 요청 없이 쓰고, 오래된
+        표현은 If-None-Match로 재검증한다. 목록 응답은 fields로 잘린 일부라서
+        PUT 기반이 될 수 없으므로 여기에는 전체 표현만 보관한다.
+        """
+        cached = cls._etag_lookup(event_key)
+        if cached is not None and (
+            time.monotonic() - cached[2] < GOOGLE_ETAG_FRESH_SECONDS
+        ):
+            return copy.deepcopy(cached[1])
+
+        request_headers = dict(headers)
+        if cached is not None:
+            request_headers["If-None-Match"] = cached[0]
+
+        try:
+            current_response = await client.get(url, headers=request_headers)
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to fetch Google Calendar event: %s", exc)
+            raise HTTPException(
+                status_code=500,
+                detail="구글 캘린더 이벤트 조회 요청에 실패했습니다.",
+            ) from exc
+
+        if current_response.status_code == 304 and cached is not None:
+            cls._etag_touch(event_key, cached)
+            return copy.deepcopy(cached[1])
+
+        current_data: Dict[str, Any] = cls._safe_json(current_response)
+        if current_response.is_success:
+            cls._etag_store(event_key, current_data.get("etag"), current_data)
+            return current_data
+
+        error_info = cls._extract_calendar_error(current_data)
+        error_tokens = cls._extract_calendar_error_tokens(current_data)
+        LOGGER.error(
+            "Google Calendar fetch event error (status=%s, error=%s)",
+            current_response.status_code,
+            error_info,
+        )
+
+        if current_response.status_code == 401:
+            raise HTTPException(status_code=401, detail="google_reauth_required")
+        if current_response.status_code == 404:
+            raise HTTPException(status_code=404, detail="event_not_found")
+        if current_response.status_code == 429:
+            raise HTTPException(status_code=429, detail="rate_limited")
+
+        if cls._matches_scope_missing(error_tokens):
+            raise HTTPException(status_code=400, detail="calendar_scope_missing")
+
+        if current_response.status_code == 403 or cls._matches_insufficient_scope(
+            error_tokens
+        ):
+            raise HTTPException(status_code=403, detail="insufficient_scope")
+
+        raise HTTPException(
+            status_code=500, detail="구글 캘린더 이벤트 조회에 실패했습니다."
+        )
+
+    @classmethod
+    async def _put_event(
+        cls,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Dict[str, str],
+        event_key: Optional[Hashable],
+        event_data: Dict[str, Any],
+        send_updates: Optional[str],
+    ) -> Any:
+        current_data = await cls._fetch_event(client, url, headers, event_key)
+        for field in ("summary", "description", "start", "end"):
+            if field in event_data:
+                current_data[field] = event_data[field]
+
+        put_headers = dict(headers)
+        if current_data.get("etag"):
+            # 기준 표현 이후 다른 곳에서 바뀌었으면 412로 덮어쓰기를 막는다
+            put_headers["If-Match"] = current_data["etag"]
+
+        try:
+            return await client.put(
+                url,
+                headers=put_headers,
+                params=cls._send_updates_params(send_updates),
+                json=current_data,
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to update Google Calendar event: %s", exc)
+            raise HTTPException(
+                status_code=500,
+                detail="구글 캘린더 이벤트 수정 요청에 실패했습니다.",
+            ) from exc
+
+    @classmethod
+    async def _patch_event(
+        cls,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Dict[str, str],
+        event_key: Optional[Hashable],
+        event_data: Dict[str, Any],
+        send_updates: Optional[str],
+    ) -> Any:
+        patch_headers = dict(headers)
+        cached = cls._etag_lookup(event_key)
+        if cached is not None:
+            # 알고 있는 표현 이후 다른 곳에서 바뀌었으면 412로 덮어쓰기를 막는다
+            patch_headers["If-Match"] = cached[0]
+
+        try:
+            return await client.patch(
+                url,
+                headers=patch_headers,
+                params=cls._send_updates_params(send_updates),
+                json=event_data,
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to update Google Calendar event: %s", exc)
+            raise HTTPException(
+                status_code=500,
+                detail="구글 캘린더 이벤트 수정 요청에 실패했습니다.",
+            ) from exc
+
     @classmethod
     async def update_event(
         cls,
         access_token: str,
         event_id: str,
         event_data: Dict[str, Any],
+        send_updates: Optional[str] = None,
+        cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
         url = f"{cls.EVENTS_URL}/{event_id}"
+        event_key = cls._event_cache_key(cache_key, event_id)
 
         client = await cls._get_client()
 
@@ -305,82 +747,23 @@ class GoogleCalendarService:
             for key in ("start", "end")
         )
 
-        if is_all_day:
-            try:
-                current_response = await client.get(url, headers=headers)
-            except httpx.RequestError as exc:  # pragma: no cover - network guard
-                LOGGER.exception("Failed to fetch Google Calendar event: %s", exc)
-                raise HTTPException(
-                    status_code=500,
-                    detail="구글 캘린더 이벤트 조회 요청에 실패했습니다.",
-                ) from exc
-
-            current_data: Dict[str, Any] = cls._safe_json(current_response)
-            if not current_response.is_success:
-                error_info = cls._extract_calendar_error(current_data)
-                error_tokens = cls._extract_calendar_error_tokens(current_data)
-                LOGGER.error(
-                    "Google Calendar fetch event error (status=%s, error=%s)",
-                    current_response.status_code,
-                    error_info,
-                )
-
-                if current_response.status_code == 401:
-                    raise HTTPException(
-                        status_code=401, detail="google_reauth_required"
-                    )
-                if current_response.status_code == 404:
-                    raise HTTPException(status_code=404, detail="event_not_found")
-                if current_response.status_code == 429:
-                    raise HTTPException(status_code=429, detail="rate_limited")
-
-                if cls._matches_scope_missing(error_tokens):
-                    raise HTTPException(
-                        status_code=400, detail="calendar_scope_missing"
-                    )
-
-                if (
-                    current_response.status_code == 403
-                    or cls._matches_insufficient_scope(error_tokens)
-                ):
-                    raise HTTPException(status_code=403, detail="insufficient_scope")
-
-                raise HTTPException(
-                    status_code=500, detail="구글 캘린더 이벤트 조회에 실패했습니다."
-                )
-
-            for field in ("summary", "description", "start", "end"):
-                if field in event_data:
-                    current_data[field] = event_data[field]
-
-            try:
-                response = await client.put(
-                    url,
-                    headers=headers,
-                    json=current_data,
-                )
-            except httpx.RequestError as exc:  # pragma: no cover - network guard
-                LOGGER.exception("Failed to update Google Calendar event: %s", exc)
-                raise HTTPException(
-                    status_code=500,
-                    detail="구글 캘린더 이벤트 수정 요청에 실패했습니다.",
-                ) from exc
-        else:
-            try:
-                response = await client.patch(
-                    url,
-                    headers=headers,
-                    json=event_data,
-                )
-            except httpx.RequestError as exc:  # pragma: no cover - network guard
-                LOGGER.exception("Failed to update Google Calendar event: %s", exc)
-                raise HTTPException(
-                    status_code=500,
-                    detail="구글 캘린더 이벤트 수정 요청에 실패했습니다.",
-                ) from exc
+        # 종일 일정은 전체 표현을 PUT (캐시가 최신이면 사전 GET 생략), 나머지는 PATCH
+        write = cls._put_event if is_all_day else cls._patch_event
+        response = await write(
+            client, url, headers, event_key, event_data, send_updates
+        )
+        if response.status_code == 412:
+            # 캐시된 표현이 낡았으면 최신 표현(ETag)을 다시 받아 한 번만 재시도
+            cls._etag_discard(event_key)
+            if not is_all_day:
+                await cls._fetch_event(client, url, headers, event_key)
+            response = await write(
+                client, url, headers, event_key, event_data, send_updates
+            )
 
         data: Dict[str, Any] = cls._safe_json(response)
         if response.is_success:
+            cls._etag_store(event_key, data.get("etag"), data)
             return {
                 "id": data.get("id"),
                 "summary": data.get("summary"),
@@ -396,6 +779,9 @@ class GoogleCalendarService:
             error_info,
         )
 
+        if event_key is not None:
+            cls._etag_discard(event_key)
+
         if response.status_code == 401:
             raise HTTPException(status_code=401, detail="google_reauth_required")
         if response.status_code == 404:
@@ -418,16 +804,23 @@ class GoogleCalendarService:
         cls,
         access_token: str,
         event_id: str,
+        send_updates: Optional[str] = None,
+        cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         headers = {
             "Authorization": f"Bearer {access_token}",
         }
         url = f"{cls.EVENTS_URL}/{event_id}"
+        event_key = cls._event_cache_key(cache_key, event_id)
+        if event_key is not None:
+            cls._etag_discard(event_key)
 
         client = await cls._get_client()
 
         try:
-            response = await client.delete(url, headers=headers)
+            response = await client.delete(
+                url, headers=headers, params=cls._send_updates_params(send_updates)
+            )
         except httpx.RequestError as exc:  # pragma: no cover - network guard
             LOGGER.exception("Failed to delete Google Calendar event: %s", exc)
             raise HTTPException(
@@ -462,3 +855,108 @@ class GoogleCalendarService:
         raise HTTPException(
             status_code=500, detail="구글 캘린더 이벤트 삭제에 실패했습니다."
         )
+
+    @classmethod
+    async def watch_events(
+        cls,
+        access_token: str,
+        *,
+        channel_id: str,
+        address: str,
+        token: str,
+        ttl_seconds: int,
+    ) -> Dict[str, Any]:
+        # primary 캘린더 변경 시 address로 푸시 알림을 받는 채널 등록
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        body = {
+            "id": channel_id,
+            "type": "web_hook",
+            "address": address,
+            "token": token,
+            "params": {"ttl": str(ttl_seconds)},
+        }
+
+        client = await cls._get_client()
+
+        try:
+            response = await client.post(
+                f"{cls.EVENTS_URL}/watch", headers=headers, json=body
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to register Google Calendar watch: %s", exc)
+            raise HTTPException(
+                status_code=500,
+                detail="구글 캘린더 알림 채널 등록 요청에 실패했습니다.",
+            ) from exc
+
+        data: Dict[str, Any] = cls._safe_json(response)
+        if response.is_success:
+            return {
+                "id": data.get("id"),
+                "resourceId": data.get("resourceId"),
+                "expiration": data.get("expiration"),
+            }
+
+        cls._raise_for_channel_error(response, data, "register watch")
+        raise HTTPException(
+            status_code=500, detail="구글 캘린더 알림 채널 등록에 실패했습니다."
+        )
+
+    @classmethod
+    async def stop_channel(
+        cls, access_token: str, channel_id: str, resource_id: str
+    ) -> None:
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+
+        client = await cls._get_client()
+
+        try:
+            response = await client.post(
+                cls.CHANNELS_STOP_URL,
+                headers=headers,
+                json={"id": channel_id, "resourceId": resource_id},
+            )
+        except httpx.RequestError as exc:  # pragma: no cover - network guard
+            LOGGER.exception("Failed to stop Google Calendar channel: %s", exc)
+            raise HTTPException(
+                status_code=500,
+                detail="구글 캘린더 알림 채널 해지 요청에 실패했습니다.",
+            ) from exc
+
+        # 이미 만료되었거나 없는 채널은 해지된 것으로 본다
+        if response.is_success or response.status_code == 404:
+            return
+
+        data: Dict[str, Any] = cls._safe_json(response)
+        cls._raise_for_channel_error(response, data, "stop channel")
+        raise HTTPException(
+            status_code=500, detail="구글 캘린더 알림 채널 해지에 실패했습니다."
+        )
+
+    @classmethod
+    def _raise_for_channel_error(
+        cls, response: Any, data: Dict[str, Any], action: str
+    ) -> None:
+        LOGGER.error(
+            "Google Calendar %s error (status=%s, error=%s)",
+            action,
+            response.status_code,
+            cls._extract_calendar_error(data),
+        )
+
+        if response.status_code == 401:
+            raise HTTPException(status_code=401, detail="google_reauth_required")
+        if response.status_code == 429:
+            raise HTTPException(status_code=429, detail="rate_limited")
+
+        error_tokens = cls._extract_calendar_error_tokens(data)
+        if cls._matches_scope_missing(error_tokens):
+            raise HTTPException(status_code=400, detail="calendar_scope_missing")
+        if response.status_code == 403 or cls._matches_insufficient_scope(error_tokens):
+            raise HTTPException(status_code=403, detail="insufficient_scope")
@@ -0,0 +1,159 @@
+"""워커 상태 점검 (/healthz, /readyz).
+
+liveness는 프로세스가 요청을 처리할 수 있는지만 본다. readiness는 의존성을
+점검하며, 결과는 HEALTH_CACHE_SECONDS 동안 재사용하고 동시에 들어온 프로브는
+한 번의 점검을 공유한다.
+
+점검 상태는 ok / degraded / fail 중 하나다. DB, 이벤트 루프, 작업 대기열이
+fail이면 준비되지 않은 것(503)으로 본다. Google 장애는 모든 워커에 똑같이
+영향을 주므로 degraded로만 표시하고 워커를 빼지 않는다. Redis 이벤트 구독이
+끊긴 경우도 같은 이유로 degraded이며, 구독은 백그라운드에서 다시 연결된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict
+
+from sqlalchemy import text
+
+from app.db import session as db_session
+from app.services.appointment_event_hub import AppointmentEventHub
+from app.services.calendar_watch_service import AvailabilityRecomputeQueue
+from app.services.google_calendar_service import GoogleCalendarService
+from app.utils.circuit_breaker import CLOSED
+from app.utils.google_quota import GoogleQuotaScheduler
+from app.utils.single_flight import SingleFlight
+from app.variable import (
+    HEALTH_CACHE_SECONDS,
+    HEALTH_DB_TIMEOUT_SECONDS,
+    HEALTH_MAX_BACKLOG,
+    HEALTH_MAX_LOOP_LAG_SECONDS,
+)
+
+STATUS_OK = "ok"
+STATUS_DEGRADED = "degraded"
+STATUS_FAIL = "fail"
+
+
+class HealthService:
+    _started_at = time.monotonic()
+    _readiness = SingleFlight(ttl_seconds=HEALTH_CACHE_SECONDS, max_entries=1)
+
+    @classmethod
+    def liveness(cls) -> Dict[str, Any]:
+        return {
+            "status": STATUS_OK,
+            "uptime_seconds": round(time.monotonic() - cls._started_at, 3),
+        }
+
+    @classmethod
+    async def readiness(cls) -> Dict[str, Any]:
+        return await cls._readiness.do("readyz", cls._check_all)
+
+    @classmethod
+    async def _check_all(cls) -> Dict[str, Any]:
+        names = ("database", "event_loop", "google", "queues", "events")
+        probes = (
+            cls.check_database,
+            cls.check_event_loop,
+            cls.check_google,
+            cls.check_queues,
+            cls.check_events,
+        )
+        results = await asyncio.gather(*(cls._timed(probe) for probe in probes))
+        checks = dict(zip(names, results))
+
+        if any(
+            checks[name]["status"] == STATUS_FAIL
+            for name in ("database", "event_loop", "queues")
+        ):
+            status = "unavailable"
+        elif all(check["status"] == STATUS_OK for check in checks.values()):
+            status = STATUS_OK
+        else:
+            status = STATUS_DEGRADED
+
+        return {
+            "status": status,
+            "checked_at": datetime.now().isoformat(),
+            "checks": checks,
+        }
+
+    @staticmethod
+    async def _timed(
+        probe: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = await probe()
+        except Exception as exc:
+            result = {"status": STATUS_FAIL, "error": type(exc).__name__}
+        result.setdefault(
+            "latency_ms", round((time.perf_counter() - started) * 1000, 3)
+        )
+        return result
+
+    @staticmethod
+    async def check_database() -> Dict[str, Any]:
+        async def _select_one() -> None:
+            async with db_session.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        try:
+            await asyncio.wait_for(_select_one(), timeout=HEALTH_DB_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            return {"status": STATUS_FAIL, "error": "timeout"}
+        return {"status": STATUS_OK}
+
+    @staticmethod
+    async def check_event_loop() -> Dict[str, Any]:
+        # 한 번 양보한 뒤 다시 실행될 때까지 걸린 시간 = 앞에 밀린 콜백 처리 시간
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.sleep(0)
+        lag = loop.time() - started
+        return {
+            "status": STATUS_OK if lag <= HEALTH_MAX_LOOP_LAG_SECONDS else STATUS_FAIL,
+            "lag_ms": round(lag * 1000, 3),
+        }
+
+    @staticmethod
+    async def check_google() -> Dict[str, Any]:
+        # Google을 직접 호출하지 않고 브레이커·커넥션 풀 상태만 본다 (할당량 보호)
+        breakers = GoogleCalendarService.breaker_states()
+        pool = GoogleCalendarService.pool_stats()
+        # 열린 브레이커가 있거나 커넥션을 기다리는 요청이 있으면 degraded
+        healthy = not pool["requests_waiting"] and all(
+            state["state"] == CLOSED for state in breakers.values()
+        )
+        return {
+            "status": STATUS_OK if healthy else STATUS_DEGRADED,
+            "breakers": breakers,
+            "pool": pool,
+        }
+
+    @staticmethod
+    async def check_queues() -> Dict[str, Any]:
+        backlog = {
+            "availability_recompute": AvailabilityRecomputeQueue.pending_count(),
+            "google_quota": GoogleQuotaScheduler.queue_depth(),
+        }
+        total = sum(backlog.values())
+        return {
+            "status": STATUS_OK if total <= HEALTH_MAX_BACKLOG else STATUS_FAIL,
+            "backlog": backlog,
+        }
+
+    @staticmethod
+    async def check_events() -> Dict[str, Any]:
+        listener = AppointmentEventHub.listener_state()
+        if listener is None:
+            return {"status": STATUS_OK, "backend": "local"}
+        return {
+            "status": STATUS_OK if listener["connected"] else STATUS_DEGRADED,
+            "backend": "redis",
+            **listener,
+        }
@@ -0,0 +1,387 @@
+"""VOTING 약속 참여자 가용 시간 주기적 재동기화.
+
+앱 프로세스 안에서(RESYNC_SCHEDULER_ENABLED=true) 또는 별도 프로세스로 실행한다.
+여러 워커/프로세스가 실행해도 Redis(RATE_LIMIT_REDIS_URL) 리더 키를 가진 한
+곳만 재동기화한다. Redis가 없으면 앱 안의 스케줄러는 워커가 하나일 때만 시작한다.
+
+    cd backend && python -m app.services.resync_scheduler [--once]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import heapq
+import logging
+import secrets
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from fastapi_limiter import FastAPILimiter
+from sqlalchemy import func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import undefer
+
+from app.db.session import AsyncSessionLocal
+from app.models.appointment_model import Appointments, AppointmentDates, Participations
+from app.models.user_model import User
+from app.services.appointment_event_hub import AppointmentEventHub
+from app.services.appointment_service import AppointmentService
+from app.services.google_calendar_service import GoogleCalendarService
+from app.services.schedule_analyzer import ScheduleAnalyzer
+from app.services.user_service import UserService
+from app.utils.google_quota import PRIORITY_BACKGROUND, GoogleQuotaScheduler
+from app.utils.rate_limit import TokenBucketLimiter
+from app.variable import (
+    RESYNC_BATCH_SIZE,
+    RESYNC_FRESH_SECONDS,
+    RESYNC_GOOGLE_QPS,
+    RESYNC_INTERVAL_SECONDS,
+    RESYNC_SCHEDULER_ENABLED,
+    SERVER_RELOAD,
+    SERVER_WORKERS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# KEYS[1]: 리더 키 / ARGV: 워커 토큰, TTL(ms)
+# 이미 리더면 TTL을 연장하고, 비어 있으면 차지한다. 리더면 1
+_LEADER_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  redis.call('PEXPIRE', KEYS[1], ARGV[2])
+  return 1
+end
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+  return 1
+end
+return 0
+"""
+
+# KEYS[1]: 리더 키 / ARGV[1]: 워커 토큰 - 자신이 리더일 때만 해제
+_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(order=True)
+class ResyncCandidate:
+    # heapq는 최소 힙이므로 우선순위를 음수로 저장
+    sort_key: float
+    participation_id: int
+    appointment_id: int = field(compare=False)
+    user_id: str = field(compare=False)
+    staleness_seconds: float = field(compare=False)
+    days_until_start: int = field(compare=False)
+
+
+class ResyncScheduler:
+    """오래된 가용 시간부터 다시 계산하는 스케줄러.
+
+    우선순위 = 경과 시간 / (1 + 첫 후보 날짜까지 남은 일수). 최근에 갱신된
+    참여자는 건너뛰고, Google 호출은 전역 QPS 버킷을 넘지 않는다.
+    """
+
+    # 재동기화 한 건당 Google 호출 수 (토큰 갱신 + 이벤트 조회)
+    GOOGLE_CALLS_PER_RESYNC = 2
+    QPS_BUCKET_KEY = "google-qps:resync"
+    LEADER_KEY = "yakssok:resync-leader"
+
+    _leader_token = secrets.token_hex(8)
+
+    _task: Optional[asyncio.Task] = None
+    # 계산에 실패한 참여자는 RESYNC_FRESH_SECONDS 동안 다시 시도하지 않는다
+    _retry_after: Dict[int, datetime] = {}
+
+    @staticmethod
+    def priority(staleness_seconds: float, days_until_start: int) -> float:
+        return staleness_seconds / (1 + max(days_until_start, 0))
+
+    @staticmethod
+    async def collect_candidates(
+        db: AsyncSession, now: Optional[datetime] = None
+    ) -> List[ResyncCandidate]:
+        now = now or datetime.now()
+        today = now.date()
+        fresh_after = now - timedelta(seconds=RESYNC_FRESH_SECONDS)
+
+        # 약속별 가장 이른 (오늘 이후) 후보 날짜
+        earliest_dates = (
+            select(
+                AppointmentDates.appointment_id,
+                func.min(AppointmentDates.candidate_date).label("earliest_date"),
+            )
+            .where(AppointmentDates.candidate_date >= today)
+            .group_by(AppointmentDates.appointment_id)
+            .subquery()
+        )
+
+        # 가용 시간 본문은 읽지 않고 비어 있는지만 조회
+        result = await db.execute(
+            select(
+                Participations,
+                earliest_dates.c.earliest_date,
+                Participations.available_slots.is_(None).label("missing_slots"),
+            )
+            .join(Appointments, Appointments.id == Participations.appointment_id)
+            .join(
+                earliest_dates,
+                earliest_dates.c.appointment_id == Participations.appointment_id,
+            )
+            # 리프레시 토큰이 없는 사용자는 재동기화할 수 없으므로 후보에서 제외
+            # (남겨 두면 가장 오래된 후보로 배치를 차지한다)
+            .join(User, User.user_id == Participations.user_id)
+            .where(User.google_refresh_token.isnot(None))
+            .where(User.google_refresh_token != "")
+            .where(Appointments.status == "VOTING")
+            .where(Participations.status != "NOT_ATTENDING")
+            .where(
+                or_(
+                    Participations.available_slots.is_(None),
+                    Participations.updated_at.is_(None),
+                    Participations.updated_at < fresh_after,
+                )
+            )
+        )
+
+        heap: List[ResyncCandidate] = []
+        for participation, earliest_date, missing_slots in result.all():
+            updated_at = participation.updated_at
+            if missing_slots or updated_at is None:
+                # 가용 시간이 없으면 가장 오래된 것으로 취급
+                staleness = float(RESYNC_FRESH_SECONDS * 100)
+            else:
+                staleness = (now - updated_at).total_seconds()
+            days_until = ResyncScheduler._days_until(earliest_date, today)
+            heapq.heappush(
+                heap,
+                ResyncCandidate(
+                    sort_key=-ResyncScheduler.priority(staleness, days_until),
+                    participation_id=participation.id,
+                    appointment_id=participation.appointment_id,
+                    user_id=str(participation.user_id),
+                    staleness_seconds=staleness,
+                    days_until_start=days_until,
+                ),
+            )
+        return [heapq.heappop(heap) for _ in range(len(heap))]
+
+    @staticmethod
+    def _days_until(earliest_date, today: date) -> int:
+        if isinstance(earliest_date, str):
+            earliest_date = date.fromisoformat(earliest_date)
+        if isinstance(earliest_date, datetime):
+            earliest_date = earliest_date.date()
+        return (earliest_date - today).days
+
+    @staticmethod
+    async def _acquire_google_budget() -> None:
+        # 전역 Google QPS 예산 (Redis가 있으면 워커·프로세스 간 공유)
+        while True:
+            wait = await TokenBucketLimiter.consume(
+                ResyncScheduler.QPS_BUCKET_KEY,
+                ResyncScheduler.GOOGLE_CALLS_PER_RESYNC,
+                max(int(RESYNC_GOOGLE_QPS), ResyncScheduler.GOOGLE_CALLS_PER_RESYNC),
+                RESYNC_GOOGLE_QPS,
+            )
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    @staticmethod
+    async def run_once(db: AsyncSession, limit: int = RESYNC_BATCH_SIZE) -> dict:
+        candidates = await ResyncScheduler.collect_candidates(db)
+
+        updated = 0
+        unchanged = 0
+        failed = 0
+        users: Dict[str, object] = {}
+        candidate_dates: Dict[int, List[date]] = {}
+
+        now = datetime.now()
+        retry_after = ResyncScheduler._retry_after
+        for participation_id, until in list(retry_after.items()):
+            if until <= now:
+                retry_after.pop(participation_id, None)
+        candidates = [
+            candidate
+            for candidate in candidates
+            if candidate.participation_id not in retry_after
+        ]
+
+        processed = 0
+        for candidate in candidates:
+            if processed >= limit:
+                break
+            if candidate.user_id not in users:
+                users[candidate.user_id] = await UserService.get_user_by_google_id(
+                    candidate.user_id, db
+                )
+            user = users[candidate.user_id]
+            if not user or not getattr(user, "google_refresh_token", None):
+                # 조회 뒤 토큰이 사라진 경우: 배치 한도에 세지 않고 잠시 제외
+                retry_after[candidate.participation_id] = now + timedelta(
+                    seconds=RESYNC_FRESH_SECONDS
+                )
+                continue
+            processed += 1
+
+            if candidate.appointment_id not in candidate_dates:
+                dates = await AppointmentService.get_appointment_dates(
+                    candidate.appointment_id, db
+                )
+                candidate_dates[candidate.appointment_id] = [
+                    appointment_date.candidate_date for appointment_date in dates
+                ]
+
+            await ResyncScheduler._acquire_google_budget()
+            with GoogleQuotaScheduler.context(priority=PRIORITY_BACKGROUND):
+                available_slots = await ScheduleAnalyzer.calculate_available_slots(
+                    user=user,
+                    candidate_dates=candidate_dates[candidate.appointment_id],
+                )
+            if not available_slots:
+                failed += 1
+                retry_after[candidate.participation_id] = now + timedelta(
+                    seconds=RESYNC_FRESH_SECONDS
+                )
+                continue
+
+            participation = await db.get(
+                Participations,
+                candidate.participation_id,
+                options=[undefer(Participations.available_slots)],
+            )
+            appointment = await db.get(Appointments, candidate.appointment_id)
+            if participation is None or appointment is None:
+                continue
+
+            # 내용이 같으면 버전을 올리지 않는다 (ETag·인덱스 캐시·SSE 유지)
+            if not AppointmentService._store_available_slots(
+                participation, available_slots
+            ):
+                await db.commit()
+                unchanged += 1
+                continue
+            await AppointmentService._bump_version(appointment.id, db)
+            await db.commit()
+            await db.refresh(appointment)
+            await AppointmentEventHub.publish(
+                appointment.invite_link,
+                AppointmentService._build_availability_event(
+                    "availability_updated", appointment
+                ),
+            )
+            updated += 1
+
+        return {
+            "candidates": len(candidates),
+            "updated": updated,
+            "unchanged": unchanged,
+            "failed": failed,
+        }
+
+    @staticmethod
+    async def acquire_leadership(
+        interval_seconds: float = RESYNC_INTERVAL_SECONDS,
+    ) -> bool:
+        # Redis가 없으면 단일 실행만 허용되므로(start 참고) 항상 리더
+        redis = FastAPILimiter.redis
+        if redis is None:
+            return True
+        # 한 번의 실행이 길어져도 다음 주기 전에 키가 풀리지 않도록 여유를 둔다
+        ttl_ms = int((interval_seconds * 2 + 60) * 1000)
+        try:
+            acquired = await redis.eval(
+                _LEADER_LUA,
+                1,
+                ResyncScheduler.LEADER_KEY,
+                ResyncScheduler._leader_token,
+                ttl_ms,
+            )
+        except Exception:
+            LOGGER.exception("Resync leader election failed, skipping this pass")
+            return False
+        return bool(acquired)
+
+    @staticmethod
+    async def release_leadership() -> None:
+        redis = FastAPILimiter.redis
+        if redis is None:
+            return
+        try:
+            await redis.eval(
+                _RELEASE_LUA,
+                1,
+                ResyncScheduler.LEADER_KEY,
+                ResyncScheduler._leader_token,
+            )
+        except Exception:
+            LOGGER.warning("Failed to release resync leader key", exc_info=True)
+
+    @staticmethod
+    async def run_forever(interval_seconds: float = RESYNC_INTERVAL_SECONDS) -> None:
+        while True:
+            try:
+                if await ResyncScheduler.acquire_leadership(interval_seconds):
+                    async with AsyncSessionLocal() as db:
+                        result = await ResyncScheduler.run_once(db)
+                    LOGGER.info("Availability resync finished: %s", result)
+            except Exception:
+                LOGGER.exception("Availability resync failed")
+            await asyncio.sleep(interval_seconds)
+
+    @classmethod
+    async def start(cls) -> None:
+        if not RESYNC_SCHEDULER_ENABLED or cls._task is not None:
+            return
+        workers = 1 if SERVER_RELOAD else SERVER_WORKERS
+        if FastAPILimiter.redis is None and workers > 1:
+            # 리더 선출 수단이 없으면 워커마다 같은 재동기화를 중복 실행한다
+            LOGGER.error(
+                "Resync scheduler not started: %d workers without "
+                "RATE_LIMIT_REDIS_URL; set it or run "
+                "`python -m app.services.resync_scheduler` separately",
+                workers,
+            )
+            return
+        cls._task = asyncio.create_task(cls.run_forever())
+
+    @classmethod
+    async def stop(cls) -> None:
+        task = cls._task
+        cls._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            await cls.release_leadership()
+
+
+async def _main(once: bool) -> None:
+    await TokenBucketLimiter.start()
+    try:
+        if once:
+            async with AsyncSessionLocal() as db:
+                result = await ResyncScheduler.run_once(db)
+            LOGGER.info("Availability resync finished: %s", result)
+        else:
+            await ResyncScheduler.run_forever()
+    finally:
+        await ResyncScheduler.release_leadership()
+        await GoogleQuotaScheduler.stop()
+        await GoogleCalendarService.close_client()
+        await TokenBucketLimiter.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="VOTING 약속 가용 시간 재동기화")
+    parser.add_argument("--once", action="store_true", help="한 번만 실행하고 종료")
+    asyncio.run(_main(parser.parse_args().once))
@@ -1,16 +1,40 @@
+import base64
+import bisect
+import heapq
+import json
+import logging
 from datetime import date, datetime, time, timedelta
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Iterable, Tuple
 from collections import defaultdict
 
 from app.models.user_model import User
 from app.services.google_calendar_service import GoogleCalendarService
+from app.utils import availability_format
+from app.utils.google_quota import GoogleQuotaScheduler
+from app.variable import AVAILABILITY_STORAGE_FORMAT
+
+LOGGER = logging.getLogger(__name__)
+
+# ((날짜, ((시작 분, 종료 분), ...)), ...) - 파싱이 끝난 참여자 가용 시간
+IntervalSlots = Tuple[Tuple[str, Tuple[Tuple[int, int], ...]], ...]
 
 
 class ScheduleAnalyzer:
     DEFAULT_WORK_START = "00:00"
     DEFAULT_WORK_END = "23:59"
     MIN_SLOT_DURATION_MINUTES = 30
-    GRID_INTERVAL_MINUTES = 15
+    GRID_INTERVAL_MINUTES = availability_format.GRID_INTERVAL_MINUTES
+    AVAILABILITY_FORMAT_BITMASK = availability_format.AVAILABILITY_FORMAT_BITMASK
+    _MINUTES_PER_DAY = availability_format.MINUTES_PER_DAY
+
+    # 저장 포맷 해석은 스키마에서도 쓰므로 app.utils.availability_format에 둔다
+    decode_available_slots = staticmethod(availability_format.decode_available_slots)
+    _load_availability_payload = staticmethod(
+        availability_format.load_availability_payload
+    )
+    _decode_mask = staticmethod(availability_format.decode_mask)
+    _mask_to_ranges = staticmethod(availability_format.mask_to_ranges)
+    _format_minutes = staticmethod(availability_format.format_minutes)
 
     @staticmethod
     async def calculate_available_slots(
@@ -19,15 +43,23 @@ class ScheduleAnalyzer:
         work_hours_start: str = DEFAULT_WORK_START,
         work_hours_end: str = DEFAULT_WORK_END,
         timezone: str = "Asia/Seoul",
+        previous: Any = None,
     ) -> Optional[dict]:
+        """
+        Google 캘린더 일정을 기준으로 후보 날짜별 가용 시간 계산
+
+        Google 호출이 실패하면(장애로 브레이커가 열린 경우 포함) previous로 받은
+        마지막 가용 시간을 "stale": true로 표시해 돌려주고, 없으면 None.
+        """
         if not candidate_dates:
             return None
 
         try:
-            # Access token 갱신
-            access_token = await GoogleCalendarService.refresh_access_token(
-                user.google_refresh_token
-            )
+            # Access token 갱신 (호출은 이 사용자의 Google 할당량으로 처리)
+            with GoogleQuotaScheduler.context(user_id=user.user_id):
+                access_token = await GoogleCalendarService.refresh_access_token(
+                    user.google_refresh_token
+                )
 
             # 시간 범위 설정
             time_min = (
@@ -38,13 +70,15 @@ class ScheduleAnalyzer:
             )
 
             # Google Calendar 이벤트 조회
-            calendar_response = await GoogleCalendarService.list_primary_events(
-                access_token=access_token,
-                time_min=time_min,
-                time_max=time_max,
-                max_results=250,
-                time_zone=timezone,
-            )
+            with GoogleQuotaScheduler.context(user_id=user.user_id):
+                calendar_response = await GoogleCalendarService.list_primary_events(
+                    access_token=access_token,
+                    time_min=time_min,
+                    time_max=time_max,
+                    max_results=250,
+                    time_zone=timezone,
+                    cache_key=str(user.user_id),
+                )
 
             events = calendar_response.get("events", [])
 
@@ -80,8 +114,46 @@ class ScheduleAnalyzer:
                 "calculated_at": datetime.now().isoformat(),
             }
 
-        except Exception:
+        except Exception as exc:
+            LOGGER.warning(
+                "Availability calculation failed for user %s: %r",
+                getattr(user, "user_id", None),
+                exc,
+            )
+            return ScheduleAnalyzer.mark_stale(previous)
+
+    @staticmethod
+    def mark_stale(previous: Any) -> Optional[dict]:
+        # 마지막으로 저장된 가용 시간을 오래된 값으로 표시
+        try:
+            decoded = ScheduleAnalyzer.decode_available_slots(previous)
+        except (TypeError, ValueError):
+            return None
+        if not decoded:
             return None
+        return {**decoded, "stale": True}
+
+    @staticmethod
+    def is_stale(available_slots: Optional[dict]) -> bool:
+        return bool(available_slots and available_slots.get("stale"))
+
+    @staticmethod
+    def availability_unchanged(stored: Any, available_slots: dict) -> bool:
+        """
+        새로 계산한 가용 시간이 저장된 값과 같은지 비교 (calculated_at 제외)
+
+        저장 포맷(비트마스크 반올림 등)을 거친 결과끼리 비교한다.
+        """
+        try:
+            before = ScheduleAnalyzer.decode_available_slots(stored)
+        except (TypeError, ValueError):
+            return False
+        if not before:
+            return False
+        after = ScheduleAnalyzer.decode_available_slots(
+            ScheduleAnalyzer.dump_available_slots(available_slots)
+        )
+        return {**before, "calculated_at": None} == {**after, "calculated_at": None}
 
     @staticmethod
     def _group_events_by_date(
@@ -204,7 +276,10 @@ class ScheduleAnalyzer:
 
     @staticmethod
     def find_common_slots(
-        user_slots: List[dict], min_duration_minutes: int
+        user_slots: List[dict],
+        min_duration_minutes: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         여러 사용자의 가용시간 교집합 계산
@@ -212,52 +287,159 @@ class ScheduleAnalyzer:
         1. 15분 단위 그리드로 변환
         2. 각 시간대별 참여 가능 인원 카운트
         3. 연속된 블록 병합
-        4. 정렬: 참여 인원 DESC, 시간 길이 DESC
+        4. 정렬: 참여 인원 DESC, 시간 길이 DESC (동률은 날짜, 시작 시간 순)
+
+        limit / cursor가 주어지면 cursor 이후 상위 limit개만 힙으로 선택한다.
         """
         if not user_slots:
             return []
 
         total_participants = len(user_slots)
+        time_grid = ScheduleAnalyzer._build_time_grid(user_slots)
 
-        time_grid: Dict[str, Dict[str, Set[int]]] = defaultdict(
-            lambda: defaultdict(set)
+        # 연속된 블록 찾기 및 병합
+        optimal_slots = []
+        for date_str, time_slots in time_grid.items():
+            merged_blocks = ScheduleAnalyzer._merge_consecutive_time_blocks(
+                date_str, time_slots, min_duration_minutes, total_participants
+            )
+            optimal_slots.extend(merged_blocks)
+
+        return ScheduleAnalyzer.select_top_slots(optimal_slots, limit, cursor)
+
+    @staticmethod
+    def build_block_index(user_slots: List[dict]) -> "MaximalBlockIndex":
+        """
+        최소 길이·시간대 필터와 무관한 최대 블록 인덱스 생성
+
+        참여자 집합이 같은 연속 구간(최대 블록)을 길이 제한 없이 한 번만
+        계산해 두고, 이후 min_duration / 시간대 조건은 인덱스 조회로 처리한다.
+        """
+        return ScheduleAnalyzer.build_block_index_from_intervals(
+            [
+                (
+                    user_data["user_id"],
+                    ScheduleAnalyzer._slots_to_intervals(user_data["slots"]),
+                )
+                for user_data in user_slots
+            ]
         )
 
-        for user_data in user_slots:
-            user_id = user_data["user_id"]
-            slots = user_data["slots"]
+    @staticmethod
+    def build_block_index_from_intervals(
+        user_intervals: List[Tuple[Any, IntervalSlots]],
+    ) -> "MaximalBlockIndex":
+        # build_block_index와 동일, 입력은 (user_id, 분 단위 구간) 목록
+        total_participants = len(user_intervals)
+        time_grid = ScheduleAnalyzer._build_time_grid_from_intervals(user_intervals)
+        grid = ScheduleAnalyzer.GRID_INTERVAL_MINUTES
+
+        grid_aligned = all(
+            ScheduleAnalyzer._to_minutes(time_str) % grid == 0
+            for time_slots in time_grid.values()
+            for time_str in time_slots
+        )
 
-            for slot in slots:
-                date_str = slot["date"]
-                available_times = slot["available_times"]
+        blocks = []
+        for date_str, time_slots in time_grid.items():
+            for slot in ScheduleAnalyzer._merge_consecutive_time_blocks(
+                date_str, time_slots, 0, total_participants
+            ):
+                first_cell = ScheduleAnalyzer._to_minutes(slot["start_time"])
+                end = ScheduleAnalyzer._to_minutes(slot["end_time"])
+                last_cell = (end - 1) // grid * grid
+                blocks.append((slot["duration_minutes"], first_cell, last_cell, slot))
+
+        # 인덱스로 답할 수 없는 조회(그리드 비정렬 데이터·시간대 필터)는 원본으로
+        # 재계산하므로 입력 구간도 함께 보관 (캐시된 튜플을 그대로 참조)
+        return MaximalBlockIndex(
+            blocks, total_participants, user_intervals, grid_aligned
+        )
 
-                for time_range in available_times:
-                    start = ScheduleAnalyzer._parse_time(time_range["start"])
-                    end = ScheduleAnalyzer._parse_time(time_range["end"])
+    @staticmethod
+    def _build_time_grid(user_slots: List[dict]) -> Dict[str, Dict[str, Set[int]]]:
+        return ScheduleAnalyzer._build_time_grid_from_intervals(
+            (
+                user_data["user_id"],
+                ScheduleAnalyzer._slots_to_intervals(user_data["slots"]),
+            )
+            for user_data in user_slots
+        )
+
+    @staticmethod
+    def _build_time_grid_from_intervals(
+        user_intervals: Iterable[Tuple[Any, IntervalSlots]],
+    ) -> Dict[str, Dict[str, Set[int]]]:
+        # 날짜 -> 15분 칸 -> 참여 가능 사용자 집합
+        time_grid: Dict[str, Dict[str, Set[int]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        grid = ScheduleAnalyzer.GRID_INTERVAL_MINUTES
+        last_minute = ScheduleAnalyzer._MINUTES_PER_DAY - 1
 
-                    # 15분 단위로 그리드 채우기
+        for user_id, slots in user_intervals:
+            for date_str, intervals in slots:
+                for start, end in intervals:
+                    # 15분 단위로 그리드 채우기 (자정을 넘으면 23:59로 제한)
                     current = start
                     while current < end:
-                        time_str = current.strftime("%H:%M")
-                        time_grid[date_str][time_str].add(user_id)
-                        current = ScheduleAnalyzer._add_minutes(
-                            current, ScheduleAnalyzer.GRID_INTERVAL_MINUTES
-                        )
+                        time_grid[date_str][
+                            ScheduleAnalyzer._format_minutes(current)
+                        ].add(user_id)
+                        current = min(current + grid, last_minute)
 
-        # 연속된 블록 찾기 및 병합
-        optimal_slots = []
-        for date_str, time_slots in time_grid.items():
-            merged_blocks = ScheduleAnalyzer._merge_consecutive_time_blocks(
-                date_str, time_slots, min_duration_minutes, total_participants
-            )
-            optimal_slots.extend(merged_blocks)
+        return time_grid
+
+    @staticmethod
+    def select_top_slots(
+        slots: List[Dict[str, Any]],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        # cursor 이후 블록 중 상위 limit개만 선택 (limit이 있으면 전체 정렬 생략)
+        sort_key = ScheduleAnalyzer._slot_sort_key
+        if cursor is not None:
+            after = ScheduleAnalyzer.decode_slot_cursor(cursor)
+            slots = [slot for slot in slots if sort_key(slot) > after]
+
+        if limit is None:
+            return sorted(slots, key=sort_key)
+        return heapq.nsmallest(limit, slots, key=sort_key)
+
+    @staticmethod
+    def _slot_sort_key(slot: Dict[str, Any]) -> tuple:
+        return (
+            -slot["participant_count"],
+            -slot["duration_minutes"],
+            slot["date"],
+            slot["start_time"],
+        )
 
-        # 정렬: 참여 인원 DESC, 시간 길이 DESC
-        optimal_slots.sort(
-            key=lambda x: (-x["participant_count"], -x["duration_minutes"])
+    @staticmethod
+    def encode_slot_cursor(slot: Dict[str, Any]) -> str:
+        # 마지막으로 전달한 블록의 정렬 키를 커서로 사용 (데이터가 바뀌어도 순서 안정)
+        raw = json.dumps(
+            [
+                slot["participant_count"],
+                slot["duration_minutes"],
+                str(slot["date"]),
+                slot["start_time"],
+            ],
+            separators=(",", ":"),
         )
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
 
-        return optimal_slots
+    @staticmethod
+    def decode_slot_cursor(cursor: str) -> tuple:
+        try:
+            count, duration, date_str, start_time = json.loads(
+                base64.urlsafe_b64decode(cursor.encode("ascii"))
+            )
+            if not isinstance(count, int) or not isinstance(duration, int):
+                raise TypeError
+            return (-count, -duration, str(date_str), str(start_time))
+        except (ValueError, TypeError) as exc:
+            raise ValueError("invalid_cursor") from exc
 
     @staticmethod
     def _merge_consecutive_time_blocks(
@@ -409,3 +591,228 @@ class ScheduleAnalyzer:
                 merged.append((current_start, current_end))
 
         return merged
+
+    @staticmethod
+    def dump_available_slots(available_slots: dict) -> str:
+        # 설정된 저장 포맷으로 가용 시간 직렬화
+        if AVAILABILITY_STORAGE_FORMAT == "bitmask":
+            return ScheduleAnalyzer.encode_available_slots(available_slots)
+        return json.dumps(available_slots, ensure_ascii=False)
+
+    @staticmethod
+    def encode_available_slots(available_slots: dict) -> str:
+        """
+        가용 시간을 날짜별 고정 길이 비트마스크로 압축
+
+        그리드 한 칸(GRID_INTERVAL_MINUTES)이 1비트이며, 칸 전체가 가용할 때만
+        비트를 켠다. 시작은 올림, 종료는 내림으로 맞추고 "23:59"는 자정으로 본다.
+        """
+        grid = ScheduleAnalyzer.GRID_INTERVAL_MINUTES
+        cell_count = ScheduleAnalyzer._MINUTES_PER_DAY // grid
+        mask_bytes = (cell_count + 7) // 8
+
+        encoded_dates: Dict[str, str] = {}
+        for slot in available_slots.get("slots", []):
+            mask = 0
+            for time_range in slot.get("available_times", []):
+                start = ScheduleAnalyzer._to_minutes(time_range["start"])
+                end = ScheduleAnalyzer._to_minutes(time_range["end"])
+                if end >= ScheduleAnalyzer._MINUTES_PER_DAY - 1:
+                    end = ScheduleAnalyzer._MINUTES_PER_DAY
+
+                first_cell = -(-start // grid)
+                last_cell = end // grid
+                if last_cell > first_cell:
+                    mask |= ((1 << (last_cell - first_cell)) - 1) << first_cell
+
+            if mask:
+                encoded_dates[slot["date"]] = base64.b64encode(
+                    mask.to_bytes(mask_bytes, "little")
+                ).decode("ascii")
+
+        payload = {
+            "format": ScheduleAnalyzer.AVAILABILITY_FORMAT_BITMASK,
+            "timezone": available_slots.get("timezone"),
+            "calculated_at": available_slots.get("calculated_at"),
+            "grid_minutes": grid,
+            "slots": encoded_dates,
+        }
+        if available_slots.get("stale"):
+            payload["stale"] = True
+        return json.dumps(payload, separators=(",", ":"))
+
+    @staticmethod
+    def decode_available_dates(raw: Any) -> Set[str]:
+        # 가용 시간이 하나라도 있는 날짜만 추출 (슬롯 전개 없이)
+        data = ScheduleAnalyzer._load_availability_payload(raw)
+        if data is None:
+            return set()
+
+        if data.get("format") == ScheduleAnalyzer.AVAILABILITY_FORMAT_BITMASK:
+            return {
+                date_str
+                for date_str, encoded in data.get("slots", {}).items()
+                if ScheduleAnalyzer._decode_mask(encoded)
+            }
+
+        return {
+            slot["date"]
+            for slot in data.get("slots", [])
+            if slot.get("available_times")
+        }
+
+    @staticmethod
+    def decode_available_intervals(raw: Any) -> Optional[IntervalSlots]:
+        """
+        저장된 가용 시간을 ((날짜, ((시작 분, 종료 분), ...)), ...) 형태로 복원
+
+        비트마스크는 시각 문자열을 거치지 않고 바로 구간으로 바꾼다. 종료가
+        자정이면 decode_available_slots와 같게 23:59(1439분)로 맞춘다.
+        """
+        data = ScheduleAnalyzer._load_availability_payload(raw)
+        if data is None:
+            return None
+        if data.get("format") != ScheduleAnalyzer.AVAILABILITY_FORMAT_BITMASK:
+            return ScheduleAnalyzer._slots_to_intervals(data["slots"])
+
+        grid = data.get("grid_minutes") or ScheduleAnalyzer.GRID_INTERVAL_MINUTES
+        last_minute = ScheduleAnalyzer._MINUTES_PER_DAY - 1
+        slots = []
+        for date_str in sorted(data.get("slots", {})):
+            mask = ScheduleAnalyzer._decode_mask(data["slots"][date_str])
+            intervals = tuple(
+                (start, min(end, last_minute))
+                for start, end in ScheduleAnalyzer._mask_to_ranges(mask, grid)
+            )
+            if intervals:
+                slots.append((date_str, intervals))
+        return tuple(slots)
+
+    @staticmethod
+    def _slots_to_intervals(slots: List[dict]) -> IntervalSlots:
+        to_minutes = ScheduleAnalyzer._to_minutes
+        return tuple(
+            (
+                slot["date"],
+                tuple(
+                    (to_minutes(time_range["start"]), to_minutes(time_range["end"]))
+                    for time_range in slot["available_times"]
+                ),
+            )
+            for slot in slots
+        )
+
+    @staticmethod
+    def _intervals_to_slots(slots: IntervalSlots) -> List[dict]:
+        format_minutes = ScheduleAnalyzer._format_minutes
+        return [
+            {
+                "date": date_str,
+                "available_times": [
+                    {"start": format_minutes(start), "end": format_minutes(end)}
+                    for start, end in intervals
+                ],
+            }
+            for date_str, intervals in slots
+        ]
+
+    @staticmethod
+    def _to_minutes(time_str: str) -> int:
+        parsed = ScheduleAnalyzer._parse_time(time_str)
+        return parsed.hour * 60 + parsed.minute
+
+
+class MaximalBlockIndex:
+    """
+    약속 버전별 최대 블록 인덱스
+
+    블록을 길이 오름차순으로 보관해 min_duration은 이분 탐색으로, 시간대 필터는
+    블록 잘라내기로 처리한다. 결과는 find_common_slots와 동일하다.
+    """
+
+    def __init__(
+        self,
+        blocks: List[tuple],
+        total_participants: int,
+        user_intervals: List[Tuple[Any, IntervalSlots]],
+        grid_aligned: bool = True,
+    ):
+        self._blocks = sorted(blocks, key=lambda block: block[0])
+        self._durations = [block[0] for block in self._blocks]
+        self.total_participants = total_participants
+        self.user_intervals = user_intervals
+        self.grid_aligned = grid_aligned
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def user_slots(self) -> List[dict]:
+        # query()가 None일 때 재계산용 원본 (date / available_times 형태)
+        return [
+            {
+                "user_id": user_id,
+                "slots": ScheduleAnalyzer._intervals_to_slots(slots),
+            }
+            for user_id, slots in self.user_intervals
+        ]
+
+    def query(
+        self,
+        min_duration_minutes: int,
+        time_range_start: Optional[str] = None,
+        time_range_end: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        조건에 맞는 블록 조회
+
+        인덱스로 정확히 답할 수 없는 경우(그리드 비정렬) None을 반환하며,
+        시간 형식이 잘못되면 ValueError를 던진다.
+        """
+        grid = ScheduleAnalyzer.GRID_INTERVAL_MINUTES
+        candidates = self._blocks[
+            bisect.bisect_left(self._durations, min_duration_minutes) :
+        ]
+
+        if not time_range_start and not time_range_end:
+            slots = [block[3] for block in candidates]
+            return ScheduleAnalyzer.select_top_slots(slots, limit, cursor)
+
+        filter_start = self._parse_filter_minutes(time_range_start, "00:00")
+        filter_end = self._parse_filter_minutes(time_range_end, "23:59")
+        if not self.grid_aligned or filter_start % grid:
+            return None
+
+        # 필터 범위 안에서 시작하는 칸만 남긴다 (기존 시간대 필터와 동일한 의미)
+        last_cell_limit = (filter_end - 1) // grid * grid
+        slots = []
+        for duration, first_cell, last_cell, slot in candidates:
+            clipped_first = max(first_cell, filter_start)
+            clipped_last = min(last_cell, last_cell_limit)
+            if clipped_first > clipped_last:
+                continue
+            if clipped_first == first_cell and clipped_last == last_cell:
+                slots.append(slot)
+                continue
+
+            end = min(clipped_last + grid, ScheduleAnalyzer._MINUTES_PER_DAY - 1)
+            clipped_duration = end - clipped_first
+            if clipped_duration < min_duration_minutes:
+                continue
+            slots.append(
+                {
+                    **slot,
+                    "start_time": ScheduleAnalyzer._format_minutes(clipped_first),
+                    "end_time": ScheduleAnalyzer._format_minutes(end),
+                    "duration_minutes": clipped_duration,
+                }
+            )
+
+        return ScheduleAnalyzer.select_top_slots(slots, limit, cursor)
+
+    @staticmethod
+    def _parse_filter_minutes(value: Optional[str], default: str) -> int:
+        parsed = datetime.strptime(value or default, "%H:%M").time()
+        return parsed.hour * 60 + parsed.minute
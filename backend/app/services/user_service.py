@@ -11,6 +11,15 @@ class UserService:
         result = await db.execute(select(User).where(User.user_id == google_id))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_users_by_google_ids(google_ids, db: AsyncSession) -> dict:
+        # 여러 구글아이디를 한 번에 조회 (user_id -> User)
+        unique_ids = {str(google_id) for google_id in google_ids}
+        if not unique_ids:
+            return {}
+        result = await db.execute(select(User).where(User.user_id.in_(unique_ids)))
+        return {user.user_id: user for user in result.scalars().all()}
+
     @staticmethod
     async def create_user(
         google_id: str, email: str, name: str, refresh_token: str, db: AsyncSession
@@ -0,0 +1,72 @@
+import secrets
+from typing import Any, Optional
+
+from fastapi import Depends, Header, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.models.user_model import User
+from app.services.user_service import UserService
+from app.utils.google_quota import GoogleQuotaScheduler
+from app.utils.jwt import decode_token_cached
+from app.variable import ADMIN_TOKEN
+
+_bearer = HTTPBearer(auto_error=False)
+
+_UNLOADED = object()
+
+
+class AuthContext:
+    """요청 단위 인증 정보.
+
+    토큰은 의존성에서 한 번만 검증하고, User는 처음 필요할 때 한 번만 조회해
+    같은 요청 안에서 재사용한다.
+    """
+
+    def __init__(self, payload: dict, db: AsyncSession, user: Any = _UNLOADED):
+        self.payload = payload
+        self.user_id: str = str(payload["sub"])
+        self._db = db
+        self._user = user
+
+    def __getitem__(self, key: str) -> Any:
+        # 기존 current_user["sub"] 형태 호환
+        return self.payload[key]
+
+    async def get_user(self) -> Optional[User]:
+        if self._user is _UNLOADED:
+            self._user = await UserService.get_user_by_google_id(self.user_id, self._db)
+        return self._user
+
+
+async def get_auth_context(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+    db: AsyncSession = Depends(get_db),
+) -> AuthContext:
+    if credentials is None or not credentials.credentials:
+        raise HTTPException(
+            status_code=401,
+            detail="인증 토큰이 필요합니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    payload = decode_token_cached(credentials.credentials)
+    if not payload or not payload.get("sub"):
+        raise HTTPException(
+            status_code=401,
+            detail="유효하지 않은 토큰입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # 이 요청에서 나가는 Google 호출은 인증된 사용자의 할당량으로 처리
+    GoogleQuotaScheduler.bind_user(payload["sub"])
+    return AuthContext(payload, db)
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    # ADMIN_TOKEN이 없으면 관리자 엔드포인트 자체를 숨긴다
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="admin_token_required")
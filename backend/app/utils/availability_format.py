@@ -0,0 +1,83 @@
+"""저장된 가용 시간(JSON / 비트마스크) 해석.
+
+스키마 검증과 일정 분석이 함께 쓰므로 서비스 계층에 두지 않는다.
+"""
+
+import base64
+import json
+from typing import Any, List, Optional, Tuple
+
+# 그리드 한 칸(분) = 비트마스크 1비트
+GRID_INTERVAL_MINUTES = 15
+AVAILABILITY_FORMAT_BITMASK = 2
+MINUTES_PER_DAY = 24 * 60
+
+
+def load_availability_payload(raw: Any) -> Optional[dict]:
+    if not raw:
+        return None
+    if isinstance(raw, (str, bytes)):
+        return json.loads(raw)
+    return raw
+
+
+def decode_mask(encoded: str) -> int:
+    return int.from_bytes(base64.b64decode(encoded), "little")
+
+
+def mask_to_ranges(mask: int, grid: int) -> List[Tuple[int, int]]:
+    # 연속된 비트 구간을 (시작 분, 종료 분) 목록으로 변환
+    ranges = []
+    cell = 0
+    while mask:
+        if mask & 1:
+            run_start = cell
+            while mask & 1:
+                mask >>= 1
+                cell += 1
+            ranges.append((run_start * grid, cell * grid))
+        else:
+            skip = (mask & -mask).bit_length() - 1
+            mask >>= skip
+            cell += skip
+    return ranges
+
+
+def format_minutes(minutes: int) -> str:
+    # 자정(24:00)은 기존 포맷과 동일하게 23:59로 표기
+    if minutes >= MINUTES_PER_DAY:
+        return "23:59"
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def decode_available_slots(raw: Any) -> Optional[dict]:
+    """
+    저장된 가용 시간을 기존 JSON 형태(date / available_times)로 복원
+
+    포맷 표식이 없는 기존 JSON은 그대로 반환한다.
+    """
+    data = load_availability_payload(raw)
+    if data is None:
+        return None
+    if data.get("format") != AVAILABILITY_FORMAT_BITMASK:
+        return data
+
+    grid = data.get("grid_minutes") or GRID_INTERVAL_MINUTES
+    slots = []
+    for date_str in sorted(data.get("slots", {})):
+        mask = decode_mask(data["slots"][date_str])
+        available_times = [
+            {"start": format_minutes(start), "end": format_minutes(end)}
+            for start, end in mask_to_ranges(mask, grid)
+        ]
+        if available_times:
+            slots.append({"date": date_str, "available_times": available_times})
+
+    decoded = {
+        "timezone": data.get("timezone"),
+        "slots": slots,
+        "calculated_at": data.get("calculated_at"),
+    }
+    if data.get("stale"):
+        decoded["stale"] = True
+    return decoded
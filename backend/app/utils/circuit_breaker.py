@@ -0,0 +1,150 @@
+"""외부 API 호출용 서킷 브레이커.
+
+- CLOSED: 최근 호출 창에서 실패(기준보다 느린 호출 포함) 비율이 기준을 넘으면 OPEN
+- OPEN: open_seconds 동안 호출을 보내지 않고 즉시 CircuitOpenError
+- HALF_OPEN: 탐색 호출을 half_open_calls 개까지만 보내 모두 성공하면 CLOSED,
+  하나라도 실패하면 다시 OPEN
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from fastapi import HTTPException
+
+LOGGER = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(HTTPException):
+    """브레이커가 열려 호출을 보내지 않았을 때 (503 + Retry-After)."""
+
+    def __init__(self, name: str, retry_after: float, detail: str):
+        super().__init__(
+            status_code=503,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        *,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_seconds: Optional[float] = None,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+        error_detail: str = "service_unavailable",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.min_calls = max(1, min_calls)
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = max(1, half_open_calls)
+        self.error_detail = error_detail
+        self._clock = clock
+        # True = 실패
+        self._outcomes: Deque[bool] = deque(maxlen=max(window, self.min_calls))
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self.opened_count = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+            self._probe_successes = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+
+    def before_call(self) -> bool:
+        """호출 허용 여부 확인. HALF_OPEN에서 보내는 탐색 호출이면 True."""
+        state = self.state
+        if state == OPEN or (
+            state == HALF_OPEN and self._probes >= self.half_open_calls
+        ):
+            raise CircuitOpenError(
+                self.name, self.retry_after() or self.open_seconds, self.error_detail
+            )
+        if state == HALF_OPEN:
+            self._probes += 1
+            return True
+        return False
+
+    def record(self, elapsed: float, failed: bool = False, probe: bool = False) -> None:
+        if self.slow_call_seconds is not None and elapsed >= self.slow_call_seconds:
+            failed = True
+
+        if probe:
+            self._probes = max(0, self._probes - 1)
+            if self._state != HALF_OPEN:
+                return
+            if failed:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_calls:
+                self._close()
+            return
+
+        # 열리기 전에 출발한 호출의 결과는 상태에 반영하지 않는다
+        if self._state != CLOSED:
+            return
+        self._outcomes.append(failed)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and sum(self._outcomes) / len(self._outcomes) >= self.failure_rate
+        ):
+            self._open()
+
+    def release(self, probe: bool) -> None:
+        # 취소된 호출은 성공/실패로 세지 않고 탐색 슬롯만 반환
+        if probe:
+            self._probes = max(0, self._probes - 1)
+
+    def _open(self) -> None:
+        if self._state != OPEN:
+            self.opened_count += 1
+            LOGGER.warning("Circuit %s opened for %.0fs", self.name, self.open_seconds)
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+    def _close(self) -> None:
+        LOGGER.info("Circuit %s closed", self.name)
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._probes = 0
+        self._probe_successes = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        calls = len(self._outcomes)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failure_rate": (sum(self._outcomes) / calls) if calls else 0.0,
+            "retry_after_seconds": round(self.retry_after(), 3),
+            "opened_count": self.opened_count,
+        }
@@ -0,0 +1,125 @@
+"""CPU를 오래 쓰는 계산을 이벤트 루프 밖에서 실행.
+
+입력 크기가 CPU_OFFLOAD_MIN_SIZE 이상일 때만 실행기(기본 프로세스 풀)로 보내고,
+작은 입력은 넘기는 비용이 더 크므로 그대로 실행한다. 프로세스 풀로 보내는 함수와
+인자·결과는 pickle 가능해야 한다 (모듈 수준 함수 또는 클래스의 staticmethod).
+
+풀은 처음 필요할 때 워커 프로세스별로 만든다. 풀이 깨지면(자식 프로세스 종료 등)
+버리고 이번 계산은 그대로 실행해 요청을 실패시키지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.variable import CPU_OFFLOAD_KIND, CPU_OFFLOAD_MIN_SIZE, CPU_OFFLOAD_WORKERS
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _run_timed(
+    func: Callable[..., T], args: Tuple[Any, ...], submitted_at: float
+) -> Tuple[T, float]:
+    # 실행기 안에서 실행: 결과와 제출부터 실행 시작까지 기다린 시간
+    waited = time.time() - submitted_at
+    return func(*args), waited
+
+
+class CpuOffload:
+    _executor: Optional[Executor] = None
+    offloaded = 0
+    inline = 0
+    failures = 0
+    in_flight = 0
+    queue_wait_total = 0.0
+    queue_wait_max = 0.0
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return CPU_OFFLOAD_WORKERS > 0 and CPU_OFFLOAD_KIND in ("process", "thread")
+
+    @classmethod
+    async def run(cls, func: Callable[..., T], *args: Any, size: int) -> T:
+        """func(*args) 실행. size(입력 크기)가 기준 이상이면 실행기에서 실행."""
+        if not cls.enabled() or size < CPU_OFFLOAD_MIN_SIZE:
+            cls.inline += 1
+            return func(*args)
+
+        executor = cls._get_executor()
+        loop = asyncio.get_running_loop()
+        cls.in_flight += 1
+        try:
+            result, waited = await loop.run_in_executor(
+                executor, _run_timed, func, args, time.time()
+            )
+        except BrokenProcessPool:
+            cls.failures += 1
+            LOGGER.warning("CPU offload pool broken; running %s inline", func)
+            cls._discard(executor)
+            cls.inline += 1
+            return func(*args)
+        finally:
+            cls.in_flight -= 1
+
+        cls.offloaded += 1
+        cls.queue_wait_total += waited
+        cls.queue_wait_max = max(cls.queue_wait_max, waited)
+        return result
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if cls._executor is None:
+            if CPU_OFFLOAD_KIND == "thread":
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=CPU_OFFLOAD_WORKERS, thread_name_prefix="cpu-offload"
+                )
+            else:
+                # 스레드가 있는 이벤트 루프 프로세스를 fork하지 않도록 spawn 사용
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=CPU_OFFLOAD_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return cls._executor
+
+    @classmethod
+    def _discard(cls, executor: Executor) -> None:
+        if cls._executor is executor:
+            cls._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    async def stop(cls) -> None:
+        executor = cls._executor
+        cls._executor = None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: executor.shutdown(wait=True, cancel_futures=True)
+            )
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            "enabled": cls.enabled(),
+            "kind": CPU_OFFLOAD_KIND,
+            "workers": CPU_OFFLOAD_WORKERS,
+            "min_size": CPU_OFFLOAD_MIN_SIZE,
+            "started": cls._executor is not None,
+            "offloaded": cls.offloaded,
+            "inline": cls.inline,
+            "failures": cls.failures,
+            "in_flight": cls.in_flight,
+            "queue_wait_avg_ms": (
+                round(cls.queue_wait_total / cls.offloaded * 1000, 3)
+                if cls.offloaded
+                else 0.0
+            ),
+            "queue_wait_max_ms": round(cls.queue_wait_max * 1000, 3),
+        }
@@ -0,0 +1,39 @@
+import hashlib
+from typing import Any, Optional
+
+from starlette.responses import Response
+
+# 공개 응답은 공유 캐시 저장을 허용하되 매번 재검증, 인증 응답은 브라우저에만 저장
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*parts: Any) -> str:
+    # 약속 ID/버전/요청 변형(쿼리 파라미터 등)으로 강한 ETag 생성
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match는 약한 비교(W/ 접두사 무시)를 사용한다 (RFC 9110 13.1.2)
+    if not if_none_match:
+        return False
+
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def cache_headers(etag: str, cache_control: str) -> dict:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if cache_control == PRIVATE_CACHE_CONTROL:
+        headers["Vary"] = "Authorization"
+    return headers
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag, cache_control))
@@ -0,0 +1,308 @@
+"""Google API 할당량 스케줄러.
+
+모든 Google 호출은 전송 계층에서 acquire()를 거친다. 버킷은 세 가지다.
+
+- 프로젝트 버킷: 전체 QPS
+- 백그라운드 버킷: 프로젝트 QPS 중 백그라운드 작업이 쓸 수 있는 몫
+  (나머지는 항상 대화형 요청용으로 남는다)
+- 사용자 버킷: 사용자별 QPS
+
+버킷은 TokenBucketLimiter에 두므로 Redis가 설정돼 있으면 워커 간에 공유된다.
+바로 허가되지 않은 요청은 우선순위별 대기열에 들어가고, 디스패처는 높은
+우선순위부터, 같은 우선순위 안에서는 사용자를 번갈아 가며 허가한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.utils.rate_limit import TokenBucketLimiter
+from app.variable import (
+    GOOGLE_QUOTA_BACKGROUND_MAX_WAIT_SECONDS,
+    GOOGLE_QUOTA_BACKGROUND_SHARE,
+    GOOGLE_QUOTA_ENABLED,
+    GOOGLE_QUOTA_INTERACTIVE_MAX_WAIT_SECONDS,
+    GOOGLE_QUOTA_PROJECT_BURST,
+    GOOGLE_QUOTA_PROJECT_QPS,
+    GOOGLE_QUOTA_USER_BURST,
+    GOOGLE_QUOTA_USER_QPS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+# 앞에 있을수록 먼저 허가
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND)
+
+_ANONYMOUS = "-"
+
+# (사용자 ID, 우선순위) - 설정되지 않으면 익명·대화형
+_quota_context: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+    "google_quota_context", default=(None, None)
+)
+
+
+class GoogleQuotaScheduler:
+    BUCKET_PREFIX = "google-quota"
+
+    _queues: Dict[str, "OrderedDict[str, Deque[asyncio.Future]]"] = {
+        priority: OrderedDict() for priority in PRIORITIES
+    }
+    _task: Optional[asyncio.Task] = None
+    _wakeup: Optional[asyncio.Event] = None
+    _granted: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+    _queued_total: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+    _timeouts: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+    _max_wait_seconds: Dict[str, float] = {priority: 0.0 for priority in PRIORITIES}
+
+    @staticmethod
+    @contextmanager
+    def context(
+        user_id: Optional[Any] = None, priority: Optional[str] = None
+    ) -> Iterator[None]:
+        """이 블록 안의 Google 호출을 user_id의 할당량·priority 등급으로 처리.
+
+        지정하지 않은 값은 바깥 컨텍스트의 값을 물려받는다.
+        """
+        current_user, current_priority = _quota_context.get()
+        token = _quota_context.set(
+            (
+                str(user_id) if user_id is not None else current_user,
+                priority or current_priority,
+            )
+        )
+        try:
+            yield
+        finally:
+            _quota_context.reset(token)
+
+    @staticmethod
+    def bind_user(user_id: Any) -> None:
+        # 요청 단위 컨텍스트(인증 의존성)에서 현재 사용자 지정
+        _, priority = _quota_context.get()
+        _quota_context.set((str(user_id), priority))
+
+    @staticmethod
+    def current() -> Tuple[str, str]:
+        user_id, priority = _quota_context.get()
+        return user_id or _ANONYMOUS, priority or PRIORITY_INTERACTIVE
+
+    @classmethod
+    async def acquire(
+        cls, user_id: Optional[str] = None, priority: Optional[str] = None
+    ) -> None:
+        """Google 호출 한 건의 할당량 확보. 최대 대기 시간을 넘으면 429."""
+        if not GOOGLE_QUOTA_ENABLED:
+            return
+        context_user, context_priority = cls.current()
+        user_key = str(user_id) if user_id is not None else context_user
+        priority = priority or context_priority
+        if priority not in cls._queues:
+            priority = PRIORITY_BACKGROUND
+
+        # 대기 중인 요청이 없으면 디스패처를 거치지 않는다
+        if not cls.queue_depth():
+            wait, _ = await cls._try_consume(user_key, priority)
+            if wait <= 0:
+                cls._granted[priority] += 1
+                return
+
+        loop = asyncio.get_running_loop()
+        cls._ensure_dispatcher(loop)
+        future: asyncio.Future = loop.create_future()
+        cls._queues[priority].setdefault(user_key, deque()).append(future)
+        cls._queued_total[priority] += 1
+        cls._wakeup.set()
+
+        max_wait = (
+            GOOGLE_QUOTA_INTERACTIVE_MAX_WAIT_SECONDS
+            if priority == PRIORITY_INTERACTIVE
+            else GOOGLE_QUOTA_BACKGROUND_MAX_WAIT_SECONDS
+        )
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(future, timeout=max_wait)
+        except asyncio.TimeoutError:
+            cls._timeouts[priority] += 1
+            LOGGER.warning(
+                "Google quota wait exceeded %.1fs (priority=%s, user=%s)",
+                max_wait,
+                priority,
+                user_key,
+            )
+            raise HTTPException(
+                status_code=429,
+                detail="google_quota_exhausted",
+                headers={"Retry-After": str(max(1, math.ceil(max_wait)))},
+            )
+        finally:
+            waited = time.monotonic() - started
+            if waited > cls._max_wait_seconds[priority]:
+                cls._max_wait_seconds[priority] = waited
+
+    @classmethod
+    async def _try_consume(
+        cls, user_key: str, priority: str
+    ) -> Tuple[float, Optional[str]]:
+        """좁은 버킷부터 소비. 거절되면 (대기 초, 거절한 버킷 범위)."""
+        buckets = []
+        if user_key != _ANONYMOUS:
+            buckets.append(
+                (
+                    "user",
+                    f"{cls.BUCKET_PREFIX}:user:{user_key}",
+                    GOOGLE_QUOTA_USER_BURST,
+                    GOOGLE_QUOTA_USER_QPS,
+                )
+            )
+        if priority != PRIORITY_INTERACTIVE:
+            share = max(GOOGLE_QUOTA_BACKGROUND_SHARE, 0.01)
+            buckets.append(
+                (
+                    "background",
+                    f"{cls.BUCKET_PREFIX}:background",
+                    max(1, int(GOOGLE_QUOTA_PROJECT_BURST * share)),
+                    GOOGLE_QUOTA_PROJECT_QPS * share,
+                )
+            )
+        buckets.append(
+            (
+                "project",
+                f"{cls.BUCKET_PREFIX}:project",
+                GOOGLE_QUOTA_PROJECT_BURST,
+                GOOGLE_QUOTA_PROJECT_QPS,
+            )
+        )
+
+        # 뒤 버킷에서 거절되면 앞에서 소비한 토큰은 돌려받지 않는다 (보수적으로 집계)
+        for scope, key, capacity, rate in buckets:
+            wait = await TokenBucketLimiter.consume(key, 1, capacity, rate)
+            if wait > 0:
+                return wait, scope
+        return 0.0, None
+
+    @classmethod
+    async def _grant_next(cls) -> float:
+        """대기 요청 하나를 허가하면 0, 허가할 수 없으면 다시 시도까지 남은 초."""
+        min_wait: Optional[float] = None
+        for priority in PRIORITIES:
+            queue = cls._queues[priority]
+            for user_key in list(queue):
+                waiters = queue.get(user_key)
+                while waiters and waiters[0].done():
+                    # 시간 초과·취소된 요청
+                    waiters.popleft()
+                if not waiters:
+                    queue.pop(user_key, None)
+                    continue
+
+                wait, scope = await cls._try_consume(user_key, priority)
+                if wait > 0:
+                    min_wait = wait if min_wait is None else min(min_wait, wait)
+                    if scope == "project":
+                        return min_wait
+                    if scope == "background":
+                        break
+                    # 이 사용자만 한도에 걸렸으면 다음 사용자로
+                    continue
+
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    cls._granted[priority] += 1
+                # 같은 우선순위 안에서 사용자별로 번갈아 허가
+                if waiters:
+                    queue.move_to_end(user_key)
+                else:
+                    queue.pop(user_key, None)
+                return 0.0
+        return min_wait if min_wait is not None else 0.0
+
+    @classmethod
+    async def _dispatch(cls) -> None:
+        wakeup = cls._wakeup
+        while True:
+            if not cls.queue_depth():
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            try:
+                wait = await cls._grant_next()
+            except Exception:
+                LOGGER.exception("Google quota dispatch failed")
+                wait = 1.0
+            if wait > 0:
+                # 새 요청(다른 사용자·높은 우선순위)이 오면 기다리지 않고 다시 확인
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
+    @classmethod
+    def _ensure_dispatcher(cls, loop: asyncio.AbstractEventLoop) -> None:
+        task = cls._task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        if task is not None and task.get_loop() is not loop:
+            # 다른 이벤트 루프(테스트, 스크립트 재실행)의 대기열은 버린다
+            for queue in cls._queues.values():
+                queue.clear()
+        cls._wakeup = asyncio.Event()
+        cls._task = loop.create_task(cls._dispatch())
+
+    @classmethod
+    async def stop(cls) -> None:
+        task = cls._task
+        cls._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        for queue in cls._queues.values():
+            for waiters in queue.values():
+                for future in waiters:
+                    if not future.done():
+                        future.cancel()
+            queue.clear()
+
+    @classmethod
+    def queue_depth(cls, priority: Optional[str] = None) -> int:
+        priorities = (priority,) if priority else PRIORITIES
+        return sum(
+            sum(1 for future in waiters if not future.done())
+            for name in priorities
+            for waiters in cls._queues[name].values()
+        )
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """우선순위별 대기열 길이와 누적 허가·시간 초과 수."""
+        return {
+            "enabled": GOOGLE_QUOTA_ENABLED,
+            "project_qps": GOOGLE_QUOTA_PROJECT_QPS,
+            "user_qps": GOOGLE_QUOTA_USER_QPS,
+            "priorities": {
+                priority: {
+                    "queued": cls.queue_depth(priority),
+                    "users_waiting": len(cls._queues[priority]),
+                    "granted": cls._granted[priority],
+                    "queued_total": cls._queued_total[priority],
+                    "timeouts": cls._timeouts[priority],
+                    "max_wait_seconds": round(cls._max_wait_seconds[priority], 3),
+                }
+                for priority in PRIORITIES
+            },
+        }
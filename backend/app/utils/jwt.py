@@ -1,12 +1,22 @@
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from typing import Optional
-from app.variable import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.variable import (
+    SECRET_KEY,
+    ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    AUTH_TOKEN_CACHE_SIZE,
+)
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer
 
 security = HTTPBearer()
 
+# 검증이 끝난 토큰 -> payload (만료 시각이 지나면 캐시에서도 무효)
+_token_cache: "OrderedDict[str, dict]" = OrderedDict()
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -27,6 +37,25 @@ def verify_token(token: str):
         return None
 
 
+def decode_token_cached(token: str) -> Optional[dict]:
+    # 같은 토큰의 반복 서명 검증을 피하기 위한 작은 LRU
+    payload = _token_cache.get(token)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            _token_cache.move_to_end(token)
+            return payload
+        _token_cache.pop(token, None)
+        return None
+
+    payload = verify_token(token)
+    if payload is not None and AUTH_TOKEN_CACHE_SIZE > 0:
+        _token_cache[token] = payload
+        while len(_token_cache) > AUTH_TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return payload
+
+
 def get_current_user(token=Depends(security)):
     # JWT 토큰에서 현재 사용자 정보 추출
     credentials_exception = HTTPException(
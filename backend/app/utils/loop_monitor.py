@@ -0,0 +1,273 @@
+"""이벤트 루프 지연 모니터와 블로킹 호출 감지.
+
+- 지연 측정: 주기적으로 잠들었다 깨어난 시각이 예정보다 얼마나 늦었는지를
+  히스토그램(누적 버킷)으로 집계한다.
+- 워치독: 별도 스레드가 측정 작업의 마지막 실행 시각을 보고, 루프가
+  LOOP_BLOCK_THRESHOLD_SECONDS 이상 멈춰 있으면 그 순간 루프 스레드의 스택과
+  실행 중인 태스크를 기록한다 (멈춘 동안 한 번).
+- 디버그 모드(LOOP_DEBUG_BLOCKING_IO): 감사 훅으로 루프 스레드에서 일어나는
+  동기 I/O(블로킹 소켓 연결, DNS 조회, 파일 열기, sleep, 하위 프로세스)를
+  호출 위치와 함께 보고한다. 호출 위치별로 한 번만 로그를 남긴다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import socket
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from app.variable import (
+    LOOP_BLOCK_THRESHOLD_SECONDS,
+    LOOP_DEBUG_BLOCKING_IO,
+    LOOP_MONITOR_ENABLED,
+    LOOP_MONITOR_INTERVAL_SECONDS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# 지연 히스토그램 버킷 상한(ms), 마지막은 +Inf
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_BLOCKING_EVENTS = {
+    "socket.connect",
+    "socket.getaddrinfo",
+    "socket.gethostbyname",
+    "socket.gethostbyaddr",
+    "open",
+    # Python 3.12부터 (그 이전은 워치독의 멈춤 스택으로만 확인)
+    "time.sleep",
+    "subprocess.Popen",
+    "os.system",
+}
+# 지연 import 등 모듈 로딩은 보고하지 않는다
+_IMPORT_SUFFIXES = (".py", ".pyc", ".pyi", ".so", ".pth")
+_MAX_STACK_FRAMES = 25
+
+
+class LoopMonitor:
+    _task: Optional[asyncio.Task] = None
+    _watchdog: Optional[threading.Thread] = None
+    _stopping = threading.Event()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_thread_id: Optional[int] = None
+    _heartbeat = 0.0
+
+    _bucket_counts: List[int] = [0] * (len(LAG_BUCKETS_MS) + 1)
+    _lag_sum_ms = 0.0
+    _lag_count = 0
+    _lag_max_ms = 0.0
+
+    stalls = 0
+    _stall_reported = False
+    _recent_stalls: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+    _audit_installed = False
+    _debug_enabled = False
+    _in_audit = threading.local()
+    _reported_sites: Set[Tuple[str, str]] = set()
+    blocking_calls: Counter = Counter()
+
+    @classmethod
+    async def start(cls) -> None:
+        if not LOOP_MONITOR_ENABLED or cls._task is not None:
+            return
+        cls._loop = asyncio.get_running_loop()
+        cls._loop_thread_id = threading.get_ident()
+        cls._heartbeat = time.monotonic()
+        cls._stopping.clear()
+        cls._task = asyncio.create_task(cls._measure())
+        cls._watchdog = threading.Thread(
+            target=cls._watch, name="loop-watchdog", daemon=True
+        )
+        cls._watchdog.start()
+        if LOOP_DEBUG_BLOCKING_IO:
+            cls.enable_blocking_io_debug()
+
+    @classmethod
+    async def stop(cls) -> None:
+        cls._debug_enabled = False
+        cls._stopping.set()
+        task = cls._task
+        cls._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        watchdog = cls._watchdog
+        cls._watchdog = None
+        if watchdog is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, watchdog.join, LOOP_MONITOR_INTERVAL_SECONDS * 2
+            )
+
+    @classmethod
+    async def _measure(cls) -> None:
+        loop = asyncio.get_running_loop()
+        interval = LOOP_MONITOR_INTERVAL_SECONDS
+        while True:
+            cls._heartbeat = time.monotonic()
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            cls.record_lag(max(0.0, loop.time() - expected))
+
+    @classmethod
+    def record_lag(cls, lag_seconds: float) -> None:
+        lag_ms = lag_seconds * 1000
+        cls._bucket_counts[bisect.bisect_left(LAG_BUCKETS_MS, lag_ms)] += 1
+        cls._lag_sum_ms += lag_ms
+        cls._lag_count += 1
+        cls._lag_max_ms = max(cls._lag_max_ms, lag_ms)
+
+    @classmethod
+    def _watch(cls) -> None:
+        check_every = min(LOOP_MONITOR_INTERVAL_SECONDS, LOOP_BLOCK_THRESHOLD_SECONDS)
+        while not cls._stopping.wait(check_every / 2):
+            # 측정 주기만큼은 원래 쉬는 시간이므로 기준에 더한다
+            stalled_for = (
+                time.monotonic() - cls._heartbeat - LOOP_MONITOR_INTERVAL_SECONDS
+            )
+            if stalled_for < LOOP_BLOCK_THRESHOLD_SECONDS:
+                cls._stall_reported = False
+                continue
+            if not cls._stall_reported:
+                cls._stall_reported = True
+                cls.capture_stall(stalled_for)
+
+    @classmethod
+    def capture_stall(cls, stalled_for: float) -> Optional[Dict[str, Any]]:
+        """루프 스레드의 현재 스택과 실행 중인 태스크 기록 (워치독 스레드에서 호출)."""
+        frame = sys._current_frames().get(cls._loop_thread_id)
+        if frame is None:
+            return None
+        task = asyncio.current_task(cls._loop) if cls._loop is not None else None
+        stall = {
+            "at": time.time(),
+            "stalled_ms": round(stalled_for * 1000, 1),
+            "task": task.get_name() if task is not None else None,
+            "coroutine": (
+                getattr(task.get_coro(), "__qualname__", None)
+                if task is not None
+                else None
+            ),
+            "stack": traceback.format_stack(frame, limit=_MAX_STACK_FRAMES),
+        }
+        cls.stalls += 1
+        cls._recent_stalls.append(stall)
+        LOGGER.warning(
+            "Event loop blocked for %.0fms (task=%s)\n%s",
+            stall["stalled_ms"],
+            stall["task"],
+            "".join(stall["stack"]),
+        )
+        return stall
+
+    @classmethod
+    def enable_blocking_io_debug(cls) -> None:
+        # 감사 훅은 제거할 수 없으므로 한 번만 설치하고 플래그로 켜고 끈다
+        if not cls._audit_installed:
+            sys.addaudithook(cls._audit)
+            cls._audit_installed = True
+        cls._debug_enabled = True
+
+    @classmethod
+    def _audit(cls, event: str, args: Tuple[Any, ...]) -> None:
+        if (
+            not cls._debug_enabled
+            or event not in _BLOCKING_EVENTS
+            or threading.get_ident() != cls._loop_thread_id
+            or getattr(cls._in_audit, "active", False)
+        ):
+            return
+        cls._in_audit.active = True
+        try:
+            detail = cls._blocking_detail(event, args)
+            if detail is not None:
+                cls._report_blocking_call(event, detail)
+        finally:
+            cls._in_audit.active = False
+
+    @staticmethod
+    def _blocking_detail(event: str, args: Tuple[Any, ...]) -> Optional[str]:
+        if event == "socket.connect":
+            sock, address = args[0], args[1]
+            # 논블로킹 소켓(asyncio 전송 계층)은 정상
+            if isinstance(sock, socket.socket) and sock.gettimeout() == 0.0:
+                return None
+            return repr(address)
+        if event == "open":
+            path = str(args[0])
+            if path.endswith(_IMPORT_SUFFIXES):
+                return None
+            return path
+        return repr(args[:2])[:200]
+
+    @classmethod
+    def _report_blocking_call(cls, event: str, detail: str) -> None:
+        cls.blocking_calls[event] += 1
+        # 감사 훅 자신(_audit, 이 함수)의 프레임은 제외
+        stack = traceback.extract_stack(limit=_MAX_STACK_FRAMES + 2)[:-2]
+        caller = next(
+            (
+                f"{frame.filename}:{frame.lineno}"
+                for frame in reversed(stack)
+                if "/asyncio/" not in frame.filename
+                and not frame.filename.endswith(("socket.py", "ssl.py"))
+                and "site-packages" not in frame.filename
+            ),
+            f"{stack[-1].filename}:{stack[-1].lineno}" if stack else "?",
+        )
+        if (event, caller) in cls._reported_sites:
+            return
+        cls._reported_sites.add((event, caller))
+        LOGGER.warning(
+            "Blocking %s on event loop thread at %s (%s)\n%s",
+            event,
+            caller,
+            detail,
+            "".join(traceback.format_list(stack)),
+        )
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._bucket_counts = [0] * (len(LAG_BUCKETS_MS) + 1)
+        cls._lag_sum_ms = 0.0
+        cls._lag_count = 0
+        cls._lag_max_ms = 0.0
+        cls.stalls = 0
+        cls._stall_reported = False
+        cls._recent_stalls.clear()
+        cls._reported_sites.clear()
+        cls.blocking_calls.clear()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(
+            [str(bound) for bound in LAG_BUCKETS_MS] + ["+Inf"], cls._bucket_counts
+        ):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            "enabled": cls._task is not None,
+            "interval_ms": LOOP_MONITOR_INTERVAL_SECONDS * 1000,
+            "lag_ms": {
+                "buckets": buckets,
+                "count": cls._lag_count,
+                "sum": round(cls._lag_sum_ms, 3),
+                "max": round(cls._lag_max_ms, 3),
+            },
+            "stalls": cls.stalls,
+            "recent_stalls": list(cls._recent_stalls),
+            "blocking_io_debug": cls._debug_enabled,
+            "blocking_calls": dict(cls.blocking_calls),
+        }
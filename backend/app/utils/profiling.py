@@ -0,0 +1,183 @@
+import asyncio
+import cProfile
+import json
+import logging
+import random
+import re
+import secrets
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from app.utils.query_stats import track_queries
+from app.variable import (
+    ADMIN_TOKEN,
+    PROFILING_DIR,
+    PROFILING_MAX_FILES,
+    PROFILING_SAMPLE_RATE,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+
+
+@dataclass
+class RequestTimings:
+    db_seconds: float = 0.0
+    db_queries: int = 0
+    google_seconds: float = 0.0
+    google_calls: int = 0
+    # 이벤트 루프 스레드 CPU 시간 (같은 시간대에 처리된 다른 요청 포함)
+    cpu_seconds: float = 0.0
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "profiling_timings", default=None
+)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current_timings.get()
+
+
+def record_google_call(seconds: float) -> None:
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.google_seconds += seconds
+        timings.google_calls += 1
+
+
+class ProfilingMiddleware:
+    """요청 단위 cProfile 프로파일러 (순수 ASGI 미들웨어).
+
+    관리자 토큰과 함께 `X-Profile: 1` 헤더를 보내거나 PROFILING_SAMPLE_RATE
+    비율로 샘플링된 요청만 프로파일링한다. 결과는 PROFILING_DIR 아래에
+    `.prof`(pstats)와 DB/Google/기타 시간 분해를 담은 `.json`으로 저장된다.
+    cProfile은 스레드 단위라 동시에 하나의 요청만 프로파일링한다.
+    """
+
+    _active = False
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        await self._profile(scope, receive, send)
+
+    @classmethod
+    def _should_profile(cls, scope) -> bool:
+        if cls._active:
+            return False
+        if PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE:
+            return True
+        if not ADMIN_TOKEN:
+            return False
+
+        headers = dict(scope.get("headers") or ())
+        if headers.get(PROFILE_HEADER) not in (b"1", b"true"):
+            return False
+        token = headers.get(ADMIN_TOKEN_HEADER, b"")
+        return secrets.compare_digest(token, ADMIN_TOKEN.encode())
+
+    async def _profile(self, scope, receive, send):
+        cls = type(self)
+        cls._active = True
+        status = {"code": None}
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
+        profiler.enable()
+        try:
+            with track_queries(scope.get("path", "")) as queries:
+                await self.app(scope, receive, _send)
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            timings.cpu_seconds = time.thread_time() - cpu_started
+            timings.db_seconds = queries.total_seconds
+            timings.db_queries = queries.count
+            _current_timings.reset(token)
+            cls._active = False
+            try:
+                await asyncio.to_thread(
+                    save_profile, profiler, scope, status["code"], elapsed, timings
+                )
+            except Exception:
+                LOGGER.exception("Failed to save request profile")
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-") or "root"
+
+
+def save_profile(
+    profiler: cProfile.Profile,
+    scope,
+    status_code: Optional[int],
+    elapsed: float,
+    timings: RequestTimings,
+) -> Path:
+    directory = Path(PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    route = getattr(scope.get("route"), "path", None) or scope.get("path", "")
+    invite_code = (scope.get("path_params") or {}).get("invite_code") or "-"
+    stem = (
+        f"{int(time.time() * 1000)}_{scope.get('method', 'GET')}"
+        f"_{_slug(route)}_{_slug(str(invite_code))}"
+    )
+
+    profiler.dump_stats(directory / f"{stem}.prof")
+    meta = {
+        "name": stem,
+        "method": scope.get("method"),
+        "route": route,
+        "invite_code": None if invite_code == "-" else invite_code,
+        "status_code": status_code,
+        "created_at": time.time(),
+        "total_seconds": round(elapsed, 6),
+        **{key: round(value, 6) for key, value in asdict(timings).items()},
+        # DB/Google 대기를 뺀 나머지 (CPU + 기타 대기)
+        "other_seconds": round(
+            max(elapsed - timings.db_seconds - timings.google_seconds, 0.0), 6
+        ),
+    }
+    (directory / f"{stem}.json").write_text(json.dumps(meta))
+    _prune(directory)
+    return directory / f"{stem}.prof"
+
+
+def _prune(directory: Path) -> None:
+    metas = sorted(directory.glob("*.json"))
+    for meta in metas[: max(len(metas) - PROFILING_MAX_FILES, 0)]:
+        meta.unlink(missing_ok=True)
+        meta.with_suffix(".prof").unlink(missing_ok=True)
+
+
+def list_profiles(limit: int = 20) -> List[dict]:
+    directory = Path(PROFILING_DIR)
+    if not directory.is_dir():
+        return []
+
+    profiles = []
+    for meta in sorted(directory.glob("*.json"), reverse=True)[:limit]:
+        try:
+            profiles.append(json.loads(meta.read_text()))
+        except (OSError, ValueError):
+            continue
+    return profiles
@@ -0,0 +1,158 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.variable import SQL_DEBUG, SQL_N_PLUS_ONE_THRESHOLD, SQL_SLOW_QUERY_MS
+
+LOGGER = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# IN (?, ?, ?) 처럼 파라미터 개수만 다른 쿼리를 같은 형태로 본다
+_PARAM_LIST = re.compile(
+    r"\(\s*(?:\?|%s|%\(\w+\)s)(?:\s*,\s*(?:\?|%s|%\(\w+\)s))*\s*\)"
+)
+_MAX_LOGGED_PARAMS = 500
+
+
+def statement_shape(statement: str) -> str:
+    return _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def repeated_shapes(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        threshold = threshold or SQL_N_PLUS_ONE_THRESHOLD
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+# 중첩된 track_queries 블록이 모두 집계되도록 활성 통계를 튜플로 보관
+_active_stats: ContextVar[Tuple[QueryStats, ...]] = ContextVar(
+    "query_stats", default=()
+)
+_installed = False
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    active = _active_stats.get()
+    return active[-1] if active else None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+
+    active = _active_stats.get()
+    if active:
+        shape = statement_shape(statement)
+        for stats in active:
+            stats.count += 1
+            stats.total_seconds += elapsed
+            stats.shapes[shape] += 1
+
+    if elapsed * 1000 >= SQL_SLOW_QUERY_MS:
+        LOGGER.warning(
+            "Slow query (%.1f ms): %s | params=%s",
+            elapsed * 1000,
+            _WHITESPACE.sub(" ", statement).strip(),
+            repr(parameters)[:_MAX_LOGGED_PARAMS],
+        )
+
+
+def install_query_instrumentation() -> None:
+    """모든 Engine의 커서 실행 시간을 계측한다 (여러 번 호출해도 한 번만 등록)."""
+    global _installed
+    if not _installed:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _installed = True
+
+
+@contextmanager
+def track_queries(label: str = "") -> Iterator[QueryStats]:
+    """블록 안에서 실행된 쿼리 수와 DB 시간을 모은다.
+
+    SQL_DEBUG가 켜져 있으면 같은 형태의 쿼리가 SQL_N_PLUS_ONE_THRESHOLD번
+    이상 반복된 경우 N+1 의심으로 경고한다.
+    """
+    install_query_instrumentation()
+    stats = QueryStats()
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+        if SQL_DEBUG:
+            for shape, count in stats.repeated_shapes():
+                LOGGER.warning(
+                    "Possible N+1 in %s: %d x %s", label or "block", count, shape
+                )
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """테스트용: 블록 안의 쿼리 수가 max_queries를 넘으면 실패한다."""
+    with track_queries("query_budget") as stats:
+        yield stats
+    if stats.count > max_queries:
+        shapes = "\n".join(
+            f"  {count} x {shape}" for shape, count in stats.shapes.most_common()
+        )
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n{shapes}"
+        )
+
+
+class QueryStatsMiddleware:
+    """요청별 쿼리 수와 DB 시간을 Server-Timing 헤더와 디버그 로그로 남긴다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        label = f"{scope.get('method')} {scope.get('path')}"
+        with track_queries(label) as stats:
+
+            async def _send(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers") or [])
+                    headers.append(
+                        (
+                            b"server-timing",
+                            f"db;dur={stats.total_seconds * 1000:.1f};"
+                            f'desc="{stats.count} queries"'.encode(),
+                        )
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, _send)
+
+        LOGGER.debug(
+            "%s: %d queries, %.1f ms", label, stats.count, stats.total_seconds * 1000
+        )
@@ -0,0 +1,224 @@
+import ipaddress
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, Union
+
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi_limiter import FastAPILimiter
+
+from app.utils.jwt import decode_token_cached
+from app.variable import (
+    GOOGLE_FANOUT_CAPACITY,
+    GOOGLE_FANOUT_REFILL_PER_SECOND,
+    RATE_LIMIT_CAPACITY,
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_REDIS_URL,
+    RATE_LIMIT_REFILL_PER_SECOND,
+    RATE_LIMIT_TRUSTED_PROXIES,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_bearer = HTTPBearer(auto_error=False)
+
+_TRUSTED_PROXY_NETWORKS = [
+    ipaddress.ip_network(value, strict=False) for value in RATE_LIMIT_TRUSTED_PROXIES
+]
+
+# KEYS[1]: 버킷 키 / ARGV: 용량, ms당 충전량, 비용
+# 반환값: 0이면 허용, 아니면 토큰이 채워질 때까지 남은 ms
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= cost then
+  tokens = tokens - cost
+else
+  wait = math.ceil((cost - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate) + 1000)
+return wait
+"""
+
+
+class TokenBucketLimiter:
+    """토큰 버킷 카운터 저장소.
+
+    FastAPILimiter가 Redis로 초기화돼 있으면 Lua 스크립트로 워커 간 버킷을
+    공유하고, 아니면 프로세스 메모리에 버킷을 둔다.
+    """
+
+    prefix = "yakssok:rate-limit"
+    max_local_buckets = 10000
+    _local: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+    _script = None
+
+    @classmethod
+    async def start(cls) -> None:
+        if RATE_LIMIT_REDIS_URL and FastAPILimiter.redis is None:
+            import redis.asyncio as redis_asyncio
+
+            await FastAPILimiter.init(
+                redis_asyncio.from_url(RATE_LIMIT_REDIS_URL), prefix=cls.prefix
+            )
+
+    @classmethod
+    async def stop(cls) -> None:
+        if FastAPILimiter.redis is not None:
+            await FastAPILimiter.close()
+            FastAPILimiter.redis = None
+        cls._script = None
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._local.clear()
+
+    @classmethod
+    async def consume(
+        cls, key: str, cost: int, capacity: int, refill_per_second: float
+    ) -> float:
+        """cost만큼 토큰을 소비하고, 거절되면 재시도까지 남은 초를 반환한다 (허용은 0)."""
+        # 용량보다 큰 비용은 영원히 거절되므로 용량으로 제한
+        cost = min(cost, capacity)
+
+        if FastAPILimiter.redis is not None:
+            try:
+                return await cls._consume_redis(key, cost, capacity, refill_per_second)
+            except Exception:
+                # 카운터 저장소 장애가 요청 처리를 막지 않도록 로컬 버킷으로 대체
+                LOGGER.exception("Rate limit store unavailable, using local bucket")
+
+        return cls._consume_local(key, cost, capacity, refill_per_second)
+
+    @classmethod
+    async def _consume_redis(
+        cls, key: str, cost: int, capacity: int, refill_per_second: float
+    ) -> float:
+        if cls._script is None:
+            cls._script = FastAPILimiter.redis.register_script(_TOKEN_BUCKET_LUA)
+        wait_ms = await cls._script(
+            keys=[f"{cls.prefix}:{key}"],
+            args=[capacity, refill_per_second / 1000, cost],
+        )
+        return int(wait_ms) / 1000
+
+    @classmethod
+    def _consume_local(
+        cls, key: str, cost: int, capacity: int, refill_per_second: float
+    ) -> float:
+        now = time.monotonic()
+        tokens, updated_at = cls._local.pop(key, (float(capacity), now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / refill_per_second
+
+        cls._local[key] = (tokens, now)
+        while len(cls._local) > cls.max_local_buckets:
+            cls._local.popitem(last=False)
+        return wait
+
+
+class RateLimit:
+    """사용자·라우트별 토큰 버킷 의존성.
+
+    cost는 고정값 또는 요청을 받아 비용을 계산하는 함수로 지정한다.
+    """
+
+    def __init__(
+        self,
+        route: str,
+        cost: Union[int, Callable[[Request], int]] = 1,
+        capacity: Optional[int] = None,
+        refill_per_second: Optional[float] = None,
+    ):
+        self.route = route
+        self.cost = cost
+        self.capacity = capacity or RATE_LIMIT_CAPACITY
+        self.refill_per_second = refill_per_second or RATE_LIMIT_REFILL_PER_SECOND
+
+    async def __call__(
+        self,
+        request: Request,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+    ) -> None:
+        if not RATE_LIMIT_ENABLED:
+            return
+
+        cost = self.cost(request) if callable(self.cost) else self.cost
+        retry_after = await TokenBucketLimiter.consume(
+            f"route:{self.route}:{_identify(request, credentials)}",
+            cost,
+            self.capacity,
+            self.refill_per_second,
+        )
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=429,
+                detail="rate_limited",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+
+def _identify(
+    request: Request, credentials: Optional[HTTPAuthorizationCredentials]
+) -> str:
+    # 토큰의 사용자 ID 기준, 토큰이 없거나 잘못되면 클라이언트 IP 기준
+    payload = decode_token_cached(credentials.credentials) if credentials else None
+    if payload and payload.get("sub"):
+        return f"user:{payload['sub']}"
+
+    return f"ip:{_client_ip(request)}"
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _TRUSTED_PROXY_NETWORKS)
+
+
+def _client_ip(request: Request) -> str:
+    # X-Forwarded-For는 누구나 보낼 수 있으므로 신뢰하는 프록시가 붙인 값만 사용.
+    # 오른쪽(가장 가까운 홉)부터 신뢰하는 프록시를 건너뛰고 처음 만나는 주소가 클라이언트
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(peer):
+        return peer
+
+    hops = [
+        hop.strip()
+        for hop in request.headers.get("X-Forwarded-For", "").split(",")
+        if hop.strip()
+    ]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+async def acquire_google_fanout(user_id: str) -> bool:
+    # 확정·재시도 팬아웃에서 참여자 한 명당 Google 호출 토큰 1개 소비
+    if not RATE_LIMIT_ENABLED:
+        return True
+    retry_after = await TokenBucketLimiter.consume(
+        f"google-fanout:user:{user_id}",
+        1,
+        GOOGLE_FANOUT_CAPACITY,
+        GOOGLE_FANOUT_REFILL_PER_SECOND,
+    )
+    return retry_after <= 0
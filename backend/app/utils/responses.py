@@ -0,0 +1,58 @@
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 기본 응답 클래스.
+
+    구글 사용자 ID처럼 64비트를 넘는 정수 등 orjson이 처리하지 못하는 값은
+    표준 json 인코더로 대체한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().render(content)
+
+
+def model_json_response(
+    model: BaseModel,
+    *,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+    exclude: Any = None,
+) -> Response:
+    # 검증이 끝난 모델을 바로 직렬화 (response_model 재검증 생략).
+    # 날짜·enum은 pydantic json 모드로 변환해 다른 라우트와 인코딩을 맞추고,
+    # 바이트 변환은 FastJSONResponse에 맡긴다. model_dump_json은 64비트를 넘는
+    # 구글 사용자 ID에서 매우 느리다 (benchmarks.serialization_benchmark)
+    return FastJSONResponse(
+        content=model.model_dump(mode="json", exclude=exclude),
+        status_code=status_code,
+        headers=headers,
+    )
+
+
+def adapter_json_response(
+    adapter: TypeAdapter,
+    value: Any,
+    *,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    return FastJSONResponse(
+        content=adapter.dump_python(value, mode="json"),
+        status_code=status_code,
+        headers=headers,
+    )
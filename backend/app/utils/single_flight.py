@@ -0,0 +1,72 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """키 단위 요청 병합기.
+
+    같은 키로 동시에 들어온 호출은 진행 중인 한 번의 계산 결과를 공유하고,
+    완료된 결과는 ttl_seconds 동안 재사용한다. 키에 약속 버전을 포함하면
+    버전이 바뀌는 즉시 이전 결과는 더 이상 조회되지 않는다.
+    """
+
+    def __init__(self, ttl_seconds: float = 0.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._results: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+
+        cached = self._results.get(key)
+        if cached is not None:
+            expires_at, value = cached
+            if expires_at > time.monotonic():
+                self.cache_hits += 1
+                return value
+            self._results.pop(key, None)
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        self.executions += 1
+        future = asyncio.ensure_future(func())
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+
+        # 먼저 온 요청이 취소돼도 공유 계산은 계속되도록 shield
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            self._inflight.pop(key, None)
+
+        if self.ttl_seconds <= 0 or future.cancelled() or future.exception():
+            return
+
+        self._results[key] = (time.monotonic() + self.ttl_seconds, future.result())
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+            "inflight": len(self._inflight),
+            "cached": len(self._results),
+        }
@@ -0,0 +1,415 @@
+"""경량 트레이싱.
+
+`span()` 블록은 contextvar로 부모 스팬을 이어받으므로 asyncio.gather /
+create_task로 만든 하위 작업에도 같은 트레이스가 전파된다. 끝난 스팬은
+버퍼에 모였다가 Tracer 백그라운드 작업이 설정된 exporter로 내보낸다.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import random
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.query_stats import statement_shape
+from app.variable import (
+    TRACING_EXPORTER,
+    TRACING_FLUSH_INTERVAL_SECONDS,
+    TRACING_JSONL_PATH,
+    TRACING_MAX_BUFFERED_SPANS,
+    TRACING_OTLP_ENDPOINT,
+    TRACING_SAMPLE_RATE,
+    TRACING_SERVICE_NAME,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "OK"
+    sampled: bool = True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = "ERROR"
+        self.attributes["error.type"] = type(error).__name__
+        self.attributes["error.message"] = str(error)[:500]
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("sampled")
+        data["duration_ms"] = round(self.duration_ms, 3)
+        return data
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_attributes(**attributes: Any) -> None:
+    # 현재 스팬에 속성 추가 (트레이싱이 꺼져 있으면 무시)
+    span = _current_span.get()
+    if span is not None and span.sampled:
+        span.attributes.update(attributes)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Span]:
+    # W3C traceparent: 00-<trace_id 32hex>-<parent_id 16hex>-<flags>
+    parts = (header or "").split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return Span(
+        name="remote",
+        trace_id=parts[1],
+        span_id=parts[2],
+        sampled=parts[3] == "01",
+    )
+
+
+def start_span(
+    name: str, parent: Optional[Span] = None, **attributes: Any
+) -> Optional[Span]:
+    """현재 컨텍스트를 바꾸지 않고 스팬을 시작한다 (끝낼 때 end_span 호출)."""
+    if not Tracer.enabled():
+        return None
+
+    parent = parent or _current_span.get()
+    if parent is None:
+        sampled = random.random() < TRACING_SAMPLE_RATE
+        trace_id = secrets.token_hex(16)
+    else:
+        sampled = parent.sampled
+        trace_id = parent.trace_id
+
+    return Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes if sampled else {},
+        sampled=sampled,
+    )
+
+
+def end_span(span: Optional[Span]) -> None:
+    if span is None:
+        return
+    span.end_ns = time.time_ns()
+    if span.sampled:
+        Tracer.record(span)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    current = start_span(name, **attributes)
+    if current is None:
+        yield None
+        return
+
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        if not isinstance(exc, asyncio.CancelledError):
+            current.set_error(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        end_span(current)
+
+
+def traced(name: str) -> Callable:
+    """async 함수 전체를 하나의 스팬으로 감싼다."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not Tracer.enabled():
+                return await func(*args, **kwargs)
+            with span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class JsonLinesExporter:
+    """스팬을 한 줄에 하나씩 JSON으로 기록 (로컬 확인/테스트용)."""
+
+    def __init__(self, path: str = TRACING_JSONL_PATH):
+        self.path = Path(path)
+
+    async def export(self, spans: List[Span]) -> None:
+        lines = "".join(
+            json.dumps(item.to_dict(), default=str) + "\n" for item in spans
+        )
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+    async def close(self) -> None:
+        pass
+
+
+class OTLPHttpExporter:
+    """OTLP/HTTP JSON 형식으로 컬렉터(/v1/traces)에 전송."""
+
+    def __init__(
+        self,
+        endpoint: str = TRACING_OTLP_ENDPOINT,
+        service_name: str = TRACING_SERVICE_NAME,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def _attribute(key: str, value: Any) -> dict:
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+    def build_payload(self, spans: List[Span]) -> dict:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            self._attribute("service.name", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "yakssok"},
+                            "spans": [
+                                {
+                                    "traceId": item.trace_id,
+                                    "spanId": item.span_id,
+                                    "parentSpanId": item.parent_id or "",
+                                    "name": item.name,
+                                    # SPAN_KIND_INTERNAL
+                                    "kind": 1,
+                                    "startTimeUnixNano": str(item.start_ns),
+                                    "endTimeUnixNano": str(item.end_ns),
+                                    "attributes": [
+                                        self._attribute(key, value)
+                                        for key, value in item.attributes.items()
+                                    ],
+                                    # STATUS_CODE_OK = 1, STATUS_CODE_ERROR = 2
+                                    "status": {
+                                        "code": 2 if item.status == "ERROR" else 1
+                                    },
+                                }
+                                for item in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    async def export(self, spans: List[Span]) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=5)
+        response = await self._client.post(
+            self.endpoint, json=self.build_payload(spans)
+        )
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _build_exporter(name: str):
+    if name == "jsonl":
+        return JsonLinesExporter()
+    if name == "otlp":
+        return OTLPHttpExporter()
+    return None
+
+
+class Tracer:
+    """끝난 스팬 버퍼와 주기적 내보내기 작업."""
+
+    exporter = _build_exporter(TRACING_EXPORTER)
+    _buffer: List[Span] = []
+    _dropped = 0
+    _task: Optional[asyncio.Task] = None
+    _db_hooks_installed = False
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls.exporter is not None
+
+    @classmethod
+    def configure(cls, exporter) -> None:
+        cls.exporter = exporter
+        cls._buffer = []
+        if exporter is not None:
+            cls._install_db_hooks()
+
+    @classmethod
+    def record(cls, finished: Span) -> None:
+        if len(cls._buffer) >= TRACING_MAX_BUFFERED_SPANS:
+            # 내보내기가 밀리면 새 스팬을 버린다 (요청 처리에 영향 주지 않도록)
+            cls._dropped += 1
+            return
+        cls._buffer.append(finished)
+
+    @classmethod
+    async def flush(cls) -> None:
+        spans, cls._buffer = cls._buffer, []
+        if not spans or cls.exporter is None:
+            return
+        try:
+            await cls.exporter.export(spans)
+        except Exception:
+            LOGGER.warning("Failed to export %d spans", len(spans), exc_info=True)
+
+    @classmethod
+    async def _flush_loop(cls) -> None:
+        while True:
+            await asyncio.sleep(TRACING_FLUSH_INTERVAL_SECONDS)
+            await cls.flush()
+            if cls._dropped:
+                LOGGER.warning("Dropped %d spans (buffer full)", cls._dropped)
+                cls._dropped = 0
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls.enabled():
+            cls._install_db_hooks()
+        if cls.enabled() and cls._task is None:
+            cls._task = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop(cls) -> None:
+        task = cls._task
+        cls._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await cls.flush()
+        if cls.exporter is not None:
+            await cls.exporter.close()
+
+    @classmethod
+    def _install_db_hooks(cls) -> None:
+        if not cls._db_hooks_installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            event.listen(Engine, "handle_error", _handle_db_error)
+            cls._db_hooks_installed = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    if _current_span.get() is None:
+        return
+    conn.info.setdefault("trace_spans", []).append(
+        start_span("db.query", **{"db.statement": statement_shape(statement)})
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    spans = conn.info.get("trace_spans")
+    if spans:
+        end_span(spans.pop())
+
+
+def _handle_db_error(exception_context):
+    conn = exception_context.connection
+    spans = conn.info.get("trace_spans") if conn is not None else None
+    if spans:
+        failed = spans.pop()
+        if failed is not None:
+            failed.set_error(exception_context.original_exception)
+        end_span(failed)
+
+
+class TracingMiddleware:
+    """요청마다 루트 스팬을 만든다 (들어온 traceparent가 있으면 이어서)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    # 로드밸런서 프로브는 트레이스를 남기지 않는다
+    untraced_paths = frozenset({"/healthz", "/readyz"})
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not Tracer.enabled()
+            or scope.get("path") in self.untraced_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or ())
+        remote = parse_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+        root = start_span(
+            f"HTTP {scope.get('method')}",
+            parent=remote,
+            **{"http.method": scope.get("method"), "http.target": scope.get("path")},
+        )
+        token = _current_span.set(root)
+
+        async def _send(message):
+            if message["type"] == "http.response.start" and root.sampled:
+                root.attributes["http.status_code"] = message["status"]
+                if message["status"] >= 500:
+                    root.status = "ERROR"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        except BaseException as exc:
+            root.set_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            route = getattr(scope.get("route"), "path", None)
+            if route:
+                root.name = f"HTTP {scope.get('method')} {route}"
+                root.attributes["http.route"] = route
+            end_span(root)
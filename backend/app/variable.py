@@ -70,3 +70,193 @@ GOOGLE_FORCE_PROMPT_CONSENT = (
 FRONTEND_URL = _normalize_frontend_url(
     os.getenv("FRONTEND_URL", "http://localhost:5173")
 )
+
+# 가용 시간 저장 포맷: "json"(기본) 또는 "bitmask"
+AVAILABILITY_STORAGE_FORMAT = os.getenv("AVAILABILITY_STORAGE_FORMAT", "json").lower()
+
+# 약속 실시간 이벤트(SSE)
+EVENTS_REDIS_URL = os.getenv("EVENTS_REDIS_URL")
+EVENTS_MAX_CONNECTIONS_PER_APPOINTMENT = int(
+    os.getenv("EVENTS_MAX_CONNECTIONS_PER_APPOINTMENT", "100")
+)
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "32"))
+
+# 최적 시간 계산 요청 병합 결과 재사용 시간(초)
+OPTIMAL_TIMES_CACHE_TTL_SECONDS = float(
+    os.getenv("OPTIMAL_TIMES_CACHE_TTL_SECONDS", "2")
+)
+
+# 약속 버전별 최대 블록 인덱스 보관 시간(초) / 최대 개수
+OPTIMAL_TIMES_INDEX_TTL_SECONDS = float(
+    os.getenv("OPTIMAL_TIMES_INDEX_TTL_SECONDS", "600")
+)
+OPTIMAL_TIMES_INDEX_CACHE_SIZE = int(os.getenv("OPTIMAL_TIMES_INDEX_CACHE_SIZE", "256"))
+
+# 참여자별 파싱된 가용 시간 LRU: 최대 항목 수 / 보관할 전체 구간 수(메모리 상한,
+# 구간 하나당 약 150바이트) - 항목 수가 0이면 캐시 안 함
+AVAILABILITY_CACHE_SIZE = int(os.getenv("AVAILABILITY_CACHE_SIZE", "4096"))
+AVAILABILITY_CACHE_MAX_INTERVALS = int(
+    os.getenv("AVAILABILITY_CACHE_MAX_INTERVALS", "200000")
+)
+
+# 큰 약속의 가용 시간 계산을 이벤트 루프 밖에서 실행: process | thread,
+# 워커 수(0이면 항상 그대로 실행), 실행기로 보낼 최소 입력 크기(전체 가용 구간 수)
+CPU_OFFLOAD_KIND = os.getenv("CPU_OFFLOAD_KIND", "process").lower()
+CPU_OFFLOAD_WORKERS = int(os.getenv("CPU_OFFLOAD_WORKERS", "2"))
+CPU_OFFLOAD_MIN_SIZE = int(os.getenv("CPU_OFFLOAD_MIN_SIZE", "2000"))
+
+# 비용이 큰 엔드포인트 요청 제한 (사용자·라우트별 토큰 버킷)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+RATE_LIMIT_CAPACITY = int(os.getenv("RATE_LIMIT_CAPACITY", "10"))
+RATE_LIMIT_REFILL_PER_SECOND = float(os.getenv("RATE_LIMIT_REFILL_PER_SECOND", "0.5"))
+# 익명 요청을 IP로 구분할 때 X-Forwarded-For를 믿을 프록시 (쉼표 구분 IP/CIDR,
+# 비어 있으면 헤더를 무시하고 접속한 주소만 사용)
+RATE_LIMIT_TRUSTED_PROXIES = [
+    value.strip()
+    for value in os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "").split(",")
+    if value.strip()
+]
+
+# 확정/재시도 시 사용자 한 명이 발생시킬 수 있는 Google 캘린더 호출 수 제한
+GOOGLE_FANOUT_CAPACITY = int(os.getenv("GOOGLE_FANOUT_CAPACITY", "50"))
+GOOGLE_FANOUT_REFILL_PER_SECOND = float(
+    os.getenv("GOOGLE_FANOUT_REFILL_PER_SECOND", "1")
+)
+
+# Google 캘린더 푸시 알림(events.watch) - 수신 주소가 설정된 경우에만 사용
+CALENDAR_WATCH_ADDRESS = os.getenv("CALENDAR_WATCH_ADDRESS")
+CALENDAR_WATCH_TTL_SECONDS = int(os.getenv("CALENDAR_WATCH_TTL_SECONDS", "604800"))
+CALENDAR_WATCH_RENEW_BEFORE_SECONDS = int(
+    os.getenv("CALENDAR_WATCH_RENEW_BEFORE_SECONDS", "86400")
+)
+CALENDAR_WATCH_RENEW_INTERVAL_SECONDS = float(
+    os.getenv("CALENDAR_WATCH_RENEW_INTERVAL_SECONDS", "3600")
+)
+CALENDAR_WATCH_DEBOUNCE_SECONDS = float(
+    os.getenv("CALENDAR_WATCH_DEBOUNCE_SECONDS", "5")
+)
+
+# VOTING 약속 가용 시간 주기적 재동기화 스케줄러
+RESYNC_SCHEDULER_ENABLED = (
+    os.getenv("RESYNC_SCHEDULER_ENABLED", "false").lower() == "true"
+)
+RESYNC_INTERVAL_SECONDS = float(os.getenv("RESYNC_INTERVAL_SECONDS", "300"))
+RESYNC_FRESH_SECONDS = int(os.getenv("RESYNC_FRESH_SECONDS", "1800"))
+RESYNC_BATCH_SIZE = int(os.getenv("RESYNC_BATCH_SIZE", "100"))
+RESYNC_GOOGLE_QPS = float(os.getenv("RESYNC_GOOGLE_QPS", "5"))
+
+# 검증된 JWT payload 캐시 크기 (0이면 캐시 안 함)
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "1024"))
+
+# 운영 서버 실행 설정 (python -m app.server)
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "7777"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", str(os.cpu_count() or 1)))
+SERVER_RELOAD = os.getenv("SERVER_RELOAD", "false").lower() == "true"
+SERVER_LOOP = os.getenv("SERVER_LOOP", "auto")
+SERVER_HTTP = os.getenv("SERVER_HTTP", "auto")
+SERVER_GRACEFUL_TIMEOUT_SECONDS = int(
+    os.getenv("SERVER_GRACEFUL_TIMEOUT_SECONDS", "30")
+)
+SERVER_KEEPALIVE_SECONDS = int(os.getenv("SERVER_KEEPALIVE_SECONDS", "5"))
+SERVER_FORWARDED_ALLOW_IPS = os.getenv("SERVER_FORWARDED_ALLOW_IPS", "127.0.0.1")
+SERVER_LOG_LEVEL = os.getenv("SERVER_LOG_LEVEL", "info")
+
+# 워커 프로세스별 DB 커넥션 풀 크기 (전체 = 워커 수 x (풀 + 오버플로))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# Google API httpx 클라이언트 커넥션 풀 / 타임아웃
+GOOGLE_HTTP2 = os.getenv("GOOGLE_HTTP2", "true").lower() == "true"
+GOOGLE_HTTP_MAX_CONNECTIONS = int(os.getenv("GOOGLE_HTTP_MAX_CONNECTIONS", "20"))
+GOOGLE_HTTP_MAX_KEEPALIVE = int(os.getenv("GOOGLE_HTTP_MAX_KEEPALIVE", "10"))
+GOOGLE_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.getenv("GOOGLE_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")
+)
+GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS = float(
+    os.getenv("GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS", "5")
+)
+GOOGLE_HTTP_READ_TIMEOUT_SECONDS = float(
+    os.getenv("GOOGLE_HTTP_READ_TIMEOUT_SECONDS", "10")
+)
+GOOGLE_HTTP_POOL_TIMEOUT_SECONDS = float(
+    os.getenv("GOOGLE_HTTP_POOL_TIMEOUT_SECONDS", "5")
+)
+
+# 관리자 엔드포인트(/admin) 및 요청 프로파일링용 토큰 (미설정 시 관리자 기능 비활성)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+# 요청 프로파일러: X-Profile 헤더(관리자 토큰 필요) 또는 샘플링 비율로 활성화
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_DIR = os.getenv("PROFILING_DIR", "/tmp/yakssok-profiles")
+PROFILING_MAX_FILES = int(os.getenv("PROFILING_MAX_FILES", "50"))
+
+# SQL 쿼리 계측: 느린 쿼리 로그 기준(ms), 디버그 모드에서 N+1 의심 기준 반복 횟수
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+SQL_DEBUG = os.getenv("SQL_DEBUG", "false").lower() == "true"
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+
+# 분산 트레이싱: none | jsonl | otlp
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "yakssok-backend")
+TRACING_SAMPLE_RATE = float(os.getenv("TRACING_SAMPLE_RATE", "1"))
+TRACING_JSONL_PATH = os.getenv("TRACING_JSONL_PATH", "/tmp/yakssok-traces.jsonl")
+TRACING_OTLP_ENDPOINT = os.getenv(
+    "TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"
+)
+TRACING_FLUSH_INTERVAL_SECONDS = float(os.getenv("TRACING_FLUSH_INTERVAL_SECONDS", "5"))
+TRACING_MAX_BUFFERED_SPANS = int(os.getenv("TRACING_MAX_BUFFERED_SPANS", "2048"))
+
+# 새 약속의 기본 캘린더 반영 방식 (participant | organizer)
+CALENDAR_SYNC_MODE_DEFAULT = os.getenv("CALENDAR_SYNC_MODE_DEFAULT", "participant")
+
+# Google 캘린더 ETag 캐시 (조건부 요청용 목록/이벤트 표현 보관)
+GOOGLE_ETAG_CACHE_SIZE = int(os.getenv("GOOGLE_ETAG_CACHE_SIZE", "2048"))
+# 캐시 전체가 보관하는 이벤트 수 상한 (목록 응답은 이벤트 수만큼 차지)
+GOOGLE_ETAG_CACHE_MAX_ITEMS = int(os.getenv("GOOGLE_ETAG_CACHE_MAX_ITEMS", "20000"))
+# 이 시간 안에 받은 이벤트 표현은 종일 일정 수정 시 사전 GET 없이 사용
+GOOGLE_ETAG_FRESH_SECONDS = float(os.getenv("GOOGLE_ETAG_FRESH_SECONDS", "300"))
+
+# Google 호출 서킷 브레이커 (엔드포인트 묶음별): 최근 호출 창에서 실패·지연 비율이
+# 기준을 넘으면 OPEN_SECONDS 동안 즉시 실패시키고, 이후 탐색 호출로 복구 여부 확인
+GOOGLE_BREAKER_ENABLED = os.getenv("GOOGLE_BREAKER_ENABLED", "true").lower() == "true"
+GOOGLE_BREAKER_WINDOW = int(os.getenv("GOOGLE_BREAKER_WINDOW", "20"))
+GOOGLE_BREAKER_MIN_CALLS = int(os.getenv("GOOGLE_BREAKER_MIN_CALLS", "5"))
+GOOGLE_BREAKER_FAILURE_RATE = float(os.getenv("GOOGLE_BREAKER_FAILURE_RATE", "0.5"))
+GOOGLE_BREAKER_SLOW_CALL_SECONDS = float(
+    os.getenv("GOOGLE_BREAKER_SLOW_CALL_SECONDS", "3")
+)
+GOOGLE_BREAKER_OPEN_SECONDS = float(os.getenv("GOOGLE_BREAKER_OPEN_SECONDS", "30"))
+GOOGLE_BREAKER_HALF_OPEN_CALLS = int(os.getenv("GOOGLE_BREAKER_HALF_OPEN_CALLS", "1"))
+
+# Google API 할당량 스케줄러: 프로젝트·사용자별 토큰 버킷 (Redis가 있으면 워커 간 공유)
+GOOGLE_QUOTA_ENABLED = os.getenv("GOOGLE_QUOTA_ENABLED", "true").lower() == "true"
+GOOGLE_QUOTA_PROJECT_QPS = float(os.getenv("GOOGLE_QUOTA_PROJECT_QPS", "10"))
+GOOGLE_QUOTA_PROJECT_BURST = int(os.getenv("GOOGLE_QUOTA_PROJECT_BURST", "20"))
+GOOGLE_QUOTA_USER_QPS = float(os.getenv("GOOGLE_QUOTA_USER_QPS", "5"))
+GOOGLE_QUOTA_USER_BURST = int(os.getenv("GOOGLE_QUOTA_USER_BURST", "10"))
+# 백그라운드(확정 팬아웃·일괄 동기화·재동기화)가 쓸 수 있는 프로젝트 QPS 비율
+GOOGLE_QUOTA_BACKGROUND_SHARE = float(os.getenv("GOOGLE_QUOTA_BACKGROUND_SHARE", "0.6"))
+# 할당량을 기다리는 최대 시간, 넘으면 429 google_quota_exhausted
+GOOGLE_QUOTA_INTERACTIVE_MAX_WAIT_SECONDS = float(
+    os.getenv("GOOGLE_QUOTA_INTERACTIVE_MAX_WAIT_SECONDS", "5")
+)
+GOOGLE_QUOTA_BACKGROUND_MAX_WAIT_SECONDS = float(
+    os.getenv("GOOGLE_QUOTA_BACKGROUND_MAX_WAIT_SECONDS", "120")
+)
+
+# /readyz 점검: 결과 캐시 시간, DB SELECT 1 제한 시간, 준비 상태로 보는 최대 이벤트 루프
+# 지연과 작업 대기열 길이
+HEALTH_CACHE_SECONDS = float(os.getenv("HEALTH_CACHE_SECONDS", "2"))
+HEALTH_DB_TIMEOUT_SECONDS = float(os.getenv("HEALTH_DB_TIMEOUT_SECONDS", "2"))
+HEALTH_MAX_LOOP_LAG_SECONDS = float(os.getenv("HEALTH_MAX_LOOP_LAG_SECONDS", "0.5"))
+HEALTH_MAX_BACKLOG = int(os.getenv("HEALTH_MAX_BACKLOG", "1000"))
+
+# 이벤트 루프 지연 모니터: 측정 주기, 이 시간 이상 멈추면 루프 스레드 스택 기록,
+# 디버그 모드에서는 루프 스레드의 동기 I/O 호출 위치를 로그로 보고
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+LOOP_MONITOR_INTERVAL_SECONDS = float(os.getenv("LOOP_MONITOR_INTERVAL_SECONDS", "0.1"))
+LOOP_BLOCK_THRESHOLD_SECONDS = float(os.getenv("LOOP_BLOCK_THRESHOLD_SECONDS", "0.25"))
+LOOP_DEBUG_BLOCKING_IO = os.getenv("LOOP_DEBUG_BLOCKING_IO", "false").lower() == "true"
@@ -0,0 +1,183 @@
+"""Response serialization benchmark for the hot appointment endpoints.
+
+Compares the default FastAPI path (response_model re-validation + json mode dump
++ stdlib json) with the fast paths used by the routes.
+
+    cd backend && python -m benchmarks.serialization_benchmark
+"""
+
+import argparse
+import json
+import timeit
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.schema.appointment_schema import (
+    AppointmentListResponse,
+    CalendarSyncStatusResponse,
+    OptimalTimesResponse,
+)
+from app.utils.responses import (
+    FastJSONResponse,
+    adapter_json_response,
+    model_json_response,
+)
+
+_USER_ID_BASE = 109876543210987654321
+
+
+def _build_appointment_list(count: int) -> List[AppointmentListResponse]:
+    return [
+        AppointmentListResponse(
+            id=index, name=f"appointment-{index}", invite_link=f"CODE{index:04d}"
+        )
+        for index in range(count)
+    ]
+
+
+def _build_optimal_times(blocks: int, participants: int) -> OptimalTimesResponse:
+    participant_ids = [_USER_ID_BASE + index for index in range(participants)]
+    optimal_times = []
+    for index in range(blocks):
+        start_minutes = (index % 90) * 15
+        optimal_times.append(
+            {
+                "date": date(2024, 5, 1) + timedelta(days=index // 90),
+                "start_time": f"{start_minutes // 60:02d}:{start_minutes % 60:02d}",
+                "end_time": "23:59",
+                "duration_minutes": 1439 - start_minutes,
+                "participant_count": participants,
+                "total_participants": participants,
+                "participant_ids": participant_ids,
+                "availability_percentage": 100.0,
+            }
+        )
+    return OptimalTimesResponse(
+        appointment_id=1,
+        appointment_name="benchmark",
+        total_participants=participants,
+        optimal_times=optimal_times,
+        calculation_status="complete",
+    )
+
+
+def _build_calendar_sync(participants: int) -> CalendarSyncStatusResponse:
+    return CalendarSyncStatusResponse(
+        appointment_id=1,
+        invite_link="CODE0001",
+        is_creator=True,
+        summary={
+            "total": participants,
+            "success": participants,
+            "failed": 0,
+            "skipped": 0,
+            "pending": 0,
+        },
+        participants=[
+            {
+                "user_id": str(_USER_ID_BASE + index),
+                "participation_status": "ATTENDING",
+                "calendar_sync_status": "success",
+                "calendar_sync_error": None,
+                "calendar_synced_at": datetime(2024, 5, 1, 12, 0),
+                "needs_reauth": False,
+            }
+            for index in range(participants)
+        ],
+        reauth_url="/user/google/login?force=1",
+    )
+
+
+def _prepare_response_content(value: Any) -> Any:
+    # FastAPI는 반환된 모델을 먼저 dict로 풀어낸 뒤 response_model로 다시 검증한다
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True)
+    if isinstance(value, list):
+        return [_prepare_response_content(item) for item in value]
+    return value
+
+
+def _default_fastapi_path(annotation: Any, value: Any) -> Callable[[], bytes]:
+    # FastAPI serialize_response: dict 변환 -> 재검증 -> json 모드 dump -> json.dumps
+    adapter = TypeAdapter(annotation)
+
+    def run() -> bytes:
+        validated = adapter.validate_python(_prepare_response_content(value))
+        content = adapter.dump_python(validated, mode="json")
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    return run
+
+
+def _orjson_path(annotation: Any, value: Any) -> Callable[[], bytes]:
+    # response_model 재검증은 그대로 두고 기본 응답 클래스만 교체한 경우
+    adapter = TypeAdapter(annotation)
+    renderer = FastJSONResponse.__new__(FastJSONResponse)
+
+    def run() -> bytes:
+        validated = adapter.validate_python(_prepare_response_content(value))
+        return renderer.render(adapter.dump_python(validated, mode="json"))
+
+    return run
+
+
+def _pre_validated_path(annotation: Any, value: Any) -> Callable[[], bytes]:
+    # 라우트가 사용하는 경로: 재검증 없이 model_json_response / adapter_json_response
+    if isinstance(value, BaseModel):
+        return lambda: model_json_response(value).body
+    adapter = TypeAdapter(annotation)
+    return lambda: adapter_json_response(adapter, value).body
+
+
+def run_benchmark(repeat: int, number: int, scale: int) -> Dict[str, Dict[str, float]]:
+    scenarios = {
+        "GET /appointments": (
+            list[AppointmentListResponse],
+            _build_appointment_list(200 * scale),
+        ),
+        "GET /appointments/{code}/optimal-times": (
+            OptimalTimesResponse,
+            _build_optimal_times(300 * scale, 40),
+        ),
+        "GET /appointments/{code}/calendar-sync": (
+            CalendarSyncStatusResponse,
+            _build_calendar_sync(50 * scale),
+        ),
+    }
+    strategies = {
+        "fastapi_default": _default_fastapi_path,
+        "orjson_default_class": _orjson_path,
+        "pre_validated": _pre_validated_path,
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    for endpoint, (annotation, value) in scenarios.items():
+        results[endpoint] = {}
+        for name, factory in strategies.items():
+            func = factory(annotation, value)
+            best = min(timeit.repeat(func, repeat=repeat, number=number))
+            results[endpoint][name] = best / number * 1000
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeat, args.number, args.scale)
+    for endpoint, timings in results.items():
+        baseline = timings["fastapi_default"]
+        print(endpoint)
+        for name, millis in timings.items():
+            print(f"  {name:<22} {millis:8.3f} ms  x{baseline / millis:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
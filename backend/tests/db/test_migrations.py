@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+
+@pytest.fixture(autouse=True)
+def setup_path():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def legacy_engine():
+    # 컬럼 추가 전 스키마의 appointments 테이블
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE appointments ("
+                "id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+                "creator_id VARCHAR(255), max_participants INTEGER NOT NULL, "
+                "status VARCHAR(9) NOT NULL, invite_link VARCHAR(255))"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO appointments "
+                "(id, name, creator_id, max_participants, status, invite_link) "
+                "VALUES (1, 'legacy', '7', 5, 'CONFIRMED', 'CODE1')"
+            )
+        )
+    return engine
+
+
+def test_upgrade_schema_adds_missing_columns_and_backfills(legacy_engine):
+    from app.db.migrations import upgrade_schema
+
+    with legacy_engine.begin() as conn:
+        applied = upgrade_schema(conn)
+
+    assert applied == [
+        "appointments.version",
+        "appointments.calendar_sync_mode",
+        "appointments.google_event_id",
+        "ix_appointments_google_event_id",
+    ]
+    with legacy_engine.connect() as conn:
+        row = conn.execute(
+            text(
+                "SELECT version, calendar_sync_mode, google_event_id "
+                "FROM appointments WHERE id = 1"
+            )
+        ).one()
+    assert tuple(row) == (1, "participant", None)
+
+
+def test_upgrade_schema_is_idempotent(legacy_engine):
+    from app.db.migrations import upgrade_schema
+
+    with legacy_engine.begin() as conn:
+        upgrade_schema(conn)
+    with legacy_engine.begin() as conn:
+        assert upgrade_schema(conn) == []
+
+    columns = {
+        item["name"] for item in inspect(legacy_engine).get_columns("appointments")
+    }
+    assert {"version", "calendar_sync_mode", "google_event_id"} <= columns
@@ -0,0 +1,266 @@
+import asyncio
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Response
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("SECRET_KEY", "secret")
+    monkeypatch.setenv("ALGORITHM", "HS256")
+    monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+    monkeypatch.setattr(
+        "sqlalchemy.ext.asyncio.create_async_engine", lambda *a, **k: SimpleNamespace()
+    )
+
+    import app.variable
+    import app.db.session
+
+    importlib.reload(app.variable)
+    importlib.reload(app.db.session)
+
+
+@pytest.fixture
+def route_module():
+    import app.routes.appointment_route as module
+
+    return importlib.reload(module)
+
+
+def _appointment(version=1):
+    return SimpleNamespace(
+        id=7,
+        name="study",
+        creator_id="1",
+        max_participants=5,
+        status="VOTING",
+        invite_link="ABCD1234",
+        version=version,
+    )
+
+
+def test_get_appointment_sets_etag(route_module, monkeypatch):
+    async def _get_appointment(invite_code, db):
+        return _appointment()
+
+    async def _get_dates(appointment_id, db):
+        return []
+
+    monkeypatch.setattr(
+        route_module.AppointmentService,
+        "get_appointment_by_invite_code",
+        _get_appointment,
+    )
+    monkeypatch.setattr(
+        route_module.AppointmentService, "get_appointment_dates", _get_dates
+    )
+
+    response = Response()
+    result = asyncio.run(
+        route_module.get_appointment_by_invite_code(
+            "ABCD1234", response, if_none_match=None, db=SimpleNamespace()
+        )
+    )
+
+    assert result.invite_link == "ABCD1234"
+    assert response.headers["etag"] == route_module.build_etag("appointment", 7, 1)
+    assert response.headers["cache-control"] == "public, no-cache"
+
+
+def test_detail_returns_304_before_aggregation(route_module, monkeypatch):
+    async def _get_appointment(invite_code, db):
+        return _appointment(version=3)
+
+    async def _fail_detail(*args, **kwargs):
+        raise AssertionError("detail aggregation should be skipped")
+
+    monkeypatch.setattr(
+        route_module.AppointmentService,
+        "get_appointment_by_invite_code",
+        _get_appointment,
+    )
+    monkeypatch.setattr(
+        route_module.AppointmentService,
+        "get_appointment_detail_with_availability",
+        _fail_detail,
+    )
+
+    etag = route_module.build_etag("detail", 7, 3)
+    result = asyncio.run(
+        route_module.get_appointment_detail(
+            "ABCD1234", Response(), if_none_match=etag, db=SimpleNamespace()
+        )
+    )
+
+    assert result.status_code == 304
+    assert result.headers["etag"] == etag
+
+
+def test_optimal_times_returns_304_for_matching_query(route_module, monkeypatch):
+    async def _get_appointment(invite_code, db):
+        return _appointment(version=2)
+
+    async def _get_participation(user_id, appointment_id, db):
+        return SimpleNamespace(id=1)
+
+    async def _fail_calculate(*args, **kwargs):
+        raise AssertionError("optimal times should not be recalculated")
+
+    monkeypatch.setattr(
+        route_module.AppointmentService,
+        "get_appointment_by_invite_code",
+        _get_appointment,
+    )
+    monkeypatch.setattr(
+        route_module.AppointmentService, "_get_participation", _get_participation
+    )
+    monkeypatch.setattr(
+        route_module.AppointmentService, "calculate_optimal_times", _fail_calculate
+    )
+
+    etag = route_module.build_etag(
+        "optimal-times", 7, 2, 60, None, None, None, None, True
+    )
+    result = asyncio.run(
+        route_module.get_optimal_times(
+            "ABCD1234",
+            min_duration_minutes=60,
+            time_range_start=None,
+            time_range_end=None,
+            limit=None,
+            cursor=None,
+            include_participant_ids=True,
+            if_none_match=etag,
+            db=SimpleNamespace(),
+            auth=SimpleNamespace(user_id="1"),
+        )
+    )
+
+    assert result.status_code == 304
+    assert result.headers["cache-control"] == "private, no-cache"
+
+
+def test_optimal_times_handles_off_grid_time_range(route_module, monkeypatch):
+    import json
+
+    from app.services.schedule_analyzer import ScheduleAnalyzer
+
+    users = [
+        {
+            "user_id": user_id,
+            "slots": [
+                {
+                    "date": "2024-05-01",
+                    "available_times": [{"start": "09:00", "end": "12:00"}],
+                }
+            ],
+        }
+        for user_id in ("1", "2")
+    ]
+
+    async def _get_appointment(invite_code, db):
+        return _appointment(version=11)
+
+    async def _get_participation(user_id, appointment_id, db):
+        return SimpleNamespace(id=1)
+
+    async def _build_block_index(appointment_id, db):
+        # 그리드에 맞는 데이터로 만든 인덱스
+        return ScheduleAnalyzer.build_block_index(users)
+
+    class _CountSession:
+        async def execute(self, statement):
+            return SimpleNamespace(scalar=lambda: 2)
+
+    monkeypatch.setattr(
+        route_module.AppointmentService,
+        "get_appointment_by_invite_code",
+        _get_appointment,
+    )
+    monkeypatch.setattr(
+        route_module.AppointmentService, "_get_participation", _get_participation
+    )
+
+    async def _in_own_session(func):
+        return await func(SimpleNamespace())
+
+    monkeypatch.setattr(
+        route_module.AppointmentService, "_build_block_index", _build_block_index
+    )
+    monkeypatch.setattr(
+        route_module.AppointmentService, "_in_own_session", _in_own_session
+    )
+
+    result = asyncio.run(
+        route_module.get_optimal_times(
+            "ABCD1234",
+            min_duration_minutes=60,
+            time_range_start="09:10",
+            time_range_end=None,
+            limit=None,
+            cursor=None,
+            include_participant_ids=True,
+            if_none_match=None,
+            db=_CountSession(),
+            auth=SimpleNamespace(user_id="1"),
+        )
+    )
+
+    assert result.status_code == 200
+    slots = json.loads(result.body)["optimal_times"]
+    # 인덱스로 답할 수 없는 필터는 원본 슬롯으로 재계산 (500이 아니라 결과 반환)
+    assert slots[0]["start_time"] == "09:10"
+    assert slots[0]["participant_count"] == 2
+
+
+def test_event_stream_subscribes_only_once_the_body_is_sent(route_module, monkeypatch):
+    hub = route_module.AppointmentEventHub
+    monkeypatch.setattr(hub, "_subscribers", {})
+
+    async def _get_appointment(invite_code, db):
+        return _appointment(version=3)
+
+    async def _close():
+        pass
+
+    class _Request:
+        async def is_disconnected(self):
+            return False
+
+    monkeypatch.setattr(
+        route_module.AppointmentService,
+        "get_appointment_by_invite_code",
+        _get_appointment,
+    )
+
+    async def scenario():
+        abandoned = await route_module.stream_appointment_events(
+            "ABCD1234", _Request(), db=SimpleNamespace(close=_close)
+        )
+        # 본문을 읽기 전에 끊긴 연결은 구독 자리를 차지하지 않는다
+        counts = [hub.subscriber_count("ABCD1234")]
+        del abandoned
+
+        response = await route_module.stream_appointment_events(
+            "ABCD1234", _Request(), db=SimpleNamespace(close=_close)
+        )
+        body = response.body_iterator
+        first = [await body.__anext__(), await body.__anext__()]
+        counts.append(hub.subscriber_count("ABCD1234"))
+        await body.aclose()
+        counts.append(hub.subscriber_count("ABCD1234"))
+        return first, counts
+
+    first, counts = asyncio.run(scenario())
+
+    assert first[1].startswith("event: ready\nid: 3\n")
+    assert counts == [0, 1, 0]
@@ -49,15 +49,22 @@ def route_module():
     return reloaded
 
 
+def _auth(sub="user"):
+    from app.utils.auth import AuthContext
+
+    return AuthContext({"sub": sub}, SimpleNamespace())
+
+
 def test_requires_jwt_header(route_module):
+    from app.utils.auth import get_auth_context
+
     with pytest.raises(HTTPException) as exc:
-        asyncio.run(route_module.list_events(db=SimpleNamespace(), credentials=None))
+        asyncio.run(get_auth_context(credentials=None, db=SimpleNamespace()))
+    assert exc.value.status_code == 401
     assert exc.value.detail == "인증 토큰이 필요합니다."
 
 
 def test_missing_refresh_token_returns_scope_error(route_module, monkeypatch):
-    monkeypatch.setattr(route_module, "verify_token", lambda token: {"sub": "user"})
-
     async def _get_user(*args, **kwargs):
         return SimpleNamespace(google_refresh_token=None)
 
@@ -65,8 +72,7 @@ def test_missing_refresh_token_returns_scope_error(route_module, monkeypatch):
 
     response = asyncio.run(
         route_module.list_events(
-            db=SimpleNamespace(),
-            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+            auth=_auth(),
         )
     )
 
@@ -78,8 +84,6 @@ def test_missing_refresh_token_returns_scope_error(route_module, monkeypatch):
 
 
 def test_successful_event_fetch(route_module, monkeypatch):
-    monkeypatch.setattr(route_module, "verify_token", lambda token: {"sub": "user"})
-
     async def _get_user(*args, **kwargs):
         return SimpleNamespace(google_refresh_token="refresh")
 
@@ -100,8 +104,7 @@ def test_successful_event_fetch(route_module, monkeypatch):
 
     result = asyncio.run(
         route_module.list_events(
-            db=SimpleNamespace(),
-            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+            auth=_auth(),
             max_results=10,
         )
     )
@@ -110,8 +113,6 @@ def test_successful_event_fetch(route_module, monkeypatch):
 
 
 def test_invalid_grant_triggers_reauth(route_module, monkeypatch):
-    monkeypatch.setattr(route_module, "verify_token", lambda token: {"sub": "user"})
-
     async def _get_user(*args, **kwargs):
         return SimpleNamespace(google_refresh_token="refresh")
 
@@ -128,8 +129,7 @@ def test_invalid_grant_triggers_reauth(route_module, monkeypatch):
 
     response = asyncio.run(
         route_module.list_events(
-            db=SimpleNamespace(),
-            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+            auth=_auth(),
         )
     )
 
@@ -141,8 +141,6 @@ def test_invalid_grant_triggers_reauth(route_module, monkeypatch):
 
 
 def test_list_events_insufficient_scope(route_module, monkeypatch):
-    monkeypatch.setattr(route_module, "verify_token", lambda token: {"sub": "user"})
-
     async def _get_user(*args, **kwargs):
         return SimpleNamespace(google_refresh_token="refresh")
 
@@ -163,8 +161,7 @@ def test_list_events_insufficient_scope(route_module, monkeypatch):
 
     response = asyncio.run(
         route_module.list_events(
-            db=SimpleNamespace(),
-            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+            auth=_auth(),
         )
     )
 
@@ -176,8 +173,6 @@ def test_list_events_insufficient_scope(route_module, monkeypatch):
 
 
 def test_list_events_requires_reauth(route_module, monkeypatch):
-    monkeypatch.setattr(route_module, "verify_token", lambda token: {"sub": "user"})
-
     async def _get_user(*args, **kwargs):
         return SimpleNamespace(google_refresh_token="refresh")
 
@@ -198,8 +193,7 @@ def test_list_events_requires_reauth(route_module, monkeypatch):
 
     response = asyncio.run(
         route_module.list_events(
-            db=SimpleNamespace(),
-            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+            auth=_auth(),
         )
     )
 
@@ -211,8 +205,6 @@ def test_list_events_requires_reauth(route_module, monkeypatch):
 
 
 def test_list_events_scope_missing_from_service(route_module, monkeypatch):
-    monkeypatch.setattr(route_module, "verify_token", lambda token: {"sub": "user"})
-
     async def _get_user(*args, **kwargs):
         return SimpleNamespace(google_refresh_token="refresh")
 
@@ -233,8 +225,7 @@ def test_list_events_scope_missing_from_service(route_module, monkeypatch):
 
     response = asyncio.run(
         route_module.list_events(
-            db=SimpleNamespace(),
-            credentials=SimpleNamespace(scheme="Bearer", credentials="jwt"),
+            auth=_auth(),
         )
     )
 
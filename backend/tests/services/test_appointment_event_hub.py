@@ -0,0 +1,164 @@
+import asyncio
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.delenv("EVENTS_REDIS_URL", raising=False)
+    monkeypatch.setenv("EVENTS_QUEUE_SIZE", "2")
+    monkeypatch.setenv("EVENTS_MAX_CONNECTIONS_PER_APPOINTMENT", "2")
+
+    import app.variable
+
+    importlib.reload(app.variable)
+
+
+@pytest.fixture
+def hub_module():
+    import app.services.appointment_event_hub as module
+
+    reloaded = importlib.reload(module)
+    reloaded.AppointmentEventHub._subscribers = {}
+    return reloaded
+
+
+def test_publish_delivers_to_subscribers_of_same_appointment(hub_module):
+    hub = hub_module.AppointmentEventHub
+
+    async def scenario():
+        first = hub.subscribe("CODE1")
+        other = hub.subscribe("CODE2")
+        await hub.publish("CODE1", {"type": "participant_joined", "version": 2})
+        received = await asyncio.wait_for(first.get(), timeout=1)
+        return received, other._queue.qsize()
+
+    received, other_size = asyncio.run(scenario())
+
+    assert received == {"type": "participant_joined", "version": 2}
+    assert other_size == 0
+
+
+def test_slow_subscriber_is_collapsed_to_resync(hub_module):
+    hub = hub_module.AppointmentEventHub
+
+    async def scenario():
+        subscription = hub.subscribe("CODE1")
+        for version in range(5):
+            await hub.publish(
+                "CODE1", {"type": "availability_updated", "version": version}
+            )
+        events = []
+        while not subscription._queue.empty():
+            events.append(await subscription.get())
+        return events, subscription.dropped_events
+
+    events, dropped = asyncio.run(scenario())
+
+    assert events[0] == {"type": "resync"}
+    assert len(events) <= 2
+    assert dropped > 0
+
+
+def test_connection_cap_per_appointment(hub_module):
+    hub = hub_module.AppointmentEventHub
+
+    async def scenario():
+        first = hub.subscribe("CODE1")
+        hub.subscribe("CODE1")
+        with pytest.raises(hub_module.TooManySubscribersError):
+            hub.subscribe("CODE1")
+        hub.unsubscribe(first)
+        hub.subscribe("CODE1")
+        return hub.subscriber_count("CODE1")
+
+    assert asyncio.run(scenario()) == 2
+
+
+class _FakePubSub:
+    def __init__(self, script):
+        self.script = script
+        self.closed = False
+
+    async def psubscribe(self, pattern):
+        if self.script == "refuse":
+            raise ConnectionError("connection refused")
+
+    async def listen(self):
+        if self.script == "drop":
+            yield {
+                "type": "pmessage",
+                "channel": b"yakssok:appointment-events:CODE1",
+                "data": json.dumps({"type": "confirmed", "version": 3}),
+            }
+            raise ConnectionError("connection reset")
+        await asyncio.Event().wait()
+        yield {}
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeRedis:
+    def __init__(self, scripts):
+        self.scripts = list(scripts)
+        self.pubsubs = []
+
+    def pubsub(self):
+        pubsub = _FakePubSub(self.scripts.pop(0) if self.scripts else "hold")
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def aclose(self):
+        pass
+
+
+def test_redis_listener_reconnects_and_asks_for_resync(hub_module):
+    hub = hub_module.AppointmentEventHub
+    backend = hub_module._RedisEventBackend("redis://localhost:6379/0")
+    backend._redis = _FakeRedis(["refuse", "drop"])
+    backend.RECONNECT_INITIAL_SECONDS = 0
+
+    async def scenario():
+        hub._backend = backend
+        subscription = hub.subscribe("CODE1")
+        backend.start()
+        for _ in range(100):
+            if backend.reconnects == 1 and backend.connected:
+                break
+            await asyncio.sleep(0)
+        state = hub.listener_state()
+        events = []
+        while not subscription._queue.empty():
+            events.append(await subscription.get())
+        await hub.stop()
+        return state, events
+
+    state, events = asyncio.run(scenario())
+
+    assert state["connected"] is True
+    assert state["reconnects"] == 1
+    assert state["last_error"] == "ConnectionError: connection reset"
+    assert events == [{"type": "confirmed", "version": 3}, {"type": "resync"}]
+    assert all(pubsub.closed for pubsub in backend._redis.pubsubs)
+
+
+def test_format_sse_uses_version_as_event_id(hub_module):
+    frame = hub_module.format_sse({"type": "confirmed", "version": 4})
+
+    lines = frame.strip().split("\n")
+    assert lines[0] == "event: confirmed"
+    assert lines[1] == "id: 4"
+    assert json.loads(lines[2].removeprefix("data: ")) == {
+        "type": "confirmed",
+        "version": 4,
+    }
+    assert frame.endswith("\n\n")
@@ -0,0 +1,471 @@
+import asyncio
+import importlib
+import sys
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "client")
+    monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+
+    import sqlalchemy.ext.asyncio
+
+    monkeypatch.setattr(
+        sqlalchemy.ext.asyncio,
+        "create_async_engine",
+        lambda *args, **kwargs: SimpleNamespace(),
+    )
+
+    import app.variable
+
+    importlib.reload(app.variable)
+    import app.db.session
+
+    importlib.reload(app.db.session)
+
+
+class _FakeSession:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, obj):
+        pass
+
+
+def _participation(participation_id, user_id, status="ATTENDING", event_id=None):
+    return SimpleNamespace(
+        id=participation_id,
+        user_id=user_id,
+        status=status,
+        google_event_id=event_id,
+        calendar_sync_status=None,
+        calendar_sync_error=None,
+        calendar_synced_at=None,
+    )
+
+
+@pytest.fixture
+def organizer_setup(monkeypatch):
+    import app.services.appointment_service as module
+
+    service = module.AppointmentService
+    appointment = SimpleNamespace(
+        id=1,
+        name="Dinner",
+        creator_id="creator",
+        status="CONFIRMED",
+        invite_link="CODE",
+        calendar_sync_mode="organizer",
+        google_event_id=None,
+        confirmed_date=date(2024, 5, 1),
+        confirmed_start_time="18:00",
+        confirmed_end_time="20:00",
+    )
+    participations = [
+        _participation(1, "creator"),
+        _participation(2, "alice"),
+        _participation(3, "bob", status="MAYBE"),
+        _participation(4, "carol", status="NOT_ATTENDING"),
+    ]
+    users = {
+        user_id: SimpleNamespace(
+            user_id=user_id,
+            email=f"{user_id}@example.com",
+            google_refresh_token=f"refresh-{user_id}",
+        )
+        for user_id in ("creator", "alice", "bob", "carol")
+    }
+    calls = []
+
+    async def _participations(appointment_id, db):
+        return participations
+
+    async def _users(google_ids, db):
+        return {str(user_id): users[str(user_id)] for user_id in google_ids}
+
+    async def _refresh(refresh_token):
+        calls.append(("refresh", refresh_token))
+        return f"access-{refresh_token}"
+
+    async def _create(access_token, event_data, send_updates=None, cache_key=None):
+        calls.append(("create", access_token, event_data, send_updates))
+        return {"id": "organizer-event"}
+
+    async def _update(
+        access_token, event_id, event_data, send_updates=None, cache_key=None
+    ):
+        calls.append(("update", access_token, event_id, event_data, send_updates))
+        return {"id": event_id}
+
+    async def _delete(access_token, event_id, send_updates=None, cache_key=None):
+        calls.append(("delete", access_token, event_id, send_updates))
+        return {"id": event_id, "status": "deleted"}
+
+    async def _bump(appointment_id, db):
+        pass
+
+    monkeypatch.setattr(service, "_get_participations", staticmethod(_participations))
+    monkeypatch.setattr(service, "_bump_version", staticmethod(_bump))
+    monkeypatch.setattr(module.UserService, "get_users_by_google_ids", _users)
+    google = module.GoogleCalendarService
+    monkeypatch.setattr(google, "refresh_access_token", _refresh)
+    monkeypatch.setattr(google, "create_event", _create)
+    monkeypatch.setattr(google, "update_event", _update)
+    monkeypatch.setattr(google, "delete_event", _delete)
+    return service, appointment, participations, calls
+
+
+def test_organizer_mode_creates_single_event_with_attendees(organizer_setup):
+    service, appointment, participations, calls = organizer_setup
+    payload = service._build_calendar_event_payload(appointment)
+
+    asyncio.run(service._sync_organizer_calendar(appointment, payload, _FakeSession()))
+
+    assert calls == [
+        ("refresh", "refresh-creator"),
+        (
+            "create",
+            "access-refresh-creator",
+            {
+                **payload,
+                "attendees": [
+                    {"email": "alice@example.com", "optional": False},
+                    {"email": "bob@example.com", "optional": True},
+                ],
+            },
+            "all",
+        ),
+    ]
+    assert appointment.google_event_id == "organizer-event"
+    assert [p.calendar_sync_status for p in participations] == [
+        "success",
+        "success",
+        "success",
+        "skipped",
+    ]
+    # 참여자별 사본 ID는 쓰지 않는다
+    assert all(p.google_event_id is None for p in participations)
+
+
+def test_organizer_retry_only_patches_attendees(organizer_setup):
+    service, appointment, participations, calls = organizer_setup
+    appointment.google_event_id = "organizer-event"
+
+    asyncio.run(service._sync_organizer_calendar(appointment, {}, _FakeSession()))
+
+    assert [call[0] for call in calls] == ["refresh", "update"]
+    _, _, event_id, event_data, send_updates = calls[1]
+    assert event_id == "organizer-event"
+    assert list(event_data) == ["attendees"]
+    assert send_updates == "all"
+
+
+def test_switching_confirmed_appointment_to_organizer_promotes_creator_copy(
+    organizer_setup,
+):
+    service, appointment, participations, calls = organizer_setup
+    appointment.calendar_sync_mode = "participant"
+    participations[0].google_event_id = "creator-copy"
+    participations[1].google_event_id = "alice-copy"
+    db = _FakeSession()
+
+    asyncio.run(
+        service.change_calendar_sync_mode(appointment, "organizer", db, "creator")
+    )
+
+    assert appointment.calendar_sync_mode == "organizer"
+    assert appointment.google_event_id == "creator-copy"
+    assert ("delete", "access-refresh-alice", "alice-copy", None) in calls
+    assert calls[-1][0:3] == ("update", "access-refresh-creator", "creator-copy")
+    assert all(p.google_event_id is None for p in participations)
+    assert db.commits == 1
+
+    with pytest.raises(PermissionError):
+        asyncio.run(
+            service.change_calendar_sync_mode(appointment, "participant", db, "alice")
+        )
+
+
+def test_undeleted_event_copies_are_kept_and_not_invited(organizer_setup, monkeypatch):
+    service, appointment, participations, calls = organizer_setup
+    import app.services.appointment_service as module
+
+    appointment.calendar_sync_mode = "participant"
+    participations[1].google_event_id = "alice-copy"
+    participations[2].google_event_id = "bob-copy"
+    participations[2].calendar_sync_status = "success"
+
+    async def _failing_delete(access_token, event_id, send_updates=None):
+        calls.append(("delete", access_token, event_id, send_updates))
+        raise module.HTTPException(status_code=500, detail="backend_error")
+
+    async def _users(google_ids, db):
+        # bob은 토큰이 없어 사본을 지울 수 없다
+        return {
+            str(user_id): SimpleNamespace(
+                user_id=user_id,
+                email=f"{user_id}@example.com",
+                google_refresh_token=None if user_id == "bob" else f"refresh-{user_id}",
+            )
+            for user_id in google_ids
+        }
+
+    monkeypatch.setattr(module.GoogleCalendarService, "delete_event", _failing_delete)
+    monkeypatch.setattr(module.UserService, "get_users_by_google_ids", _users)
+
+    asyncio.run(
+        service.change_calendar_sync_mode(
+            appointment, "organizer", _FakeSession(), "creator"
+        )
+    )
+
+    assert participations[1].google_event_id == "alice-copy"
+    assert participations[2].google_event_id == "bob-copy"
+    assert [
+        (p.calendar_sync_status, p.calendar_sync_error) for p in participations[1:3]
+    ] == [
+        ("failed", "event_copy_delete_failed"),
+        ("failed", "event_copy_missing_refresh_token"),
+    ]
+    create = next(call for call in calls if call[0] == "create")
+    assert create[2]["attendees"] == []
+    assert participations[0].calendar_sync_status == "success"
+
+
+def test_availability_event_carries_no_participant_data():
+    from app.services.appointment_service import AppointmentService
+
+    appointment = SimpleNamespace(id=1, version=5)
+
+    event = AppointmentService._build_availability_event(
+        "participant_joined", appointment
+    )
+
+    assert event == {"type": "participant_joined", "version": 5}
+
+
+class _SyncSessionAdapter:
+    # 서비스의 실제 쿼리를 동기 sqlite 세션으로 실행
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement):
+        return self.session.execute(statement)
+
+
+def test_participation_queries_skip_heavy_columns():
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.exc import InvalidRequestError
+    from sqlalchemy.orm import Session
+
+    from app.db.base import Base
+    from app.models.appointment_model import Appointments, Participations
+    from app.services.appointment_service import AppointmentService
+    from app.utils.query_stats import query_budget
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[Appointments.__table__, Participations.__table__]
+    )
+    with Session(engine) as session:
+        session.add(
+            Appointments(
+                id=1,
+                name="study",
+                max_participants=20,
+                status="CONFIRMED",
+                invite_link="CODE",
+            )
+        )
+        session.add_all(
+            Participations(
+                user_id=str(index),
+                appointment_id=1,
+                available_slots="x" * 20000,
+                calendar_sync_status="failed",
+                calendar_sync_error="missing_refresh_token",
+            )
+            for index in range(10)
+        )
+        session.commit()
+
+    executed = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, params, context, many: executed.append(
+            (statement, params)
+        ),
+    )
+
+    def _load(*undeferred):
+        # ORM이 실제로 보낸 SELECT를 다시 실행해 전송량(바이트) 추정
+        executed.clear()
+        with Session(engine) as session:
+            with query_budget(1):
+                participations = asyncio.run(
+                    AppointmentService._get_participations(
+                        1, _SyncSessionAdapter(session), *undeferred
+                    )
+                )
+            statement, params = executed[-1]
+            rows = session.connection().exec_driver_sql(statement, params).all()
+            transferred = sum(
+                len(str(value)) for row in rows for value in row if value is not None
+            )
+            return participations, transferred
+
+    default, default_bytes = _load()
+    sync_status, sync_status_bytes = _load(Participations.calendar_sync_error)
+    full, full_bytes = _load(
+        Participations.available_slots, Participations.calendar_sync_error
+    )
+
+    assert len(default) == len(full) == 10
+    assert default_bytes < 2000 < 200000 <= full_bytes
+    assert sync_status_bytes - default_bytes == 10 * len("missing_refresh_token")
+    assert sync_status[0].calendar_sync_error == "missing_refresh_token"
+    assert len(full[0].available_slots) == 20000
+    # 지정하지 않은 큰 컬럼을 읽으면 숨은 지연 로드 대신 바로 실패
+    with Session(engine) as session:
+        participation = asyncio.run(
+            AppointmentService._get_participations(1, _SyncSessionAdapter(session))
+        )[0]
+        with pytest.raises(InvalidRequestError):
+            participation.available_slots
+
+
+def test_coalesced_optimal_times_use_dedicated_session(monkeypatch):
+    import app.services.appointment_service as service_module
+    from app.services.appointment_service import AppointmentService
+    from app.services.schedule_analyzer import ScheduleAnalyzer
+
+    sessions = []
+
+    class _OwnSession:
+        closed = False
+
+        async def __aenter__(self):
+            sessions.append(self)
+            return self
+
+        async def __aexit__(self, *exc):
+            self.closed = True
+
+    release = asyncio.Event()
+    used = []
+
+    async def _build_block_index(appointment_id, db):
+        used.append(db)
+        await release.wait()
+        return ScheduleAnalyzer.build_block_index([])
+
+    monkeypatch.setattr(service_module, "AsyncSessionLocal", _OwnSession)
+    monkeypatch.setattr(
+        AppointmentService, "_build_block_index", staticmethod(_build_block_index)
+    )
+    AppointmentService.optimal_times_flight.clear()
+    AppointmentService.optimal_index_flight.clear()
+
+    async def run():
+        leader = asyncio.create_task(
+            AppointmentService.calculate_optimal_times(
+                7, 30, "leader-session", version=1001
+            )
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            AppointmentService.calculate_optimal_times(
+                7, 30, "follower-session", version=1001
+            )
+        )
+        await asyncio.sleep(0.01)
+        # 먼저 온 요청이 취소돼도 병합된 계산과 세션은 계속 유효
+        leader.cancel()
+        release.set()
+        return await follower, leader.cancelled()
+
+    result, leader_cancelled = asyncio.run(run())
+
+    assert result == []
+    assert leader_cancelled
+    assert used and all(db in sessions for db in used)
+    assert "leader-session" not in used
+    assert all(session.closed for session in sessions)
+
+
+def test_store_available_slots_skips_unchanged_and_keeps_stale_timestamp():
+    import json
+    from datetime import datetime
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.db.base import Base
+    from app.models.appointment_model import Appointments, Participations
+    from app.services.appointment_service import AppointmentService
+
+    slots = {
+        "timezone": "Asia/Seoul",
+        "slots": [
+            {
+                "date": "2024-05-01",
+                "available_times": [{"start": "09:00", "end": "12:00"}],
+            }
+        ],
+        "calculated_at": "2024-05-01T00:00:00",
+    }
+    synced_at = datetime(2024, 5, 1, 0, 0)
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[Appointments.__table__, Participations.__table__]
+    )
+    with Session(engine, expire_on_commit=False) as session:
+        session.add(
+            Appointments(
+                id=1, name="study", max_participants=5, status="VOTING", invite_link="C"
+            )
+        )
+        participation = Participations(
+            user_id="1",
+            appointment_id=1,
+            available_slots=json.dumps(slots),
+            updated_at=synced_at,
+        )
+        session.add(participation)
+        session.commit()
+        stored = participation.available_slots
+
+        # 계산 시각만 다르면 본문은 그대로 두고 갱신 시각만 남긴다
+        recalculated = {**slots, "calculated_at": "2024-05-02T00:00:00"}
+        assert not AppointmentService._store_available_slots(
+            participation, recalculated
+        )
+        session.commit()
+        assert participation.available_slots == stored
+        assert participation.updated_at > synced_at
+
+        # Google 실패로 stale 표시된 결과는 저장하되 updated_at은 그대로
+        session.execute(Participations.__table__.update().values(updated_at=synced_at))
+        session.refresh(participation, ["updated_at", "available_slots"])
+        assert AppointmentService._store_available_slots(
+            participation, {**slots, "stale": True}
+        )
+        session.commit()
+        session.refresh(participation, ["updated_at", "available_slots"])
+        assert participation.updated_at == synced_at
+        assert json.loads(participation.available_slots)["stale"] is True
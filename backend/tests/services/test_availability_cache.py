@@ -0,0 +1,167 @@
+import importlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "client")
+    monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("AVAILABILITY_CACHE_SIZE", "2")
+    monkeypatch.setenv("AVAILABILITY_CACHE_MAX_INTERVALS", "5")
+
+    import app.variable
+
+    importlib.reload(app.variable)
+
+
+@pytest.fixture
+def cache_module():
+    import app.services.schedule_analyzer as analyzer_module
+    import app.services.availability_cache as module
+
+    importlib.reload(analyzer_module)
+    module = importlib.reload(module)
+    module.AvailabilityCache.clear()
+    return module
+
+
+def _slots(*ranges, date_str="2024-05-01"):
+    return json.dumps(
+        {
+            "timezone": "Asia/Seoul",
+            "slots": [
+                {
+                    "date": date_str,
+                    "available_times": [
+                        {"start": start, "end": end} for start, end in ranges
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def _participation(pid, raw, updated_at=datetime(2024, 5, 1, 9, 0)):
+    return SimpleNamespace(
+        id=pid, user_id=f"user-{pid}", available_slots=raw, updated_at=updated_at
+    )
+
+
+def test_cache_reuses_parse_until_updated_at_changes(cache_module, monkeypatch):
+    cache = cache_module.AvailabilityCache
+    parses = []
+    original = cache_module.ParsedAvailability.parse.__func__
+
+    def _parse(cls, raw):
+        parses.append(raw)
+        return original(cls, raw)
+
+    monkeypatch.setattr(cache_module.ParsedAvailability, "parse", classmethod(_parse))
+    participation = _participation(1, _slots(("09:00", "10:30")))
+
+    first = cache.get(participation)
+    second = cache.get(participation)
+
+    assert first is second
+    assert first.slots == (("2024-05-01", ((540, 630),)),)
+    assert first.dates == frozenset({"2024-05-01"})
+    assert len(parses) == 1
+
+    # 가용 시간을 다시 저장하면 updated_at이 바뀌어 새로 파싱
+    participation.available_slots = _slots(("11:00", "12:00"))
+    participation.updated_at = datetime(2024, 5, 1, 9, 5)
+    updated = cache.get(participation)
+
+    assert updated.slots == (("2024-05-01", ((660, 720),)),)
+    assert len(parses) == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_same_second_resave_with_equal_length_is_not_served_stale(cache_module):
+    cache = cache_module.AvailabilityCache
+    participation = _participation(1, _slots(("09:00", "10:30")))
+    cache.get(participation)
+
+    # 같은 초 안에 길이가 같은 JSON으로 다시 저장
+    participation.available_slots = _slots(("10:00", "11:30"))
+    updated = cache.get(participation)
+
+    assert updated.slots == (("2024-05-01", ((600, 690),)),)
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_cache_evicts_by_entry_count_and_interval_budget(cache_module):
+    cache = cache_module.AvailabilityCache
+    one = _participation(1, _slots(("09:00", "10:00")))
+    two = _participation(2, _slots(("09:00", "10:00"), ("11:00", "12:00")))
+    three = _participation(3, _slots(("13:00", "14:00")))
+
+    cache.get(one)
+    cache.get(two)
+    cache.get(one)
+    # 항목 수 상한(2) 초과 - 가장 오래 쓰지 않은 two 제거
+    cache.get(three)
+    assert set(cache._entries) == {1, 3}
+
+    # 구간 상한(5) 초과 - 들어갈 때까지 오래된 순으로 제거
+    big = _participation(
+        4, _slots(*[(f"{hour:02d}:00", f"{hour:02d}:30") for hour in range(4)])
+    )
+    cache.get(big)
+    assert set(cache._entries) == {3, 4}
+    assert cache.stats()["intervals"] == 5
+    assert cache.stats()["evictions"] == 2
+
+    # 상한보다 큰 항목은 보관하지 않는다
+    huge = _participation(
+        5, _slots(*[(f"{hour:02d}:00", f"{hour:02d}:30") for hour in range(6)])
+    )
+    assert cache.get(huge).interval_count == 6
+    assert 5 not in cache._entries
+
+
+def test_intervals_build_same_block_index_as_decoded_slots(cache_module):
+    analyzer = cache_module.ScheduleAnalyzer
+    legacy = _slots(("09:00", "12:00"), ("13:30", "23:59"))
+    compact = analyzer.encode_available_slots(json.loads(legacy))
+    unaligned = _slots(("09:10", "11:00"), date_str="2024-05-02")
+
+    participations = [
+        _participation(1, legacy),
+        _participation(2, compact),
+        _participation(3, unaligned),
+    ]
+    expected = analyzer.build_block_index(
+        [
+            {
+                "user_id": p.user_id,
+                "slots": analyzer.decode_available_slots(p.available_slots)["slots"],
+            }
+            for p in participations
+        ]
+    )
+    index = analyzer.build_block_index_from_intervals(
+        [
+            (p.user_id, cache_module.AvailabilityCache.get(p).slots)
+            for p in participations
+        ]
+    )
+
+    assert index.query(0) == expected.query(0)
+    assert index.query(30, "10:00", "18:00") is None
+    # 그리드 비정렬 데이터 재계산용 원본도 같은 시각으로 복원
+    assert [
+        analyzer._slots_to_intervals(user["slots"]) for user in index.user_slots
+    ] == [analyzer._slots_to_intervals(user["slots"]) for user in expected.user_slots]
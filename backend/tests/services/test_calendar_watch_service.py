@@ -0,0 +1,357 @@
+import asyncio
+import importlib
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "client")
+    monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+    monkeypatch.setenv("CALENDAR_WATCH_ADDRESS", "https://api.example.com/webhook")
+    monkeypatch.setenv("CALENDAR_WATCH_DEBOUNCE_SECONDS", "0")
+
+    import sqlalchemy.ext.asyncio
+
+    monkeypatch.setattr(
+        sqlalchemy.ext.asyncio,
+        "create_async_engine",
+        lambda *args, **kwargs: SimpleNamespace(),
+    )
+
+    import app.variable
+
+    importlib.reload(app.variable)
+    import app.db.session
+
+    importlib.reload(app.db.session)
+
+
+@pytest.fixture
+def watch_module():
+    import app.services.calendar_watch_service as module
+
+    reloaded = importlib.reload(module)
+    yield reloaded
+    reloaded.AvailabilityRecomputeQueue._pending.clear()
+    reloaded.AvailabilityRecomputeQueue._queue = None
+
+
+class _Result:
+    def __init__(self, items):
+        self._items = items
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._items)
+
+
+class _FakeSession:
+    def __init__(self, channels=()):
+        self.channels = {channel.channel_id: channel for channel in channels}
+        self.statements = []
+        self.added = []
+        self.deleted = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_commit = False
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        if statement.column_descriptions[0]["name"] == "user_id":
+            # 사용자 행 잠금
+            return _Result(["user-1"])
+        return _Result(self.channels.values())
+
+    async def get(self, model, key):
+        return self.channels.get(key)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def delete(self, obj):
+        self.deleted.append(obj)
+
+    async def commit(self):
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _channel(watch_module, expires_in_seconds, channel_id="old"):
+    return watch_module.CalendarWatchChannels(
+        channel_id=channel_id,
+        user_id="user-1",
+        resource_id="resource-old",
+        token="secret-token",
+        expiration=datetime.now() + timedelta(seconds=expires_in_seconds),
+    )
+
+
+def test_ensure_watch_reuses_channel_far_from_expiry(watch_module, monkeypatch):
+    channel = _channel(watch_module, 3 * 24 * 3600)
+    db = _FakeSession([channel])
+
+    async def _fail(*args, **kwargs):
+        raise AssertionError("should not call Google")
+
+    monkeypatch.setattr(
+        watch_module.GoogleCalendarService, "refresh_access_token", _fail
+    )
+    user = SimpleNamespace(user_id="user-1", google_refresh_token="refresh")
+
+    assert asyncio.run(watch_module.CalendarWatchService.ensure_watch(user, db)) is (
+        channel
+    )
+
+
+def test_ensure_watch_renews_and_stops_expiring_channel(watch_module, monkeypatch):
+    old_channel = _channel(watch_module, 600)
+    db = _FakeSession([old_channel])
+    calls = {}
+
+    async def _refresh(refresh_token):
+        return "access"
+
+    async def _watch(access_token, **kwargs):
+        calls["watch"] = kwargs
+        return {
+            "id": kwargs["channel_id"],
+            "resourceId": "resource-new",
+            "expiration": str(int((datetime.now().timestamp() + 7 * 86400) * 1000)),
+        }
+
+    async def _stop(access_token, channel_id, resource_id):
+        calls["stop"] = (channel_id, resource_id)
+
+    service = watch_module.GoogleCalendarService
+    monkeypatch.setattr(service, "refresh_access_token", _refresh)
+    monkeypatch.setattr(service, "watch_events", _watch)
+    monkeypatch.setattr(service, "stop_channel", _stop)
+    user = SimpleNamespace(user_id="user-1", google_refresh_token="refresh")
+
+    channel = asyncio.run(watch_module.CalendarWatchService.ensure_watch(user, db))
+
+    assert calls["watch"]["address"] == "https://api.example.com/webhook"
+    assert channel.token == calls["watch"]["token"]
+    assert channel.resource_id == "resource-new"
+    assert channel.expiration > datetime.now() + timedelta(days=6)
+    assert calls["stop"] == ("old", "resource-old")
+    assert db.added == [channel]
+    assert db.deleted == [old_channel]
+    # 읽기 트랜잭션 종료 + 교체
+    assert db.commits == 2
+
+
+def test_notification_queues_recompute_once_per_user(watch_module):
+    db = _FakeSession([_channel(watch_module, 3600)])
+    service = watch_module.CalendarWatchService
+    queue = watch_module.AvailabilityRecomputeQueue
+
+    async def run():
+        results = [
+            await service.handle_notification("old", "secret-token", "sync", db),
+            await service.handle_notification("old", "wrong", "exists", db),
+            await service.handle_notification("missing", "secret-token", "exists", db),
+            await service.handle_notification("old", "secret-token", "exists", db),
+            await service.handle_notification("old", "secret-token", "exists", db),
+        ]
+        return results, queue.pending_count()
+
+    results, pending = asyncio.run(run())
+
+    assert results == [True, False, False, True, True]
+    assert pending == 1
+
+
+def test_recompute_worker_syncs_notified_user(watch_module, monkeypatch):
+    synced = []
+
+    class _SessionContext:
+        async def __aenter__(self):
+            return "session"
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def _sync(user_id, db):
+        synced.append((user_id, db))
+        return {}
+
+    monkeypatch.setattr(watch_module, "AsyncSessionLocal", _SessionContext)
+    monkeypatch.setattr(
+        watch_module.AppointmentService, "sync_my_schedules", staticmethod(_sync)
+    )
+    queue = watch_module.AvailabilityRecomputeQueue
+
+    async def run():
+        await queue.start()
+        queue.enqueue("user-1")
+        queue.enqueue("user-1")
+        queue.enqueue("user-2")
+        for _ in range(20):
+            if len(synced) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+
+    asyncio.run(run())
+
+    assert synced == [("user-1", "session"), ("user-2", "session")]
+
+
+def _locking(statements):
+    return [
+        statement
+        for statement in statements
+        if getattr(statement, "_for_update_arg", None) is not None
+    ]
+
+
+def test_ensure_watch_holds_no_lock_during_google_calls(watch_module, monkeypatch):
+    from sqlalchemy.dialects import mysql
+
+    db = _FakeSession([_channel(watch_module, 600)])
+    seen = {}
+
+    async def _refresh(refresh_token):
+        seen["refresh"] = (len(_locking(db.statements)), db.commits)
+        return "access"
+
+    async def _watch(access_token, **kwargs):
+        seen["watch"] = (len(_locking(db.statements)), db.commits)
+        return {"id": kwargs["channel_id"], "resourceId": "resource-new"}
+
+    async def _stop(access_token, channel_id, resource_id):
+        return None
+
+    service = watch_module.GoogleCalendarService
+    monkeypatch.setattr(service, "refresh_access_token", _refresh)
+    monkeypatch.setattr(service, "watch_events", _watch)
+    monkeypatch.setattr(service, "stop_channel", _stop)
+    user = SimpleNamespace(user_id="user-1", google_refresh_token="refresh")
+
+    asyncio.run(watch_module.CalendarWatchService.ensure_watch(user, db))
+
+    # Google 호출 전에는 잠금 없이 읽고 트랜잭션을 끝낸다
+    assert seen == {"refresh": (0, 1), "watch": (0, 1)}
+    locks = _locking(db.statements)
+    assert len(locks) == 2
+    lock_sql = str(locks[0].compile(dialect=mysql.dialect()))
+    assert lock_sql.endswith("FOR UPDATE")
+
+
+def test_ensure_watch_keeps_channel_created_by_another_worker(
+    watch_module, monkeypatch
+):
+    old_channel = _channel(watch_module, 600)
+    db = _FakeSession([old_channel])
+    winner = _channel(watch_module, 7 * 24 * 3600, channel_id="winner")
+    stopped = []
+
+    async def _refresh(refresh_token):
+        return "access"
+
+    async def _watch(access_token, **kwargs):
+        # 호출하는 사이 다른 워커가 교체를 끝냈다
+        db.channels = {"winner": winner}
+        return {"id": kwargs["channel_id"], "resourceId": "resource-new"}
+
+    async def _stop(access_token, channel_id, resource_id):
+        stopped.append(resource_id)
+
+    service = watch_module.GoogleCalendarService
+    monkeypatch.setattr(service, "refresh_access_token", _refresh)
+    monkeypatch.setattr(service, "watch_events", _watch)
+    monkeypatch.setattr(service, "stop_channel", _stop)
+    user = SimpleNamespace(user_id="user-1", google_refresh_token="refresh")
+
+    channel = asyncio.run(watch_module.CalendarWatchService.ensure_watch(user, db))
+
+    assert channel is winner
+    assert stopped == ["resource-new"]
+    assert db.added == [] and db.deleted == []
+
+
+def test_ensure_watch_stops_new_channel_when_commit_fails(watch_module, monkeypatch):
+    db = _FakeSession([_channel(watch_module, 600)])
+    stopped = []
+
+    async def _refresh(refresh_token):
+        return "access"
+
+    async def _watch(access_token, **kwargs):
+        db.fail_commit = True
+        return {"id": kwargs["channel_id"], "resourceId": "resource-new"}
+
+    async def _stop(access_token, channel_id, resource_id):
+        stopped.append(resource_id)
+
+    service = watch_module.GoogleCalendarService
+    monkeypatch.setattr(service, "refresh_access_token", _refresh)
+    monkeypatch.setattr(service, "watch_events", _watch)
+    monkeypatch.setattr(service, "stop_channel", _stop)
+    user = SimpleNamespace(user_id="user-1", google_refresh_token="refresh")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(watch_module.CalendarWatchService.ensure_watch(user, db))
+
+    # 기록되지 않은 새 채널만 해지하고 기존 채널은 그대로 유지
+    assert stopped == ["resource-new"]
+    assert db.rollbacks == 1
+
+
+def test_renew_watches_loads_users_in_one_query(watch_module, monkeypatch):
+    db = _FakeSession()
+    users = {
+        user_id: SimpleNamespace(user_id=user_id, google_refresh_token="refresh")
+        for user_id in ("user-1", "user-2")
+    }
+    lookups = []
+    ensured = []
+
+    async def _execute(statement):
+        if statement.column_descriptions[0]["name"] == "user_id":
+            return _Result(["user-1", "user-2"])
+        return _Result([])
+
+    async def _get_users(google_ids, session):
+        lookups.append(set(google_ids))
+        return {key: users[key] for key in google_ids if key in users}
+
+    async def _get_user(*args, **kwargs):
+        raise AssertionError("should batch user lookups")
+
+    async def _ensure(user, session):
+        ensured.append(user.user_id)
+
+    monkeypatch.setattr(db, "execute", _execute)
+    monkeypatch.setattr(
+        watch_module.UserService, "get_users_by_google_ids", staticmethod(_get_users)
+    )
+    monkeypatch.setattr(
+        watch_module.UserService, "get_user_by_google_id", staticmethod(_get_user)
+    )
+    monkeypatch.setattr(
+        watch_module.CalendarWatchService, "ensure_watch", staticmethod(_ensure)
+    )
+
+    result = asyncio.run(watch_module.CalendarWatchService.renew_watches(db))
+
+    assert ensured == ["user-1", "user-2"]
+    assert lookups == [{"user-1", "user-2"}, set()]
+    assert result["ensured"] == 2 and result["failed"] == 0
@@ -3,6 +3,7 @@ import importlib
 import inspect
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict
 
 import anyio
@@ -134,13 +135,67 @@ async def test_get_client_reuses_instance(service_module, monkeypatch):
 
     assert client1 is client2
     assert created["count"] == 1
-    assert created["kwargs"]["timeout"] == service_module.GoogleCalendarService._TIMEOUT
+    options = service_module.GoogleCalendarService._client_options()
+    assert created["kwargs"]["timeout"] == options["timeout"]
+    assert isinstance(created["kwargs"]["transport"], service_module._GoogleTransport)
 
     await service_module.GoogleCalendarService.close_client()
     assert client1.closed is True
     assert service_module.GoogleCalendarService._client is None
 
 
+def test_client_options_split_timeouts_and_pool_limits(service_module, monkeypatch):
+    # 모듈 재로드 대신 속성만 바꿔 이후 테스트로 설정이 새지 않게 한다
+    monkeypatch.setattr(service_module, "GOOGLE_HTTP_MAX_CONNECTIONS", 7)
+    monkeypatch.setattr(service_module, "GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS", 2.0)
+    monkeypatch.setattr(service_module, "GOOGLE_HTTP2", False)
+    service = service_module.GoogleCalendarService
+
+    options = service._client_options()
+    transport_options = service._transport_options()
+
+    assert transport_options["limits"].max_connections == 7
+    assert options["timeout"].connect == 2
+    assert options["timeout"].read == service._TIMEOUT
+    assert transport_options["http2"] is False
+
+
+@pytest.mark.anyio
+async def test_pool_stats_reports_connections(service_module):
+    service = service_module.GoogleCalendarService
+    assert service.pool_stats()["open"] is False
+
+    class _Connection:
+        def __init__(self, idle):
+            self._idle = idle
+
+        def is_idle(self):
+            return self._idle
+
+        def __repr__(self):
+            return "<AsyncHTTPConnection ['https://www.googleapis.com:443', HTTP/2]>"
+
+    class _Request:
+        def __init__(self, queued):
+            self._queued = queued
+
+        def is_queued(self):
+            return self._queued
+
+    pool = SimpleNamespace(
+        connections=[_Connection(True), _Connection(False)],
+        _requests=[_Request(False), _Request(True), _Request(True)],
+    )
+    service._client = SimpleNamespace(_transport=SimpleNamespace(_pool=pool))
+
+    stats = service.pool_stats()
+
+    assert stats["open"] is True
+    assert (stats["active"], stats["idle"], stats["http2_connections"]) == (1, 1, 2)
+    assert (stats["requests_in_flight"], stats["requests_waiting"]) == (1, 2)
+    service._client = None
+
+
 @pytest.mark.anyio
 async def test_client_lock_initialized_lazily(service_module, monkeypatch):
     assert service_module.GoogleCalendarService._client_lock is None
@@ -256,8 +311,8 @@ async def test_list_primary_events_success(service_module, monkeypatch):
     assert params["maxResults"] == "10"
     assert (
         params["fields"]
-        == "items(id,status,summary,description,location,start,end,htmlLink,"
-        "organizer,creator,attendees,updated),nextPageToken"
+        == "etag,items(id,etag,status,summary,description,location,start,end,"
+        "htmlLink,organizer,creator,attendees,updated),nextPageToken"
     )
 
 
@@ -337,3 +392,310 @@ async def test_list_primary_events_scope_missing_from_google_message(
 
     assert exc.value.status_code == 400
     assert exc.value.detail == "calendar_scope_missing"
+
+
+@pytest.mark.anyio
+async def test_watch_events_registers_web_hook_channel(service_module, monkeypatch):
+    response = _FakeResponse(
+        data={"id": "channel", "resourceId": "resource", "expiration": "1700000000000"}
+    )
+    client = _FakeClient(post=lambda *args, **kwargs: response)
+    _override_client(monkeypatch, service_module, client)
+
+    result = await service_module.GoogleCalendarService.watch_events(
+        "access",
+        channel_id="channel",
+        address="https://api.example.com/calendar/webhook",
+        token="token",
+        ttl_seconds=3600,
+    )
+
+    assert result == {
+        "id": "channel",
+        "resourceId": "resource",
+        "expiration": "1700000000000",
+    }
+    call = client.post_calls[0]
+    assert call["args"][0].endswith("/events/watch")
+    assert call["kwargs"]["json"] == {
+        "id": "channel",
+        "type": "web_hook",
+        "address": "https://api.example.com/calendar/webhook",
+        "token": "token",
+        "params": {"ttl": "3600"},
+    }
+
+
+@pytest.mark.anyio
+async def test_stop_channel_ignores_missing_channel(service_module, monkeypatch):
+    response = _FakeResponse(status_code=404, data={"error": "notFound"})
+    client = _FakeClient(post=lambda *args, **kwargs: response)
+    _override_client(monkeypatch, service_module, client)
+
+    await service_module.GoogleCalendarService.stop_channel(
+        "access", "channel", "resource"
+    )
+
+    assert client.post_calls[0]["kwargs"]["json"] == {
+        "id": "channel",
+        "resourceId": "resource",
+    }
+
+
+@pytest.mark.anyio
+async def test_list_primary_events_revalidates_with_etag(service_module, monkeypatch):
+    responses = [
+        _FakeResponse(data={"etag": '"v1"', "items": [{"id": "1"}]}),
+        _FakeResponse(status_code=304, data={}),
+    ]
+    client = _FakeClient(get=lambda *args, **kwargs: responses.pop(0))
+    _override_client(monkeypatch, service_module, client)
+    service = service_module.GoogleCalendarService
+
+    first = await service.list_primary_events(
+        "access", time_min=None, time_max=None, cache_key="user"
+    )
+    second = await service.list_primary_events(
+        "access-2", time_min=None, time_max=None, cache_key="user"
+    )
+
+    assert first == second == {"events": [{"id": "1"}], "nextPageToken": None}
+    assert "If-None-Match" not in client.get_calls[0]["kwargs"]["headers"]
+    assert client.get_calls[1]["kwargs"]["headers"]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.anyio
+async def test_list_primary_events_cache_is_isolated_from_callers(
+    service_module, monkeypatch
+):
+    responses = [
+        _FakeResponse(data={"etag": '"v1"', "items": [{"id": "1"}]}),
+        _FakeResponse(status_code=304, data={}),
+    ]
+    client = _FakeClient(get=lambda *args, **kwargs: responses.pop(0))
+    _override_client(monkeypatch, service_module, client)
+    service = service_module.GoogleCalendarService
+
+    first = await service.list_primary_events(
+        "access", time_min=None, time_max=None, cache_key="user"
+    )
+    first["events"].append({"id": "mutated"})
+    first["events"][0]["id"] = "changed"
+    second = await service.list_primary_events(
+        "access", time_min=None, time_max=None, cache_key="user"
+    )
+
+    assert second == {"events": [{"id": "1"}], "nextPageToken": None}
+
+
+def test_etag_cache_is_bounded_by_total_items(service_module, monkeypatch):
+    monkeypatch.setattr(service_module, "GOOGLE_ETAG_CACHE_MAX_ITEMS", 5)
+    service = service_module.GoogleCalendarService
+    service.invalidate_etag_cache()
+
+    service._etag_store(("list", "a", ()), '"a"', {"events": []}, 3)
+    service._etag_store(("list", "b", ()), '"b"', {"events": []}, 2)
+    service._etag_store(("event", "c", "evt"), '"c"', {"id": "evt"})
+
+    # 오래된 목록부터 밀려나 총 이벤트 수가 상한 안으로 유지된다
+    assert list(service._etag_cache) == [("list", "b", ()), ("event", "c", "evt")]
+    assert service._etag_cache_items == 3
+
+    service.invalidate_etag_cache("b")
+    assert service._etag_cache_items == 1
+
+
+class _WriteClient:
+    def __init__(self, get_responses=(), put_responses=(), patch_responses=()):
+        self.get_responses = list(get_responses)
+        self.put_responses = list(put_responses)
+        self.patch_responses = list(patch_responses)
+        self.get_calls: list[Dict[str, Any]] = []
+        self.put_calls: list[Dict[str, Any]] = []
+        self.patch_calls: list[Dict[str, Any]] = []
+
+    async def get(self, url, **kwargs):
+        self.get_calls.append(kwargs)
+        return self.get_responses.pop(0)
+
+    async def put(self, url, **kwargs):
+        self.put_calls.append(kwargs)
+        return self.put_responses.pop(0)
+
+    async def patch(self, url, **kwargs):
+        self.patch_calls.append(kwargs)
+        return self.patch_responses.pop(0)
+
+
+_ALL_DAY = {"start": {"date": "2024-05-01"}, "end": {"date": "2024-05-02"}}
+
+
+@pytest.mark.anyio
+async def test_all_day_update_uses_fresh_cached_event(service_module, monkeypatch):
+    service = service_module.GoogleCalendarService
+    event = {"id": "evt", "etag": '"e1"', "summary": "old", "reminders": {"x": 1}}
+    service._etag_store(("event", "user", "evt"), '"e1"', event)
+    client = _WriteClient(
+        put_responses=[_FakeResponse(data={**event, "etag": '"e2"', "summary": "new"})]
+    )
+    _override_client(monkeypatch, service_module, client)
+
+    result = await service.update_event(
+        "access", "evt", {"summary": "new", **_ALL_DAY}, cache_key="user"
+    )
+
+    assert result["summary"] == "new"
+    assert client.get_calls == []
+    put = client.put_calls[0]
+    assert put["headers"]["If-Match"] == '"e1"'
+    assert put["json"]["reminders"] == {"x": 1}
+    assert put["json"]["start"] == {"date": "2024-05-01"}
+    # 캐시된 원본은 변경되지 않고, 응답 표현으로 갱신된다
+    assert event["summary"] == "old"
+    assert service._etag_lookup(("event", "user", "evt"))[0] == '"e2"'
+
+
+@pytest.mark.anyio
+async def test_all_day_update_refetches_on_precondition_failed(
+    service_module, monkeypatch
+):
+    service = service_module.GoogleCalendarService
+    stale = {"id": "evt", "etag": '"old"', "summary": "stale"}
+    service._etag_store(("event", "user", "evt"), '"old"', stale)
+    current = {"id": "evt", "etag": '"new"', "summary": "current"}
+    client = _WriteClient(
+        get_responses=[_FakeResponse(data=current)],
+        put_responses=[
+            _FakeResponse(status_code=412, data={}),
+            _FakeResponse(data={**current, "etag": '"newer"'}),
+        ],
+    )
+    _override_client(monkeypatch, service_module, client)
+
+    await service.update_event("access", "evt", dict(_ALL_DAY), cache_key="user")
+
+    assert [call["headers"]["If-Match"] for call in client.put_calls] == [
+        '"old"',
+        '"new"',
+    ]
+    assert "If-None-Match" not in client.get_calls[0]["headers"]
+
+
+@pytest.mark.anyio
+async def test_patch_update_sends_if_match_and_retries_on_precondition_failed(
+    service_module, monkeypatch
+):
+    service = service_module.GoogleCalendarService
+    service._etag_store(("event", "user", "evt"), '"old"', {"id": "evt"})
+    current = {"id": "evt", "etag": '"new"', "summary": "current"}
+    client = _WriteClient(
+        get_responses=[_FakeResponse(data=current)],
+        patch_responses=[
+            _FakeResponse(status_code=412, data={}),
+            _FakeResponse(data={**current, "etag": '"newer"', "summary": "new"}),
+        ],
+    )
+    _override_client(monkeypatch, service_module, client)
+
+    result = await service.update_event(
+        "access", "evt", {"summary": "new"}, cache_key="user"
+    )
+
+    assert result["summary"] == "new"
+    assert [call["headers"]["If-Match"] for call in client.patch_calls] == [
+        '"old"',
+        '"new"',
+    ]
+    assert client.put_calls == []
+    assert service._etag_lookup(("event", "user", "evt"))[0] == '"newer"'
+
+
+@pytest.mark.anyio
+async def test_patch_update_without_cached_etag_is_unconditional(
+    service_module, monkeypatch
+):
+    service = service_module.GoogleCalendarService
+    client = _WriteClient(patch_responses=[_FakeResponse(data={"id": "evt"})])
+    _override_client(monkeypatch, service_module, client)
+
+    await service.update_event("access", "evt", {"summary": "new"})
+
+    assert "If-Match" not in client.patch_calls[0]["headers"]
+    assert client.get_calls == []
+
+
+@pytest.mark.anyio
+async def test_breaker_transport_fails_fast_per_endpoint_family(
+    service_module, monkeypatch
+):
+    import httpx
+
+    monkeypatch.setattr(service_module, "GOOGLE_BREAKER_MIN_CALLS", 2)
+    monkeypatch.setattr(service_module, "GOOGLE_BREAKER_WINDOW", 2)
+    service = service_module.GoogleCalendarService
+    service._breakers.clear()
+    sent = []
+
+    def _handler(request):
+        sent.append((request.method, request.url.path))
+        if request.method == "GET":
+            return httpx.Response(503, json={"error": {"message": "backend"}})
+        return httpx.Response(200, json={"id": "evt"})
+
+    transport = service_module._GoogleTransport(httpx.MockTransport(_handler))
+    client = httpx.AsyncClient(transport=transport)
+    _override_client(monkeypatch, service_module, client)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            await service.list_primary_events("token", time_min=None, time_max=None)
+        assert exc.value.status_code == 500
+
+    with pytest.raises(HTTPException) as exc:
+        await service.list_primary_events("token", time_min=None, time_max=None)
+    assert exc.value.status_code == 503
+    assert exc.value.detail == "google_unavailable"
+    assert len(sent) == 2
+
+    # 쓰기 묶음은 별도 브레이커
+    created = await service.create_event("token", {"summary": "약속"})
+    assert created["id"] == "evt"
+    assert service.breaker_states()["events.read"]["state"] == "open"
+    assert service.breaker_states()["events.write"]["state"] == "closed"
+
+    await client.aclose()
+    service._client = None
+    service._breakers.clear()
+
+
+@pytest.mark.anyio
+async def test_breaker_ignores_per_user_rate_limits(service_module, monkeypatch):
+    import httpx
+
+    monkeypatch.setattr(service_module, "GOOGLE_BREAKER_MIN_CALLS", 2)
+    monkeypatch.setattr(service_module, "GOOGLE_BREAKER_WINDOW", 2)
+    service = service_module.GoogleCalendarService
+    service._breakers.clear()
+
+    def _handler(request):
+        if request.headers["Authorization"] == "Bearer noisy":
+            return httpx.Response(429, json={"error": {"message": "userRateLimit"}})
+        return httpx.Response(200, json={"items": []})
+
+    transport = service_module._GoogleTransport(httpx.MockTransport(_handler))
+    client = httpx.AsyncClient(transport=transport)
+    _override_client(monkeypatch, service_module, client)
+
+    # 한 사용자가 한도에 걸려도 브레이커는 닫힌 채로 다른 사용자 호출 허용
+    for _ in range(5):
+        with pytest.raises(HTTPException) as exc:
+            await service.list_primary_events("noisy", time_min=None, time_max=None)
+        assert exc.value.status_code == 429
+
+    assert service.breaker_states()["events.read"]["state"] == "closed"
+    events = await service.list_primary_events("quiet", time_min=None, time_max=None)
+    assert events["events"] == []
+
+    await client.aclose()
+    service._client = None
+    service._breakers.clear()
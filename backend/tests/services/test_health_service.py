@@ -0,0 +1,149 @@
+import asyncio
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Response
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+    monkeypatch.setenv("HEALTH_CACHE_SECONDS", "60")
+
+    import sqlalchemy.ext.asyncio
+
+    monkeypatch.setattr(
+        sqlalchemy.ext.asyncio,
+        "create_async_engine",
+        lambda *args, **kwargs: SimpleNamespace(),
+    )
+
+    import app.variable
+
+    importlib.reload(app.variable)
+    import app.db.session
+
+    importlib.reload(app.db.session)
+
+
+class _Connection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        if self.engine.error is not None:
+            raise self.engine.error
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self.engine.statements.append(str(statement))
+
+
+class _Engine:
+    def __init__(self, error=None):
+        self.error = error
+        self.statements = []
+
+    def connect(self):
+        return _Connection(self)
+
+
+@pytest.fixture
+def health_module(monkeypatch):
+    import app.services.health_service as module
+
+    reloaded = importlib.reload(module)
+    monkeypatch.setattr(
+        reloaded.GoogleCalendarService,
+        "pool_stats",
+        classmethod(lambda cls: {"open": False, "requests_waiting": 0}),
+    )
+    monkeypatch.setattr(reloaded.GoogleCalendarService, "_breakers", {})
+    return reloaded
+
+
+def test_readiness_reports_latencies_and_is_cached(health_module, monkeypatch):
+    engine = _Engine()
+    monkeypatch.setattr(health_module.db_session, "engine", engine)
+    service = health_module.HealthService
+
+    async def run():
+        return await service.readiness(), await service.readiness()
+
+    first, second = asyncio.run(run())
+
+    assert first["status"] == "ok"
+    assert first is second
+    assert engine.statements == ["SELECT 1"]
+    for name in ("database", "event_loop", "google", "queues", "events"):
+        assert first["checks"][name]["status"] == "ok"
+        assert first["checks"][name]["latency_ms"] >= 0
+    assert first["checks"]["queues"]["backlog"] == {
+        "availability_recompute": 0,
+        "google_quota": 0,
+    }
+
+
+def test_open_breaker_degrades_without_failing_readiness(health_module, monkeypatch):
+    monkeypatch.setattr(health_module.db_session, "engine", _Engine())
+    breaker = health_module.GoogleCalendarService.breaker("events.read")
+    breaker._open()
+
+    result = asyncio.run(health_module.HealthService.readiness())
+
+    assert result["status"] == "degraded"
+    assert result["checks"]["google"]["breakers"]["events.read"]["state"] == "open"
+
+
+def test_readyz_returns_503_when_database_is_down(health_module, monkeypatch):
+    import app.routes.health_route as route_module
+
+    route_module = importlib.reload(route_module)
+    monkeypatch.setattr(
+        health_module.db_session, "engine", _Engine(error=ConnectionError("down"))
+    )
+
+    response = Response()
+    result = asyncio.run(route_module.readyz(response))
+
+    assert response.status_code == 503
+    assert result["status"] == "unavailable"
+    assert result["checks"]["database"] == {
+        "status": "fail",
+        "error": "ConnectionError",
+        "latency_ms": result["checks"]["database"]["latency_ms"],
+    }
+    assert asyncio.run(route_module.healthz())["status"] == "ok"
+
+
+def test_disconnected_event_listener_degrades_readiness(health_module, monkeypatch):
+    monkeypatch.setattr(health_module.db_session, "engine", _Engine())
+    monkeypatch.setattr(
+        health_module.AppointmentEventHub,
+        "listener_state",
+        classmethod(
+            lambda cls: {
+                "connected": False,
+                "reconnects": 2,
+                "last_error": "ConnectionError: connection reset",
+                "disconnected_seconds": 4.0,
+            }
+        ),
+    )
+
+    result = asyncio.run(health_module.HealthService.readiness())
+
+    assert result["status"] == "degraded"
+    assert result["checks"]["events"]["status"] == "degraded"
+    assert result["checks"]["events"]["backend"] == "redis"
+    assert result["checks"]["events"]["reconnects"] == 2
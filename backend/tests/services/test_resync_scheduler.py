@@ -0,0 +1,276 @@
+import asyncio
+import importlib
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "client")
+    monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+    monkeypatch.setenv("RESYNC_FRESH_SECONDS", "600")
+    monkeypatch.setenv("RESYNC_GOOGLE_QPS", "1000")
+
+    import sqlalchemy.ext.asyncio
+
+    monkeypatch.setattr(
+        sqlalchemy.ext.asyncio,
+        "create_async_engine",
+        lambda *args, **kwargs: SimpleNamespace(),
+    )
+
+    import app.variable
+
+    importlib.reload(app.variable)
+    import app.db.session
+
+    importlib.reload(app.db.session)
+
+
+@pytest.fixture
+def scheduler_module():
+    import app.utils.rate_limit
+    import app.services.resync_scheduler as module
+
+    importlib.reload(app.utils.rate_limit)
+    reloaded = importlib.reload(module)
+    reloaded.ResyncScheduler._retry_after.clear()
+    return reloaded
+
+
+class _Rows:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return list(self._rows)
+
+
+class _FakeSession:
+    def __init__(self, rows=(), objects=None):
+        self.rows = rows
+        self.objects = objects or {}
+        self.commits = 0
+
+    async def execute(self, statement):
+        return _Rows(self.rows)
+
+    async def get(self, model, key, options=None):
+        return self.objects.get((model.__name__, key))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, obj):
+        pass
+
+
+def _participation(participation_id, appointment_id, updated_minutes_ago, slots="{}"):
+    return SimpleNamespace(
+        id=participation_id,
+        appointment_id=appointment_id,
+        user_id=f"user-{participation_id}",
+        available_slots=slots,
+        updated_at=datetime.now() - timedelta(minutes=updated_minutes_ago),
+    )
+
+
+def test_candidates_ordered_by_staleness_and_start_date(scheduler_module):
+    today = date.today()
+    rows = [
+        # 오래됐지만 약속이 먼 경우
+        (_participation(1, 10, 120), today + timedelta(days=9), False),
+        # 덜 오래됐지만 약속이 내일인 경우
+        (_participation(2, 20, 30), today + timedelta(days=1), False),
+        # 가용 시간이 아예 없는 경우가 가장 먼저
+        (_participation(3, 30, 5, slots=None), today + timedelta(days=20), True),
+        (_participation(4, 10, 240), today + timedelta(days=9), False),
+    ]
+
+    candidates = asyncio.run(
+        scheduler_module.ResyncScheduler.collect_candidates(_FakeSession(rows))
+    )
+
+    assert [candidate.participation_id for candidate in candidates] == [3, 4, 2, 1]
+    assert candidates[2].days_until_start == 1
+
+
+def test_run_once_updates_and_backs_off_failures(scheduler_module, monkeypatch):
+    module = scheduler_module
+    scheduler = module.ResyncScheduler
+    candidates = [
+        module.ResyncCandidate(-10.0, 1, 10, "user-a", 100.0, 1),
+        module.ResyncCandidate(-5.0, 2, 10, "user-b", 50.0, 1),
+    ]
+    participation = SimpleNamespace(id=1, user_id="user-a", available_slots=None)
+    appointment = SimpleNamespace(id=10, invite_link="CODE", version=3)
+    db = _FakeSession(
+        objects={
+            ("Participations", 1): participation,
+            ("Appointments", 10): appointment,
+        }
+    )
+    published = []
+
+    async def _collect(db):
+        return list(candidates)
+
+    async def _user(user_id, db):
+        return SimpleNamespace(user_id=user_id, google_refresh_token="refresh")
+
+    async def _dates(appointment_id, db):
+        return [SimpleNamespace(candidate_date=date.today())]
+
+    async def _slots(user, candidate_dates):
+        if user.user_id == "user-b":
+            return None
+        return {"timezone": "Asia/Seoul", "slots": [], "calculated_at": "now"}
+
+    async def _bump(appointment_id, db):
+        pass
+
+    async def _publish(invite_code, event):
+        published.append((invite_code, event["type"]))
+
+    monkeypatch.setattr(scheduler, "collect_candidates", staticmethod(_collect))
+    monkeypatch.setattr(module.UserService, "get_user_by_google_id", _user)
+    monkeypatch.setattr(module.AppointmentService, "get_appointment_dates", _dates)
+    monkeypatch.setattr(module.AppointmentService, "_bump_version", _bump)
+    monkeypatch.setattr(
+        module.ScheduleAnalyzer, "calculate_available_slots", staticmethod(_slots)
+    )
+    monkeypatch.setattr(module.AppointmentEventHub, "publish", _publish)
+
+    first = asyncio.run(scheduler.run_once(db))
+    second = asyncio.run(scheduler.run_once(db))
+
+    assert first == {"candidates": 2, "updated": 1, "unchanged": 0, "failed": 1}
+    assert participation.available_slots is not None
+    assert published == [("CODE", "availability_updated")]
+    # 실패한 참여자는 다음 실행에서 제외, 결과가 같으면 버전·이벤트 없음
+    assert second == {"candidates": 1, "updated": 0, "unchanged": 1, "failed": 0}
+    assert len(published) == 1
+
+
+def test_tokenless_users_do_not_consume_the_batch(scheduler_module, monkeypatch):
+    module = scheduler_module
+    scheduler = module.ResyncScheduler
+    statements = []
+
+    class _RecordingSession(_FakeSession):
+        async def execute(self, statement):
+            statements.append(statement)
+            return await super().execute(statement)
+
+    # 후보 조회 자체가 토큰 없는 사용자를 거른다
+    asyncio.run(scheduler.collect_candidates(_RecordingSession()))
+    sql = str(statements[0])
+    assert "JOIN users" in sql
+    assert "users.google_refresh_token IS NOT NULL" in sql
+
+    # 조회 뒤 토큰이 사라진 사용자는 배치 한도를 쓰지 않고 건너뛴다
+    candidates = [
+        module.ResyncCandidate(-10.0, 1, 10, "revoked", 100.0, 1),
+        module.ResyncCandidate(-5.0, 2, 10, "user-b", 50.0, 1),
+    ]
+    participation = SimpleNamespace(id=2, user_id="user-b", available_slots=None)
+    appointment = SimpleNamespace(id=10, invite_link="CODE", version=3)
+    db = _FakeSession(
+        objects={
+            ("Participations", 2): participation,
+            ("Appointments", 10): appointment,
+        }
+    )
+
+    async def _collect(db):
+        return list(candidates)
+
+    async def _user(user_id, db):
+        token = None if user_id == "revoked" else "refresh"
+        return SimpleNamespace(user_id=user_id, google_refresh_token=token)
+
+    async def _dates(appointment_id, db):
+        return [SimpleNamespace(candidate_date=date.today())]
+
+    async def _slots(user, candidate_dates):
+        return {"timezone": "Asia/Seoul", "slots": [], "calculated_at": "now"}
+
+    async def _noop(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(scheduler, "collect_candidates", staticmethod(_collect))
+    monkeypatch.setattr(module.UserService, "get_user_by_google_id", _user)
+    monkeypatch.setattr(module.AppointmentService, "get_appointment_dates", _dates)
+    monkeypatch.setattr(module.AppointmentService, "_bump_version", _noop)
+    monkeypatch.setattr(
+        module.ScheduleAnalyzer, "calculate_available_slots", staticmethod(_slots)
+    )
+    monkeypatch.setattr(module.AppointmentEventHub, "publish", _noop)
+
+    result = asyncio.run(scheduler.run_once(db, limit=1))
+
+    assert result == {"candidates": 2, "updated": 1, "unchanged": 0, "failed": 0}
+    assert participation.available_slots is not None
+    assert 1 in scheduler._retry_after
+
+
+class _LeaderRedis:
+    # SET NX PX / GET / DEL 만 흉내 내는 리더 키 저장소
+    def __init__(self):
+        self.values = {}
+
+    async def eval(self, script, numkeys, key, token, *args):
+        current = self.values.get(key)
+        if "DEL" in script:
+            if current == token:
+                del self.values[key]
+                return 1
+            return 0
+        if current in (None, token):
+            self.values[key] = token
+            return 1
+        return 0
+
+
+def test_only_the_leader_worker_runs_passes(scheduler_module, monkeypatch):
+    scheduler = scheduler_module.ResyncScheduler
+    redis = _LeaderRedis()
+    monkeypatch.setattr(scheduler_module.FastAPILimiter, "redis", redis)
+
+    async def scenario():
+        leader = await scheduler.acquire_leadership()
+        renewed = await scheduler.acquire_leadership()
+        # 다른 워커는 토큰이 다르다
+        monkeypatch.setattr(scheduler, "_leader_token", "other-worker")
+        follower = await scheduler.acquire_leadership()
+        return leader, renewed, follower
+
+    assert asyncio.run(scenario()) == (True, True, False)
+
+    monkeypatch.setattr(scheduler, "_leader_token", next(iter(redis.values.values())))
+    asyncio.run(scheduler.release_leadership())
+    assert redis.values == {}
+
+
+def test_scheduler_refuses_to_start_per_worker_without_redis(
+    scheduler_module, monkeypatch
+):
+    scheduler = scheduler_module.ResyncScheduler
+    monkeypatch.setattr(scheduler_module, "RESYNC_SCHEDULER_ENABLED", True)
+    monkeypatch.setattr(scheduler_module, "SERVER_RELOAD", False)
+    monkeypatch.setattr(scheduler_module, "SERVER_WORKERS", 4)
+    monkeypatch.setattr(scheduler_module.FastAPILimiter, "redis", None)
+    monkeypatch.setattr(scheduler, "_task", None)
+
+    asyncio.run(scheduler.start())
+
+    assert scheduler._task is None
@@ -0,0 +1,302 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("GOOGLE_CLIENT_ID", "client")
+    monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret")
+
+    import app.variable
+
+    importlib.reload(app.variable)
+
+
+@pytest.fixture
+def analyzer_module():
+    import app.services.schedule_analyzer as module
+
+    return importlib.reload(module)
+
+
+_LEGACY_SLOTS = {
+    "timezone": "Asia/Seoul",
+    "slots": [
+        {
+            "date": "2024-05-01",
+            "available_times": [
+                {"start": "09:00", "end": "12:00"},
+                {"start": "13:30", "end": "23:59"},
+            ],
+        },
+        {
+            "date": "2024-05-02",
+            "available_times": [{"start": "00:00", "end": "10:00"}],
+        },
+    ],
+    "calculated_at": "2024-04-30T12:00:00",
+}
+
+
+def test_bitmask_round_trip_preserves_grid_aligned_ranges(analyzer_module):
+    analyzer = analyzer_module.ScheduleAnalyzer
+
+    encoded = analyzer.encode_available_slots(_LEGACY_SLOTS)
+    payload = json.loads(encoded)
+
+    assert payload["format"] == analyzer.AVAILABILITY_FORMAT_BITMASK
+    assert payload["grid_minutes"] == analyzer.GRID_INTERVAL_MINUTES
+    assert set(payload["slots"]) == {"2024-05-01", "2024-05-02"}
+    assert len(encoded) < len(json.dumps(_LEGACY_SLOTS))
+    assert analyzer.decode_available_slots(encoded) == _LEGACY_SLOTS
+
+
+def test_bitmask_rounds_unaligned_ranges_inward(analyzer_module):
+    analyzer = analyzer_module.ScheduleAnalyzer
+    data = {
+        "timezone": "Asia/Seoul",
+        "slots": [
+            {
+                "date": "2024-05-01",
+                "available_times": [{"start": "09:10", "end": "10:50"}],
+            }
+        ],
+        "calculated_at": "2024-04-30T12:00:00",
+    }
+
+    decoded = analyzer.decode_available_slots(analyzer.encode_available_slots(data))
+
+    assert decoded["slots"][0]["available_times"] == [
+        {"start": "09:15", "end": "10:45"}
+    ]
+
+
+def test_decode_reads_legacy_json_unchanged(analyzer_module):
+    analyzer = analyzer_module.ScheduleAnalyzer
+
+    decoded = analyzer.decode_available_slots(json.dumps(_LEGACY_SLOTS))
+
+    assert decoded == _LEGACY_SLOTS
+    assert analyzer.decode_available_slots(None) is None
+
+
+def test_decode_available_dates_supports_both_formats(analyzer_module):
+    analyzer = analyzer_module.ScheduleAnalyzer
+    legacy = json.dumps(_LEGACY_SLOTS)
+    compact = analyzer.encode_available_slots(_LEGACY_SLOTS)
+
+    expected = {"2024-05-01", "2024-05-02"}
+    assert analyzer.decode_available_dates(legacy) == expected
+    assert analyzer.decode_available_dates(compact) == expected
+
+
+def test_dump_available_slots_respects_storage_format(monkeypatch, analyzer_module):
+    monkeypatch.setattr(analyzer_module, "AVAILABILITY_STORAGE_FORMAT", "bitmask")
+    compact = analyzer_module.ScheduleAnalyzer.dump_available_slots(_LEGACY_SLOTS)
+    assert json.loads(compact)["format"] == 2
+
+    monkeypatch.setattr(analyzer_module, "AVAILABILITY_STORAGE_FORMAT", "json")
+    legacy = analyzer_module.ScheduleAnalyzer.dump_available_slots(_LEGACY_SLOTS)
+    assert json.loads(legacy) == _LEGACY_SLOTS
+
+
+def test_participation_response_expands_compact_slots(analyzer_module):
+    import app.schema.appointment_schema as schema
+
+    schema = importlib.reload(schema)
+    compact = analyzer_module.ScheduleAnalyzer.encode_available_slots(_LEGACY_SLOTS)
+
+    response = schema.ParticipationResponse(
+        id=1, user_id=1, appointment_id=1, status="ATTENDING", available_slots=compact
+    )
+    summary = schema.ParticipationResponse(
+        id=1, user_id=1, appointment_id=1, status="ATTENDING"
+    )
+
+    assert response.available_slots.slots[0].available_times[0].start == "09:00"
+    assert summary.available_slots is None
+
+
+def _user_slots():
+    users = []
+    for user_id, ranges in enumerate(
+        [
+            [("09:00", "12:00"), ("14:00", "18:00")],
+            [("10:00", "13:00"), ("15:00", "17:00")],
+            [("09:30", "11:30"), ("16:00", "19:00")],
+        ],
+        start=1,
+    ):
+        users.append(
+            {
+                "user_id": user_id,
+                "slots": [
+                    {
+                        "date": date_str,
+                        "available_times": [
+                            {"start": start, "end": end} for start, end in ranges
+                        ],
+                    }
+                    for date_str in ("2024-05-01", "2024-05-02")
+                ],
+            }
+        )
+    return users
+
+
+def test_find_common_slots_limit_matches_full_sort_prefix(analyzer_module):
+    analyzer = analyzer_module.ScheduleAnalyzer
+
+    full = analyzer.find_common_slots(_user_slots(), 30)
+    top = analyzer.find_common_slots(_user_slots(), 30, limit=3)
+
+    assert top == full[:3]
+    assert [slot["participant_count"] for slot in full] == sorted(
+        (slot["participant_count"] for slot in full), reverse=True
+    )
+
+
+def test_cursor_pagination_walks_all_slots_once(analyzer_module):
+    analyzer = analyzer_module.ScheduleAnalyzer
+    full = analyzer.find_common_slots(_user_slots(), 30)
+
+    pages = []
+    cursor = None
+    while True:
+        page = analyzer.find_common_slots(_user_slots(), 30, limit=2, cursor=cursor)
+        if not page:
+            break
+        pages.extend(page)
+        cursor = analyzer.encode_slot_cursor(page[-1])
+
+    assert pages == full
+
+
+def test_decode_slot_cursor_rejects_garbage(analyzer_module):
+    with pytest.raises(ValueError):
+        analyzer_module.ScheduleAnalyzer.decode_slot_cursor("not-a-cursor")
+
+
+def _clip_user_slots(users, start, end):
+    start_minutes = int(start[:2]) * 60 + int(start[3:])
+    end_minutes = int(end[:2]) * 60 + int(end[3:])
+    clipped = []
+    for user in users:
+        slots = []
+        for slot in user["slots"]:
+            times = []
+            for time_range in slot["available_times"]:
+                range_start = int(time_range["start"][:2]) * 60 + int(
+                    time_range["start"][3:]
+                )
+                range_end = int(time_range["end"][:2]) * 60 + int(time_range["end"][3:])
+                new_start = max(range_start, start_minutes)
+                new_end = min(range_end, end_minutes)
+                if new_start < new_end:
+                    times.append(
+                        {
+                            "start": f"{new_start // 60:02d}:{new_start % 60:02d}",
+                            "end": f"{new_end // 60:02d}:{new_end % 60:02d}",
+                        }
+                    )
+            if times:
+                slots.append({"date": slot["date"], "available_times": times})
+        clipped.append({"user_id": user["user_id"], "slots": slots})
+    return clipped
+
+
+@pytest.mark.parametrize("min_duration", [0, 15, 30, 60, 120, 240])
+@pytest.mark.parametrize(
+    "time_range",
+    [
+        (None, None),
+        ("09:00", "12:00"),
+        ("10:15", "16:50"),
+        ("15:30", None),
+        (None, "23:59"),
+        ("13:00", "12:00"),
+    ],
+)
+def test_block_index_matches_full_recalculation(
+    analyzer_module, min_duration, time_range
+):
+    analyzer = analyzer_module.ScheduleAnalyzer
+    users = _user_slots()
+    users[0]["slots"][1]["available_times"].append({"start": "20:00", "end": "23:59"})
+    users[2]["slots"][1]["available_times"].append({"start": "21:00", "end": "23:59"})
+    index = analyzer.build_block_index(users)
+    start, end = time_range
+
+    if start is None and end is None:
+        expected = analyzer.find_common_slots(users, min_duration)
+    else:
+        expected = analyzer.find_common_slots(
+            _clip_user_slots(users, start or "00:00", end or "23:59"), min_duration
+        )
+
+    assert index.query(min_duration, start, end) == expected
+    assert index.query(min_duration, start, end, limit=2) == expected[:2]
+
+
+def test_block_index_defers_unaligned_time_ranges(analyzer_module):
+    analyzer = analyzer_module.ScheduleAnalyzer
+    users = _user_slots()
+    users[1]["slots"][0]["available_times"][0]["start"] = "10:10"
+
+    index = analyzer.build_block_index(users)
+
+    assert not index.grid_aligned
+    assert index.query(30) == analyzer.find_common_slots(users, 30)
+    assert index.query(30, "09:00", "12:00") is None
+    assert analyzer.build_block_index(_user_slots()).query(30, "09:05") is None
+    with pytest.raises(ValueError):
+        analyzer.build_block_index(_user_slots()).query(30, "9시")
+
+
+def test_google_failure_falls_back_to_stale_previous_slots(
+    monkeypatch, analyzer_module
+):
+    import asyncio
+    from datetime import date
+    from types import SimpleNamespace
+
+    from fastapi import HTTPException
+
+    analyzer = analyzer_module.ScheduleAnalyzer
+
+    async def _unavailable(refresh_token):
+        raise HTTPException(status_code=503, detail="google_unavailable")
+
+    monkeypatch.setattr(
+        analyzer_module.GoogleCalendarService, "refresh_access_token", _unavailable
+    )
+    user = SimpleNamespace(user_id="user-1", google_refresh_token="refresh")
+    previous = analyzer.encode_available_slots(_LEGACY_SLOTS)
+
+    stale = asyncio.run(
+        analyzer.calculate_available_slots(
+            user=user, candidate_dates=[date(2024, 5, 1)], previous=previous
+        )
+    )
+    missing = asyncio.run(
+        analyzer.calculate_available_slots(
+            user=user, candidate_dates=[date(2024, 5, 1)]
+        )
+    )
+
+    assert analyzer.is_stale(stale)
+    assert stale["calculated_at"] == _LEGACY_SLOTS["calculated_at"]
+    assert stale["slots"][0]["date"] == "2024-05-01"
+    assert missing is None
+    # 비트마스크 저장 후에도 stale 표시 유지
+    assert analyzer.decode_available_slots(analyzer.encode_available_slots(stale))[
+        "stale"
+    ]
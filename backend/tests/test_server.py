@@ -0,0 +1,46 @@
+import importlib
+import sys
+from pathlib import Path
+
+
+_ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(_ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(_ROOT_DIR))
+
+
+def _reload_server(monkeypatch, **env):
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    importlib.reload(importlib.import_module("app.variable"))
+    return importlib.reload(importlib.import_module("app.server"))
+
+
+def test_build_config_reads_server_settings(monkeypatch):
+    server = _reload_server(
+        monkeypatch,
+        SERVER_PORT="8000",
+        SERVER_WORKERS="4",
+        SERVER_RELOAD="false",
+        SERVER_GRACEFUL_TIMEOUT_SECONDS="15",
+    )
+
+    config = server.build_config()
+
+    assert config["app"] == "app.main:app"
+    assert config["port"] == 8000
+    assert config["workers"] == 4
+    assert config["reload"] is False
+    assert config["loop"] == "auto"
+    assert config["http"] == "auto"
+    assert config["timeout_graceful_shutdown"] == 15
+
+
+def test_build_config_uses_single_worker_when_reloading(monkeypatch):
+    server = _reload_server(monkeypatch, SERVER_WORKERS="8", SERVER_RELOAD="true")
+
+    config = server.build_config()
+
+    assert config["reload"] is True
+    assert config["workers"] == 1
@@ -0,0 +1,116 @@
+import asyncio
+import importlib
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("ALGORITHM", "HS256")
+    monkeypatch.setenv("AUTH_TOKEN_CACHE_SIZE", "2")
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+
+    import sqlalchemy.ext.asyncio
+
+    monkeypatch.setattr(
+        sqlalchemy.ext.asyncio,
+        "create_async_engine",
+        lambda *args, **kwargs: SimpleNamespace(),
+    )
+
+    import app.variable
+
+    importlib.reload(app.variable)
+    import app.db.session
+
+    importlib.reload(app.db.session)
+
+
+@pytest.fixture
+def jwt_module():
+    import app.utils.jwt as module
+
+    return importlib.reload(module)
+
+
+@pytest.fixture
+def auth_module(jwt_module):
+    import app.utils.auth as module
+
+    return importlib.reload(module)
+
+
+def test_decode_token_cached_skips_repeat_verification(jwt_module, monkeypatch):
+    token = jwt_module.create_access_token({"sub": "user"})
+    calls = []
+    original = jwt_module.verify_token
+
+    def _verify(value):
+        calls.append(value)
+        return original(value)
+
+    monkeypatch.setattr(jwt_module, "verify_token", _verify)
+
+    first = jwt_module.decode_token_cached(token)
+    second = jwt_module.decode_token_cached(token)
+
+    assert first["sub"] == second["sub"] == "user"
+    assert calls == [token]
+
+    # 캐시 크기를 넘으면 가장 오래된 토큰부터 제거
+    jwt_module.decode_token_cached(jwt_module.create_access_token({"sub": "a"}))
+    jwt_module.decode_token_cached(jwt_module.create_access_token({"sub": "b"}))
+    assert token not in jwt_module._token_cache
+
+
+def test_decode_token_cached_drops_expired_payload(jwt_module):
+    jwt_module._token_cache["expired"] = {"sub": "user", "exp": time.time() - 1}
+
+    assert jwt_module.decode_token_cached("expired") is None
+    assert "expired" not in jwt_module._token_cache
+
+
+def test_auth_context_loads_user_once(jwt_module, auth_module, monkeypatch):
+    calls = []
+
+    async def _get_user(google_id, db):
+        calls.append(google_id)
+        return SimpleNamespace(user_id=google_id)
+
+    monkeypatch.setattr(auth_module.UserService, "get_user_by_google_id", _get_user)
+    token = jwt_module.create_access_token({"sub": "user"})
+
+    async def run():
+        auth = await auth_module.get_auth_context(
+            credentials=SimpleNamespace(credentials=token), db="session"
+        )
+        return auth, await auth.get_user(), await auth.get_user()
+
+    auth, first, second = asyncio.run(run())
+
+    assert auth.user_id == "user"
+    assert auth["sub"] == "user"
+    assert first is second
+    assert calls == ["user"]
+
+
+def test_auth_context_rejects_invalid_token(auth_module):
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(
+            auth_module.get_auth_context(
+                credentials=SimpleNamespace(credentials="garbage"), db="session"
+            )
+        )
+
+    assert exc.value.status_code == 401
+    assert exc.value.detail == "유효하지 않은 토큰입니다."
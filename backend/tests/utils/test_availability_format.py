@@ -0,0 +1,76 @@
+import base64
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture(autouse=True)
+def setup_path():
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+
+
+def _mask(*cells):
+    mask = 0
+    for cell in cells:
+        mask |= 1 << cell
+    return base64.b64encode(mask.to_bytes(12, "little")).decode("ascii")
+
+
+def test_decode_available_slots_expands_bitmask():
+    from app.utils.availability_format import decode_available_slots
+
+    raw = json.dumps(
+        {
+            "format": 2,
+            "timezone": "Asia/Seoul",
+            "calculated_at": "2024-05-01T00:00:00",
+            "grid_minutes": 15,
+            # 09:00~09:30, 23:45~24:00
+            "slots": {"2024-05-01": _mask(36, 37, 95), "2024-05-02": _mask()},
+        }
+    )
+
+    assert decode_available_slots(raw) == {
+        "timezone": "Asia/Seoul",
+        "slots": [
+            {
+                "date": "2024-05-01",
+                "available_times": [
+                    {"start": "09:00", "end": "09:30"},
+                    {"start": "23:45", "end": "23:59"},
+                ],
+            }
+        ],
+        "calculated_at": "2024-05-01T00:00:00",
+    }
+
+
+def test_decode_available_slots_passes_legacy_json_through():
+    from app.utils.availability_format import decode_available_slots
+
+    legacy = {"timezone": "Asia/Seoul", "slots": []}
+
+    assert decode_available_slots(json.dumps(legacy)) == legacy
+    assert decode_available_slots(None) is None
+
+
+def test_appointment_schema_does_not_import_service_layer():
+    code = (
+        "import sys, app.schema.appointment_schema; "
+        "print(any(name.startswith('app.services') for name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,102 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def breaker_module():
+    import app.utils.circuit_breaker as module
+
+    return importlib.reload(module)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(breaker_module, clock, **kwargs):
+    options = dict(
+        window=4,
+        min_calls=4,
+        failure_rate=0.5,
+        slow_call_seconds=1.0,
+        open_seconds=30,
+        half_open_calls=1,
+        error_detail="google_unavailable",
+        clock=clock,
+    )
+    options.update(kwargs)
+    return breaker_module.CircuitBreaker("google.events.read", **options)
+
+
+def test_opens_on_failure_rate_including_slow_calls(breaker_module):
+    clock = _Clock()
+    breaker = _breaker(breaker_module, clock)
+
+    for elapsed, failed in [(0.1, False), (0.1, True), (0.1, False)]:
+        breaker.record(elapsed, failed=failed, probe=breaker.before_call())
+    assert breaker.state == breaker_module.CLOSED
+
+    # 느린 호출도 실패로 집계
+    breaker.record(2.5, probe=breaker.before_call())
+    assert breaker.state == breaker_module.OPEN
+
+    with pytest.raises(breaker_module.CircuitOpenError) as exc:
+        breaker.before_call()
+    assert exc.value.status_code == 503
+    assert exc.value.detail == "google_unavailable"
+    assert exc.value.headers["Retry-After"] == "30"
+
+
+def test_half_open_probe_closes_or_reopens(breaker_module):
+    clock = _Clock()
+    breaker = _breaker(breaker_module, clock, min_calls=1, window=1)
+
+    breaker.record(0.1, failed=True, probe=breaker.before_call())
+    clock.now += 30
+    assert breaker.state == breaker_module.HALF_OPEN
+
+    probe = breaker.before_call()
+    assert probe is True
+    # 탐색 호출이 진행 중이면 나머지는 즉시 실패
+    with pytest.raises(breaker_module.CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(0.1, failed=True, probe=probe)
+    assert breaker.state == breaker_module.OPEN
+    assert breaker.opened_count == 2
+
+    clock.now += 30
+    breaker.record(0.1, probe=breaker.before_call())
+    assert breaker.state == breaker_module.CLOSED
+    assert breaker.snapshot()["calls"] == 0
+
+
+def test_results_started_before_open_are_ignored(breaker_module):
+    clock = _Clock()
+    breaker = _breaker(breaker_module, clock, min_calls=1, window=1)
+
+    in_flight = breaker.before_call()
+    breaker.record(0.1, failed=True, probe=breaker.before_call())
+    clock.now += 30
+    probe = breaker.before_call()
+
+    # 열리기 전에 출발한 호출의 성공은 탐색 결과로 치지 않는다
+    breaker.record(0.1, probe=in_flight)
+    assert breaker.state == breaker_module.HALF_OPEN
+
+    breaker.release(probe)
+    assert breaker.before_call() is True
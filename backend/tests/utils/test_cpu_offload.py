@@ -0,0 +1,110 @@
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def offload_module(monkeypatch):
+    import app.utils.cpu_offload as module
+
+    monkeypatch.setattr(module, "CPU_OFFLOAD_KIND", "thread")
+    monkeypatch.setattr(module, "CPU_OFFLOAD_WORKERS", 1)
+    monkeypatch.setattr(module, "CPU_OFFLOAD_MIN_SIZE", 100)
+    offload = module.CpuOffload
+    offload._executor = None
+    offload.offloaded = offload.inline = offload.failures = offload.in_flight = 0
+    offload.queue_wait_total = offload.queue_wait_max = 0.0
+    yield module
+    asyncio.run(offload.stop())
+
+
+def _blocking_work(seconds):
+    time.sleep(seconds)
+    return threading.current_thread().name
+
+
+def test_small_inputs_run_inline_large_inputs_leave_the_loop(offload_module):
+    offload = offload_module.CpuOffload
+
+    async def run():
+        inline = await offload.run(_blocking_work, 0, size=10)
+
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        offloaded = await offload.run(_blocking_work, 0.1, size=500)
+        await ticker_task
+        return inline, offloaded, ticks
+
+    inline, offloaded, ticks = asyncio.run(run())
+
+    assert inline == threading.main_thread().name
+    assert offloaded.startswith("cpu-offload")
+    # 계산 중에도 이벤트 루프가 다른 작업을 계속 처리
+    assert len(ticks) == 5
+    stats = offload.stats()
+    assert stats["inline"] == 1
+    assert stats["offloaded"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["queue_wait_max_ms"] >= 0
+
+
+def test_broken_pool_falls_back_to_inline(offload_module):
+    offload = offload_module.CpuOffload
+
+    class _BrokenExecutor(Executor):
+        def submit(self, fn, *args, **kwargs):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+    broken = _BrokenExecutor()
+    offload._executor = broken
+
+    result = asyncio.run(offload.run(_blocking_work, 0, size=500))
+
+    assert result == threading.main_thread().name
+    assert offload._executor is None
+    assert offload.stats()["failures"] == 1
+
+
+def test_block_index_round_trips_through_process_pool(offload_module, monkeypatch):
+    from app.services.schedule_analyzer import ScheduleAnalyzer
+
+    monkeypatch.setattr(offload_module, "CPU_OFFLOAD_KIND", "process")
+    offload = offload_module.CpuOffload
+    user_intervals = [
+        (f"user-{user}", (("2024-05-01", ((540 + user * 15, 720),)),))
+        for user in range(4)
+    ]
+
+    async def run():
+        return await offload.run(
+            ScheduleAnalyzer.build_block_index_from_intervals,
+            user_intervals,
+            size=500,
+        )
+
+    index = asyncio.run(run())
+
+    expected = ScheduleAnalyzer.build_block_index_from_intervals(user_intervals)
+    assert offload.stats()["offloaded"] == 1
+    assert index.query(30) == expected.query(30)
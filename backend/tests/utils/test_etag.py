@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_path():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+def test_build_etag_is_strong_and_changes_with_version():
+    from app.utils.etag import build_etag
+
+    first = build_etag("detail", 1, 3)
+    second = build_etag("detail", 1, 4)
+
+    assert first.startswith('"') and first.endswith('"')
+    assert first == build_etag("detail", 1, 3)
+    assert first != second
+
+
+def test_etag_matches_handles_lists_weak_and_wildcard():
+    from app.utils.etag import build_etag, etag_matches
+
+    etag = build_etag("detail", 1, 3)
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_not_modified_response_carries_cache_headers():
+    from app.utils.etag import (
+        PRIVATE_CACHE_CONTROL,
+        PUBLIC_CACHE_CONTROL,
+        not_modified_response,
+    )
+
+    private = not_modified_response('"abc"', PRIVATE_CACHE_CONTROL)
+    public = not_modified_response('"abc"', PUBLIC_CACHE_CONTROL)
+
+    assert private.status_code == 304
+    assert private.headers["etag"] == '"abc"'
+    assert private.headers["cache-control"] == "private, no-cache"
+    assert private.headers["vary"] == "Authorization"
+    assert public.headers["cache-control"] == "public, no-cache"
+    assert "vary" not in public.headers
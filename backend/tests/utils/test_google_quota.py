@@ -0,0 +1,103 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+
+@pytest.fixture(autouse=True)
+def setup_env():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def quota_module(monkeypatch):
+    import app.utils.google_quota as module
+    from app.utils.rate_limit import TokenBucketLimiter
+
+    # 버킷 하나짜리 프로젝트 할당량, 20ms마다 토큰 충전
+    monkeypatch.setattr(module, "GOOGLE_QUOTA_ENABLED", True)
+    monkeypatch.setattr(module, "GOOGLE_QUOTA_PROJECT_QPS", 50.0)
+    monkeypatch.setattr(module, "GOOGLE_QUOTA_PROJECT_BURST", 1)
+    monkeypatch.setattr(module, "GOOGLE_QUOTA_USER_QPS", 1000.0)
+    monkeypatch.setattr(module, "GOOGLE_QUOTA_USER_BURST", 100)
+    monkeypatch.setattr(module, "GOOGLE_QUOTA_BACKGROUND_SHARE", 1.0)
+    TokenBucketLimiter.reset()
+    scheduler = module.GoogleQuotaScheduler
+    for counters in (
+        scheduler._granted,
+        scheduler._queued_total,
+        scheduler._timeouts,
+    ):
+        for priority in counters:
+            counters[priority] = 0
+    yield module
+    TokenBucketLimiter.reset()
+
+
+def test_interactive_first_then_round_robin_between_users(quota_module):
+    scheduler = quota_module.GoogleQuotaScheduler
+    background = quota_module.PRIORITY_BACKGROUND
+    granted = []
+
+    async def call(user_id, priority):
+        with scheduler.context(user_id=user_id, priority=priority):
+            await scheduler.acquire()
+        granted.append(user_id)
+
+    async def run():
+        # 첫 토큰은 바로 허가되고 나머지는 대기열로
+        await scheduler.acquire(user_id="warmup")
+        tasks = [
+            asyncio.create_task(call("user-a", background)),
+            asyncio.create_task(call("user-a", background)),
+            asyncio.create_task(call("user-b", background)),
+            asyncio.create_task(call("user-c", None)),
+        ]
+        await asyncio.sleep(0)
+        depth = scheduler.queue_depth()
+        await asyncio.gather(*tasks)
+        await scheduler.stop()
+        return depth
+
+    depth = asyncio.run(run())
+
+    assert depth == 4
+    assert granted == ["user-c", "user-a", "user-b", "user-a"]
+    stats = scheduler.stats()["priorities"]
+    assert stats["background"]["granted"] == 3
+    assert stats["interactive"]["queued_total"] == 1
+    assert stats["background"]["queued"] == 0
+
+
+def test_interactive_wait_limit_raises_429(quota_module, monkeypatch):
+    monkeypatch.setattr(quota_module, "GOOGLE_QUOTA_PROJECT_QPS", 0.01)
+    monkeypatch.setattr(quota_module, "GOOGLE_QUOTA_INTERACTIVE_MAX_WAIT_SECONDS", 0.05)
+    scheduler = quota_module.GoogleQuotaScheduler
+
+    async def run():
+        await scheduler.acquire(user_id="user-a")
+        try:
+            await scheduler.acquire(user_id="user-a")
+        finally:
+            await scheduler.stop()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(run())
+
+    assert exc.value.status_code == 429
+    assert exc.value.detail == "google_quota_exhausted"
+    assert scheduler.stats()["priorities"]["interactive"]["timeouts"] == 1
+
+
+def test_context_inherits_outer_values(quota_module):
+    scheduler = quota_module.GoogleQuotaScheduler
+
+    assert scheduler.current() == ("-", quota_module.PRIORITY_INTERACTIVE)
+    with scheduler.context(priority=quota_module.PRIORITY_BACKGROUND):
+        with scheduler.context(user_id=42):
+            assert scheduler.current() == ("42", quota_module.PRIORITY_BACKGROUND)
+    assert scheduler.current() == ("-", quota_module.PRIORITY_INTERACTIVE)
@@ -0,0 +1,95 @@
+import asyncio
+import socket
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_env():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def monitor_module(monkeypatch):
+    import app.utils.loop_monitor as module
+
+    monkeypatch.setattr(module, "LOOP_MONITOR_ENABLED", True)
+    monkeypatch.setattr(module, "LOOP_MONITOR_INTERVAL_SECONDS", 0.02)
+    monkeypatch.setattr(module, "LOOP_BLOCK_THRESHOLD_SECONDS", 0.1)
+    monkeypatch.setattr(module, "LOOP_DEBUG_BLOCKING_IO", False)
+    module.LoopMonitor.reset()
+    yield module
+    module.LoopMonitor._debug_enabled = False
+    module.LoopMonitor.reset()
+
+
+def _blocking_handler():
+    time.sleep(0.3)
+
+
+def test_monitor_records_lag_and_captures_blocking_stack(monitor_module):
+    monitor = monitor_module.LoopMonitor
+
+    async def run():
+        await monitor.start()
+        await asyncio.sleep(0.1)
+        await asyncio.create_task(_blocked(), name="slow-request")
+        await asyncio.sleep(0.05)
+        stats = monitor.stats()
+        await monitor.stop()
+        return stats
+
+    async def _blocked():
+        _blocking_handler()
+
+    stats = asyncio.run(run())
+
+    lag = stats["lag_ms"]
+    assert lag["count"] >= 3
+    assert lag["max"] >= 200
+    # 누적 버킷: 250ms 이하 구간에는 긴 지연이 빠지고 +Inf에는 전부 포함
+    assert lag["buckets"]["100"] < lag["buckets"]["+Inf"] == lag["count"]
+
+    assert stats["stalls"] == 1
+    stall = stats["recent_stalls"][0]
+    assert stall["task"] == "slow-request"
+    assert any("_blocking_handler" in line for line in stall["stack"])
+
+
+def test_debug_mode_reports_sync_io_on_loop_thread(monitor_module, tmp_path):
+    monitor = monitor_module.LoopMonitor
+    target = tmp_path / "data.txt"
+    target.write_text("x")
+
+    async def run():
+        monitor._loop_thread_id = monitor_module.threading.get_ident()
+        monitor.enable_blocking_io_debug()
+
+        with open(target) as f:
+            f.read()
+        # 다른 스레드의 동기 I/O와 논블로킹 소켓은 보고하지 않는다
+        await asyncio.to_thread(target.read_text)
+        with socket.socket() as sock:
+            sock.setblocking(False)
+            try:
+                sock.connect(("127.0.0.1", 9))
+            except OSError:
+                pass
+        for _ in range(2):
+            with socket.socket() as sock:
+                try:
+                    sock.connect(("127.0.0.1", 9))
+                except OSError:
+                    pass
+        return monitor.stats()
+
+    stats = asyncio.run(run())
+
+    assert stats["blocking_calls"] == {"open": 1, "socket.connect": 2}
+    # 같은 호출 위치는 한 번만 로그
+    assert len(monitor._reported_sites) == 2
@@ -0,0 +1,109 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch, tmp_path):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("ADMIN_TOKEN", "admin-secret")
+    monkeypatch.setenv("PROFILING_SAMPLE_RATE", "0")
+    monkeypatch.setenv("PROFILING_DIR", str(tmp_path))
+    monkeypatch.setenv("PROFILING_MAX_FILES", "2")
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URL_USER", "sqlite+aiosqlite:///:memory:")
+
+    import sqlalchemy.ext.asyncio
+
+    monkeypatch.setattr(
+        sqlalchemy.ext.asyncio,
+        "create_async_engine",
+        lambda *args, **kwargs: SimpleNamespace(),
+    )
+
+    import app.variable
+
+    importlib.reload(app.variable)
+    import app.db.session
+
+    importlib.reload(app.db.session)
+
+
+@pytest.fixture
+def profiling_module():
+    import app.utils.profiling as module
+
+    return importlib.reload(module)
+
+
+def _client(profiling_module):
+    api = FastAPI()
+
+    @api.get("/appointments/{invite_code}/optimal-times")
+    async def optimal_times(invite_code: str):
+        profiling_module.record_google_call(0.25)
+        return {"invite_code": invite_code}
+
+    api.add_middleware(profiling_module.ProfilingMiddleware)
+    return TestClient(api)
+
+
+def test_profiles_only_admin_flagged_requests(profiling_module, tmp_path):
+    client = _client(profiling_module)
+    headers = {"X-Profile": "1", "X-Admin-Token": "admin-secret"}
+
+    assert client.get("/appointments/ABC/optimal-times").status_code == 200
+    assert client.get(
+        "/appointments/ABC/optimal-times",
+        headers={"X-Profile": "1", "X-Admin-Token": "wrong"},
+    ).json() == {"invite_code": "ABC"}
+    assert list(tmp_path.iterdir()) == []
+
+    assert client.get("/appointments/ABC/optimal-times", headers=headers).json() == {
+        "invite_code": "ABC"
+    }
+
+    (meta_path,) = tmp_path.glob("*.json")
+    meta = json.loads(meta_path.read_text())
+    assert "_appointments-invite-code-optimal-times_ABC" in meta_path.name
+    assert meta_path.with_suffix(".prof").exists()
+    assert meta["route"] == "/appointments/{invite_code}/optimal-times"
+    assert meta["invite_code"] == "ABC"
+    assert meta["status_code"] == 200
+    assert meta["google_calls"] == 1
+    assert meta["google_seconds"] == 0.25
+    assert profiling_module.current_timings() is None
+
+
+def test_list_profiles_returns_newest_and_prunes(profiling_module, tmp_path):
+    for index in range(3):
+        (tmp_path / f"100{index}_GET_x_-.json").write_text(json.dumps({"n": index}))
+        (tmp_path / f"100{index}_GET_x_-.prof").write_text("")
+    profiling_module._prune(tmp_path)
+
+    assert [item["n"] for item in profiling_module.list_profiles()] == [2, 1]
+    assert not (tmp_path / "1000_GET_x_-.prof").exists()
+
+
+def test_admin_profiles_endpoint_requires_token(profiling_module):
+    import app.utils.auth
+    import app.routes.admin_route as admin_route
+
+    importlib.reload(app.utils.auth)
+    admin_route = importlib.reload(admin_route)
+    api = FastAPI()
+    api.include_router(admin_route.router)
+    client = TestClient(api)
+
+    assert client.get("/admin/profiles").status_code == 403
+    response = client.get("/admin/profiles", headers={"X-Admin-Token": "admin-secret"})
+    assert response.status_code == 200
+    assert response.json() == {"profiles": []}
@@ -0,0 +1,110 @@
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+
+@pytest.fixture(autouse=True)
+def setup_env():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def stats_module(monkeypatch):
+    # 리스너는 Engine 클래스에 전역 등록되므로 모듈을 reload 하지 않고 설정만 바꾼다
+    import app.utils.query_stats as module
+
+    monkeypatch.setattr(module, "SQL_DEBUG", True)
+    monkeypatch.setattr(module, "SQL_N_PLUS_ONE_THRESHOLD", 3)
+    monkeypatch.setattr(module, "SQL_SLOW_QUERY_MS", 100000)
+    return module
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+    yield engine
+    engine.dispose()
+
+
+def test_track_queries_counts_nested_blocks(stats_module, engine):
+    with stats_module.track_queries() as outer:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with stats_module.track_queries() as inner:
+                conn.execute(text("SELECT * FROM users WHERE id = :id"), {"id": 1})
+
+    assert outer.count == 2
+    assert inner.count == 1
+    assert outer.total_seconds >= inner.total_seconds > 0
+    assert stats_module.current_query_stats() is None
+
+
+def test_flags_repeated_statement_shapes(stats_module, engine, caplog):
+    caplog.set_level(logging.WARNING, logger=stats_module.__name__)
+
+    with stats_module.track_queries("sync") as stats:
+        with engine.connect() as conn:
+            for user_id in range(3):
+                conn.execute(
+                    text("SELECT * FROM users WHERE id = :id"), {"id": user_id}
+                )
+            conn.execute(
+                text("SELECT * FROM users WHERE id IN (:a, :b)"), {"a": 1, "b": 2}
+            )
+
+    assert stats.repeated_shapes() == [("SELECT * FROM users WHERE id = ?", 3)]
+    assert "Possible N+1 in sync: 3 x SELECT * FROM users WHERE id = ?" in caplog.text
+    assert stats_module.statement_shape(
+        "SELECT * FROM users WHERE id IN (?, ?,\n ?)"
+    ) == ("SELECT * FROM users WHERE id IN (?)")
+
+
+def test_query_budget_fails_when_exceeded(stats_module, engine):
+    with stats_module.query_budget(2):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    with pytest.raises(AssertionError, match="at most 1 queries, got 2"):
+        with stats_module.query_budget(1):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+
+def test_logs_slow_queries_with_parameters(stats_module, engine, monkeypatch, caplog):
+    monkeypatch.setattr(stats_module, "SQL_SLOW_QUERY_MS", 0)
+    stats_module.install_query_instrumentation()
+    caplog.set_level(logging.WARNING, logger=stats_module.__name__)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT * FROM users WHERE id = :id"), {"id": 42})
+
+    assert "Slow query" in caplog.text
+    assert "(42,)" in caplog.text
+
+
+def test_middleware_reports_server_timing(stats_module, engine):
+    api = FastAPI()
+
+    @api.get("/ping")
+    def ping():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return {}
+
+    api.add_middleware(stats_module.QueryStatsMiddleware)
+
+    response = TestClient(api).get("/ping")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="1 queries"' in response.headers["server-timing"]
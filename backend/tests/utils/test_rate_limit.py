@@ -0,0 +1,127 @@
+import asyncio
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(autouse=True)
+def setup_env(monkeypatch):
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+    monkeypatch.setenv("SECRET_KEY", "secret")
+    monkeypatch.setenv("ALGORITHM", "HS256")
+    monkeypatch.setenv("RATE_LIMIT_CAPACITY", "3")
+    monkeypatch.setenv("RATE_LIMIT_REFILL_PER_SECOND", "1")
+    monkeypatch.setenv("GOOGLE_FANOUT_CAPACITY", "2")
+
+    import app.variable
+
+    importlib.reload(app.variable)
+
+
+@pytest.fixture
+def rate_limit_module():
+    import app.utils.jwt
+    import app.utils.rate_limit as module
+
+    importlib.reload(app.utils.jwt)
+    reloaded = importlib.reload(module)
+    reloaded.TokenBucketLimiter.reset()
+    return reloaded
+
+
+def _token(sub):
+    from app.utils.jwt import create_access_token
+
+    return create_access_token({"sub": sub})
+
+
+def test_local_bucket_refills_over_time(rate_limit_module, monkeypatch):
+    limiter = rate_limit_module.TokenBucketLimiter
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: clock[0])
+
+    async def consume(cost=1):
+        return await limiter.consume("key", cost, 3, 1.0)
+
+    assert asyncio.run(consume(2)) == 0
+    assert asyncio.run(consume(1)) == 0
+    assert asyncio.run(consume(2)) == pytest.approx(2.0)
+
+    clock[0] += 2
+    assert asyncio.run(consume(2)) == 0
+    # 용량보다 큰 비용은 용량으로 제한
+    clock[0] += 10
+    assert asyncio.run(consume(10)) == 0
+
+
+def test_dependency_returns_429_per_user_and_route(rate_limit_module):
+    app = FastAPI()
+
+    @app.post(
+        "/sync",
+        dependencies=[Depends(rate_limit_module.RateLimit("sync", cost=2))],
+    )
+    async def sync():
+        return {"ok": True}
+
+    @app.get("/events", dependencies=[Depends(rate_limit_module.RateLimit("events"))])
+    async def events():
+        return {"ok": True}
+
+    client = TestClient(app)
+    alice = {"Authorization": f"Bearer {_token('alice')}"}
+    bob = {"Authorization": f"Bearer {_token('bob')}"}
+
+    assert client.post("/sync", headers=alice).status_code == 200
+    limited = client.post("/sync", headers=alice)
+
+    assert limited.status_code == 429
+    assert limited.json() == {"detail": "rate_limited"}
+    assert int(limited.headers["Retry-After"]) >= 1
+    assert client.post("/sync", headers=bob).status_code == 200
+    assert client.get("/events", headers=alice).status_code == 200
+
+
+def test_google_fanout_budget_is_per_user(rate_limit_module):
+    async def run():
+        return [
+            await rate_limit_module.acquire_google_fanout("creator") for _ in range(3)
+        ] + [await rate_limit_module.acquire_google_fanout("other")]
+
+    assert asyncio.run(run()) == [True, True, False, True]
+
+
+def test_anonymous_key_ignores_spoofed_forwarded_for(rate_limit_module, monkeypatch):
+    from starlette.requests import Request
+
+    def _request(peer, forwarded=None):
+        headers = []
+        if forwarded is not None:
+            headers.append((b"x-forwarded-for", forwarded.encode()))
+        return Request({"type": "http", "headers": headers, "client": (peer, 1234)})
+
+    identify = rate_limit_module._identify
+
+    # 신뢰하는 프록시가 없으면 헤더를 무시
+    assert identify(_request("203.0.113.9", "1.1.1.1"), None) == "ip:203.0.113.9"
+
+    monkeypatch.setattr(
+        rate_limit_module,
+        "_TRUSTED_PROXY_NETWORKS",
+        [rate_limit_module.ipaddress.ip_network("10.0.0.0/8")],
+    )
+    # 프록시를 거쳐도 클라이언트가 앞에 끼워 넣은 값이 아닌 가장 오른쪽의 외부 주소
+    assert (
+        identify(_request("10.0.0.2", "1.1.1.1, 198.51.100.7, 10.0.0.5"), None)
+        == "ip:198.51.100.7"
+    )
+    # 신뢰하지 않는 곳에서 온 헤더는 여전히 무시
+    assert identify(_request("203.0.113.9", "1.1.1.1"), None) == "ip:203.0.113.9"
+    assert identify(_request("10.0.0.2"), None) == "ip:10.0.0.2"
@@ -0,0 +1,93 @@
+import json
+import sys
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import List
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+
+@pytest.fixture(autouse=True)
+def setup_path():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+class _Slot(BaseModel):
+    date: date
+    participant_ids: List[int]
+
+
+def test_fast_json_response_renders_compact_json():
+    from app.utils.responses import FastJSONResponse
+
+    response = FastJSONResponse({"name": "약속", "ids": [1, 2]})
+
+    assert json.loads(response.body) == {"name": "약속", "ids": [1, 2]}
+
+
+def test_fast_json_response_falls_back_for_big_google_ids():
+    from app.utils.responses import FastJSONResponse
+
+    google_id = 109876543210987654321
+    response = FastJSONResponse({"participant_ids": [google_id]})
+
+    assert json.loads(response.body) == {"participant_ids": [google_id]}
+
+
+def test_model_json_response_serializes_without_revalidation():
+    from app.utils.responses import model_json_response
+
+    slot = _Slot(date=date(2024, 5, 1), participant_ids=["7"])
+    response = model_json_response(slot, headers={"ETag": '"v1"'})
+
+    assert json.loads(response.body) == {
+        "date": "2024-05-01",
+        "participant_ids": [7],
+    }
+    assert response.headers["etag"] == '"v1"'
+    assert response.media_type == "application/json"
+
+
+class _Status(str, Enum):
+    CONFIRMED = "confirmed"
+
+
+class _Event(BaseModel):
+    status: _Status
+    starts_at: datetime
+    synced_at: datetime
+
+
+def test_model_json_response_matches_pydantic_encoding():
+    from app.utils.responses import model_json_response
+
+    event = _Event(
+        status=_Status.CONFIRMED,
+        starts_at=datetime(2024, 5, 1, 9, 30),
+        synced_at=datetime(2024, 5, 1, 9, 30, 0, 123456, timezone(timedelta(hours=9))),
+    )
+
+    response = model_json_response(event, exclude={"synced_at"})
+
+    assert json.loads(response.body) == json.loads(
+        event.model_dump_json(exclude={"synced_at"})
+    )
+    assert json.loads(response.body) == {
+        "status": "confirmed",
+        "starts_at": "2024-05-01T09:30:00",
+    }
+
+
+def test_adapter_json_response_serializes_lists():
+    from app.utils.responses import adapter_json_response
+
+    adapter = TypeAdapter(list[_Slot])
+    slots = adapter.validate_python([{"date": "2024-05-01", "participant_ids": [1]}])
+
+    response = adapter_json_response(adapter, slots)
+
+    assert json.loads(response.body) == [{"date": "2024-05-01", "participant_ids": [1]}]
@@ -0,0 +1,99 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_path():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    from app.utils.single_flight import SingleFlight
+
+    flight = SingleFlight()
+    calls = {"count": 0}
+
+    async def compute():
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return ["slot"]
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do(("a", 1), compute) for _ in range(10)))
+
+    results = asyncio.run(scenario())
+
+    assert calls["count"] == 1
+    assert all(result == ["slot"] for result in results)
+    assert flight.metrics()["coalesced"] == 9
+    assert flight.metrics()["inflight"] == 0
+
+
+def test_results_are_reused_within_ttl_and_keyed_by_version():
+    from app.utils.single_flight import SingleFlight
+
+    flight = SingleFlight(ttl_seconds=60)
+    calls = {"count": 0}
+
+    async def compute():
+        calls["count"] += 1
+        return calls["count"]
+
+    async def scenario():
+        first = await flight.do(("appointment", 1), compute)
+        cached = await flight.do(("appointment", 1), compute)
+        bumped = await flight.do(("appointment", 2), compute)
+        return first, cached, bumped
+
+    assert asyncio.run(scenario()) == (1, 1, 2)
+    assert flight.metrics()["cache_hits"] == 1
+
+
+def test_failures_are_shared_but_not_cached():
+    from app.utils.single_flight import SingleFlight
+
+    flight = SingleFlight(ttl_seconds=60)
+    calls = {"count": 0}
+
+    async def compute():
+        calls["count"] += 1
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    async def scenario():
+        results = await asyncio.gather(
+            flight.do("key", compute), flight.do("key", compute), return_exceptions=True
+        )
+        with pytest.raises(ValueError):
+            await flight.do("key", compute)
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls["count"] == 2
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    from app.utils.single_flight import SingleFlight
+
+    flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.do("key", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == "done"
@@ -0,0 +1,139 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+
+@pytest.fixture(autouse=True)
+def setup_env():
+    root_dir = Path(__file__).resolve().parents[2]
+    if str(root_dir) not in sys.path:
+        sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def tracing(tmp_path):
+    # Tracer는 Engine 클래스에 리스너를 등록하므로 reload 하지 않고 exporter만 바꾼다
+    import app.utils.tracing as module
+
+    path = tmp_path / "spans.jsonl"
+    module.Tracer.configure(module.JsonLinesExporter(str(path)))
+    yield module, path
+    module.Tracer.configure(None)
+
+
+def _read_spans(path):
+    return {
+        item["name"]: item for item in map(json.loads, path.read_text().splitlines())
+    }
+
+
+def test_spans_nest_across_gather(tracing):
+    module, path = tracing
+
+    async def child(name):
+        with module.span(name, index=name):
+            await asyncio.sleep(0)
+
+    async def run():
+        with module.span("parent") as parent:
+            await asyncio.gather(child("a"), child("b"))
+            module.set_attributes(participants=2)
+        assert module.current_span() is None
+        await module.Tracer.flush()
+        return parent
+
+    parent = asyncio.run(run())
+    spans = _read_spans(path)
+
+    assert spans["a"]["parent_id"] == parent.span_id
+    assert spans["b"]["parent_id"] == parent.span_id
+    assert spans["a"]["trace_id"] == spans["b"]["trace_id"] == parent.trace_id
+    assert spans["a"]["attributes"] == {"index": "a"}
+    assert spans["parent"]["attributes"] == {"participants": 2}
+    assert spans["parent"]["parent_id"] is None
+
+
+def test_traced_marks_errors_and_records_db_queries(tracing):
+    module, path = tracing
+    engine = create_engine("sqlite://")
+
+    @module.traced("service.fail")
+    async def fail():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        raise ValueError("boom")
+
+    async def run():
+        with pytest.raises(ValueError):
+            await fail()
+        await module.Tracer.flush()
+
+    asyncio.run(run())
+    spans = _read_spans(path)
+    engine.dispose()
+
+    assert spans["service.fail"]["status"] == "ERROR"
+    assert spans["service.fail"]["attributes"]["error.type"] == "ValueError"
+    assert spans["db.query"]["parent_id"] == spans["service.fail"]["span_id"]
+    assert spans["db.query"]["attributes"] == {"db.statement": "SELECT 1"}
+
+
+def test_middleware_continues_incoming_trace(tracing):
+    module, path = tracing
+    api = FastAPI()
+
+    @api.get("/appointments/{invite_code}")
+    async def detail(invite_code: str):
+        with module.span("handler"):
+            return {}
+
+    api.add_middleware(module.TracingMiddleware)
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    response = TestClient(api).get(
+        "/appointments/ABC",
+        headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"},
+    )
+    asyncio.run(module.Tracer.flush())
+    spans = _read_spans(path)
+    root = spans["HTTP GET /appointments/{invite_code}"]
+
+    assert response.status_code == 200
+    assert root["trace_id"] == trace_id
+    assert root["parent_id"] == "00f067aa0ba902b7"
+    assert root["attributes"]["http.status_code"] == 200
+    assert spans["handler"]["parent_id"] == root["span_id"]
+
+
+def test_otlp_payload_and_disabled_tracer(tracing):
+    module, _ = tracing
+    finished = module.Span(
+        name="google.http",
+        trace_id="a" * 32,
+        span_id="b" * 16,
+        end_ns=2,
+        start_ns=1,
+        attributes={"http.status_code": 503, "retry": True},
+        status="ERROR",
+    )
+
+    payload = module.OTLPHttpExporter(service_name="svc").build_payload([finished])
+    resource_span = payload["resourceSpans"][0]
+    otlp_span = resource_span["scopeSpans"][0]["spans"][0]
+
+    assert resource_span["resource"]["attributes"][0]["value"] == {"stringValue": "svc"}
+    assert otlp_span["status"] == {"code": 2}
+    assert otlp_span["attributes"] == [
+        {"key": "http.status_code", "value": {"intValue": "503"}},
+        {"key": "retry", "value": {"boolValue": True}},
+    ]
+
+    module.Tracer.configure(None)
+    with module.span("ignored") as ignored:
+        assert ignored is None